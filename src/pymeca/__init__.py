@@ -9,13 +9,7 @@ __license__ = "MIT"
 __maintainer__ = "Stefan-Dan Ciocirlan"
 __email__ = "stefan_dan@xn--ciocrlan-o2a.ro"
 
-from . import dao as dao
-from . import pymeca as pymeca
-from . import utils as utils
-from . import host as host
-from . import task as task
-from . import tower as tower
-from . import user as user
+import importlib
 
 __all__ = [
     "dao",
@@ -24,5 +18,33 @@ __all__ = [
     "host",
     "task",
     "tower",
-    "user"
+    "user",
+    "candidates",
+    "fees",
+    "transaction",
+    "cache",
+    "parameters",
+    "events",
+    "graph",
+    "matrix",
+    "records",
+    "snapshot",
+    "compiler",
+    "deployment",
+    "testing",
+    "compat"
 ]
+
+
+def __getattr__(name: str):
+    r"""
+    Import the submodules when they are first used, so import pymeca
+    does not load web3 and the contract ABIs.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
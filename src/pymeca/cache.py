@@ -0,0 +1,205 @@
+import logging
+import threading
+import time
+import copy
+import collections
+import web3
+
+logger = logging.getLogger(__name__)
+
+
+class ReadCache():
+    def __init__(
+        self,
+        max_size: int = 1024,
+        block_check_interval: float = 0
+    ) -> None:
+        r"""
+        Block scoped LRU cache for the contract reads of the
+        active actors. The reads are keyed on (block number, contract
+        address, function, args) and all the entries are evicted when
+        a new block arrives. It can be shared by the actors using the
+        same blockchain.
+
+        By default the block number is read before every read, so
+        the cached reads are never stale. With a block check interval
+        of N seconds, the block number is read at most every N
+        seconds: the reads can then be up to N seconds (plus one
+        block) old, but a cache hit costs no request.
+
+        Example:
+            read_cache = pymeca.cache.ReadCache(max_size=4096)
+            user = pymeca.user.MecaUser(...)
+            user.read_cache = read_cache
+
+        Args:
+            max_size : The maximum number of cached reads
+            block_check_interval : The number of seconds the current
+                block number is reused before being read again
+                (default 0, read for every read)
+        """
+        self.max_size = max_size
+        self.block_check_interval = block_check_interval
+        self.hits: int = 0
+        r"""
+        The number of reads served from the cache
+        """
+        self.misses: int = 0
+        r"""
+        The number of reads made on the blockchain
+        """
+        self.evictions: int = 0
+        r"""
+        The number of entries removed by the size limit
+        """
+        self._entries = collections.OrderedDict()
+        self._block_number = None
+        self._block_checked = None
+        self._lock = threading.Lock()
+
+    def block_number(
+        self,
+        w3: web3.Web3
+    ) -> int:
+        r"""
+        Get the current block number, read again from the blockchain
+        only after the block check interval. The entries of the
+        previous blocks are evicted.
+
+        Args:
+            w3 : web3 instance
+
+        Returns:
+            int : The block number of the cached reads
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._block_checked is not None and
+                now - self._block_checked < self.block_check_interval
+            ):
+                return self._block_number
+        block_number = w3.eth.block_number
+        self.observe_block(block_number)
+        with self._lock:
+            self._block_checked = now
+            return self._block_number
+
+    def observe_block(
+        self,
+        block_number: int
+    ) -> None:
+        r"""
+        Move the cache to a newer block, for example the block of
+        the receipt of a transaction of the actor.
+
+        Args:
+            block_number : The block number
+        """
+        with self._lock:
+            if (
+                self._block_number is None or
+                block_number > self._block_number
+            ):
+                self._entries.clear()
+                self._block_number = block_number
+                self._block_checked = time.monotonic()
+
+    def call(
+        self,
+        w3: web3.Web3,
+        function: web3.contract.contract.ContractFunction
+    ):
+        r"""
+        Make a contract read at the current block or get it
+        from the cache.
+
+        Args:
+            w3 : web3 instance
+            function : The contract function to call
+
+        Returns:
+            The result of the call
+        """
+        block_number = self.block_number(w3)
+        key = (
+            block_number,
+            function.address,
+            function.fn_name,
+            _hashable(function.args),
+            _hashable(function.kwargs)
+        )
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+
+        value = function.call(block_identifier=block_number)
+
+        with self._lock:
+            # the cache moved to a new block during the read
+            if block_number != self._block_number:
+                return value
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        r"""
+        Remove all the cached reads.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._block_checked = None
+
+    def stats(self) -> dict:
+        r"""
+        Get the statistics of the cache.
+
+        Returns:
+            dict : The statistics
+            {
+                "blockNumber"
+                "size"
+                "hits"
+                "misses"
+                "evictions"
+                "hitRate"
+            }
+        """
+        with self._lock:
+            reads = self.hits + self.misses
+            return {
+                "blockNumber": self._block_number,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / reads if reads > 0 else 0.0
+            }
+
+
+def _hashable(value):
+    r"""
+    Transform the arguments of a contract function in a hashable key.
+
+    Args:
+        value : The arguments
+
+    Returns:
+        The hashable arguments
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (key, _hashable(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value
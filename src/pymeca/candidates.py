@@ -0,0 +1,852 @@
+import logging
+import typing
+import asyncio
+import numpy
+import pymeca.fees
+import pymeca.graph
+import pymeca.snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateEngine():
+    def __init__(
+        self,
+        actor,
+        local_tower_fees: bool = False
+    ) -> None:
+        r"""
+        Search the (tower, host) pairs which can run a task.
+        Every fact is fetched once, pinned to the same block
+        number, with batched reads and the hosts and towers are
+        joined in memory using a host -> towers membership index.
+        The number of reads grows linearly with the number of
+        hosts and towers.
+
+        Args:
+            actor : The MecaActiveActor used for the reads
+            local_tower_fees : if True the tower fees are computed
+                with pymeca.fees.tower_fees from the fee type and
+                fee of the towers instead of being read
+        """
+        self.actor = actor
+        self.local_tower_fees = local_tower_fees
+        self.block_number: int = None
+        r"""
+        The block number of all the reads of the last search
+        """
+        self.rpc_requests: int = 0
+        r"""
+        The number of JSON-RPC round trips of the last search
+        """
+        self.rpc_calls: int = 0
+        r"""
+        The number of JSON-RPC calls of the last search
+        """
+        self.host_towers: dict[str, set[str]] = {}
+        r"""
+        The towers of every host from the last search
+        """
+
+    def _batch_call(
+        self,
+        calls: list[tuple[callable, dict]]
+    ) -> list:
+        r"""
+        Make the reads as one batch request at the pinned block.
+
+        Args:
+            calls : list of (getter, kwargs)
+
+        Returns:
+            list : The results in the order of the calls
+        """
+        if len(calls) == 0:
+            return []
+        batch = self.actor.batch(block_identifier=self.block_number)
+        for getter, kwargs in calls:
+            batch.add(getter, **kwargs)
+        results = batch.execute()
+        # the calls are sent one by one without a HTTP provider
+        self.rpc_requests += batch.rpc_requests
+        self.rpc_calls += len(calls)
+        return results
+
+    def stats(self) -> dict:
+        r"""
+        Get the statistics of the last search.
+
+        Returns:
+            dict : The statistics
+            {
+                "blockNumber"
+                "rpcRequests"
+                "rpcCalls"
+            }
+        """
+        return {
+            "blockNumber": self.block_number,
+            "rpcRequests": self.rpc_requests,
+            "rpcCalls": self.rpc_calls
+        }
+
+    def _ecosystem_calls(
+        self,
+        ipfs_sha256: str
+    ) -> list[tuple[callable, dict]]:
+        r"""
+        Get the reads of the ecosystem facts: hosts, towers,
+        task size, task fee and scheduler fee.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : list of (getter, kwargs)
+        """
+        actor = self.actor
+        return [
+            (actor.get_hosts, {}),
+            (actor.get_towers, {}),
+            (actor.get_task_task_size, {"ipfs_sha256": ipfs_sha256}),
+            (actor.get_task_task_fee, {"ipfs_sha256": ipfs_sha256}),
+            (actor.get_scheduler_fee, {})
+        ]
+
+    def _facts_calls(
+        self,
+        ipfs_sha256: str,
+        hosts: list,
+        towers: list,
+        tower_hosts: bool = True
+    ) -> list[tuple[callable, dict]]:
+        r"""
+        Get the reads of the facts of every host (task block timeout,
+        task fee, first available block) and of every tower
+        (current size, hosts).
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+            hosts : The hosts
+            towers : The towers
+            tower_hosts : if False the hosts of the towers are not
+                read because the tower host graph is current
+
+        Returns:
+            list : list of (getter, kwargs)
+        """
+        actor = self.actor
+        calls = []
+        for host in hosts:
+            calls.extend([
+                (
+                    actor.get_host_task_block_timeout,
+                    {
+                        "host_address": host["owner"],
+                        "ipfs_sha256": ipfs_sha256
+                    }
+                ),
+                (
+                    actor.get_host_task_fee,
+                    {
+                        "host_address": host["owner"],
+                        "ipfs_sha256": ipfs_sha256
+                    }
+                ),
+                (
+                    actor.get_host_first_available_block,
+                    {"host_address": host["owner"]}
+                )
+            ])
+        for tower in towers:
+            calls.append((
+                actor.get_tower_current_size,
+                {"tower_address": tower["owner"]}
+            ))
+        if tower_hosts:
+            for tower in towers:
+                calls.append((
+                    actor.get_tower_hosts,
+                    {"tower_address": tower["owner"]}
+                ))
+        return calls
+
+    def _tower_host_graph(
+        self,
+        towers: list,
+        facts: list,
+        tower_hosts: bool
+    ) -> pymeca.graph.TowerHostGraph:
+        r"""
+        Get the tower host graph of the actor, updated with the
+        hosts of the towers if they were read with the facts.
+
+        Args:
+            towers : The towers
+            facts : The results of the _facts_calls reads
+            tower_hosts : if the hosts of the towers were read
+
+        Returns:
+            pymeca.graph.TowerHostGraph : The graph
+        """
+        graph = self.actor.tower_host_graph
+        if tower_hosts:
+            graph.update(
+                block_number=self.block_number,
+                towers=towers,
+                towers_hosts=facts[len(facts) - len(towers):]
+            )
+        return graph
+
+    def _join(
+        self,
+        hosts: list,
+        towers: list,
+        facts: list,
+        task_size: int,
+        graph: pymeca.graph.TowerHostGraph
+    ) -> list[tuple[dict, dict]]:
+        r"""
+        Filter the hosts and towers which can run the task with
+        vectorized masks over a registry snapshot and join them
+        using the host -> towers membership index.
+
+        Args:
+            hosts : The hosts
+            towers : The towers
+            facts : The results of the _facts_calls reads
+            task_size : The size of the task
+            graph : The tower host graph at the pinned block
+
+        Returns:
+            list : list of (tower, host) pairs
+        """
+        snapshot = pymeca.snapshot.RegistrySnapshot(
+            block_number=self.block_number,
+            hosts=hosts,
+            towers=towers
+        )
+        host_facts = facts[:3 * len(hosts)]
+        block_timeouts = pymeca.snapshot.column(host_facts[0::3])
+        host_fees = host_facts[1::3]
+        end_blocks = block_timeouts + pymeca.snapshot.column(
+            host_facts[2::3]
+        )
+        tower_sizes = pymeca.snapshot.column(
+            facts[3 * len(hosts):3 * len(hosts) + len(towers)]
+        )
+
+        # the hosts which have the task and can run it in time
+        host_mask = (block_timeouts > 0) & snapshot.hosts_in_time(end_blocks)
+        # the towers which have the size to run the task
+        tower_mask = snapshot.towers_with_size(tower_sizes, task_size)
+
+        self.host_towers = graph.host_towers
+        pair_mask = (
+            tower_mask[:, None] &
+            host_mask[None, :] &
+            snapshot.tower_membership(self.host_towers)
+        )
+        return [
+            (
+                towers[tower_index],
+                {
+                    "owner": hosts[host_index]["owner"],
+                    "eccPublicKey": hosts[host_index]["eccPublicKey"],
+                    "endBlock": int(end_blocks[host_index]),
+                    "fee": host_fees[host_index],
+                    "blockTimeout": int(block_timeouts[host_index])
+                }
+            )
+            for tower_index, host_index in numpy.argwhere(pair_mask)
+        ]
+
+    def _tower_fee_calls(
+        self,
+        pairs: list[tuple[dict, dict]],
+        task_size: int
+    ) -> tuple[list, list[tuple[callable, dict]]]:
+        r"""
+        Get the reads of the tower fee for every distinct
+        (tower, block timeout) of the pairs.
+
+        Args:
+            pairs : The (tower, host) pairs
+            task_size : The size of the task
+
+        Returns:
+            tuple : (keys, calls) the (tower address, block timeout)
+                keys and the list of (getter, kwargs)
+        """
+        fee_keys = list(dict.fromkeys(
+            (tower["owner"], host["blockTimeout"])
+            for tower, host in pairs
+        ))
+        return (
+            fee_keys,
+            [
+                (
+                    self.actor.get_tower_fee,
+                    {
+                        "tower_address": tower_address,
+                        "size": task_size,
+                        "block_timeout_limit": block_timeout
+                    }
+                )
+                for tower_address, block_timeout in fee_keys
+            ]
+        )
+
+    def _local_tower_fees(
+        self,
+        pairs: list[tuple[dict, dict]],
+        task_size: int
+    ) -> dict:
+        r"""
+        Compute the tower fee for every distinct
+        (tower, block timeout) of the pairs without any read.
+
+        Args:
+            pairs : The (tower, host) pairs
+            task_size : The size of the task
+
+        Returns:
+            dict : The fees by (tower address, block timeout)
+        """
+        towers = {}
+        for tower, host in pairs:
+            towers[(tower["owner"], host["blockTimeout"])] = tower
+        fees = pymeca.fees.tower_fees(
+            fee_types=[tower["feeType"] for tower in towers.values()],
+            fees=[tower["fee"] for tower in towers.values()],
+            sizes=[task_size] * len(towers),
+            block_timeout_limits=[
+                block_timeout for _, block_timeout in towers
+            ]
+        )
+        return {
+            key: int(fee) for key, fee in zip(towers, fees)
+        }
+
+    def _towers_hosts(
+        self,
+        ipfs_sha256: str,
+        pairs: list[tuple[dict, dict]],
+        tower_fees: dict,
+        task_fee: int,
+        scheduler_fee: int
+    ) -> list[pymeca.fees.Quote]:
+        r"""
+        Make the result of the search from the pairs and fees.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+            pairs : The (tower, host) pairs
+            tower_fees : The fees by (tower address, block timeout)
+            task_fee : The task fee
+            scheduler_fee : The scheduler fee
+
+        Returns:
+            list[pymeca.fees.Quote] : The list of (tower, host, fee,
+                endblock) quotes
+        """
+        return [
+            pymeca.fees.Quote(
+                ipfs_sha256=ipfs_sha256,
+                block_number=self.block_number,
+                tower_address=tower["owner"],
+                host_address=host["owner"],
+                end_block=host["endBlock"],
+                fee=pymeca.fees.fee_breakdown(
+                    task_fee=task_fee,
+                    tower_fee=tower_fees[
+                        (tower["owner"], host["blockTimeout"])
+                    ],
+                    host_fee=host["fee"],
+                    scheduler_fee=scheduler_fee
+                )
+            )
+            for tower, host in pairs
+        ]
+
+    def _many_ecosystem_calls(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> list[tuple[callable, dict]]:
+        r"""
+        Get the reads of the ecosystem facts shared by many tasks:
+        hosts, towers and scheduler fee, then the size and fee of
+        every task.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            list : list of (getter, kwargs)
+        """
+        actor = self.actor
+        calls = [
+            (actor.get_hosts, {}),
+            (actor.get_towers, {}),
+            (actor.get_scheduler_fee, {})
+        ]
+        for ipfs_sha256 in ipfs_sha256s:
+            calls.extend([
+                (actor.get_task_task_size, {"ipfs_sha256": ipfs_sha256}),
+                (actor.get_task_task_fee, {"ipfs_sha256": ipfs_sha256})
+            ])
+        return calls
+
+    def _many_facts_calls(
+        self,
+        ipfs_sha256s: list[str],
+        hosts: list,
+        towers: list,
+        tower_hosts: bool = True
+    ) -> list[tuple[callable, dict]]:
+        r"""
+        Get the reads of the facts of many tasks: the first available
+        block of every host once, the task block timeout and fee of
+        every (host, task) pair, and the current size and hosts of
+        every tower once.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+            hosts : The hosts
+            towers : The towers
+            tower_hosts : if False the hosts of the towers are not
+                read because the tower host graph is current
+
+        Returns:
+            list : list of (getter, kwargs)
+        """
+        actor = self.actor
+        calls = [
+            (
+                actor.get_host_first_available_block,
+                {"host_address": host["owner"]}
+            )
+            for host in hosts
+        ]
+        for host in hosts:
+            for ipfs_sha256 in ipfs_sha256s:
+                calls.extend([
+                    (
+                        actor.get_host_task_block_timeout,
+                        {
+                            "host_address": host["owner"],
+                            "ipfs_sha256": ipfs_sha256
+                        }
+                    ),
+                    (
+                        actor.get_host_task_fee,
+                        {
+                            "host_address": host["owner"],
+                            "ipfs_sha256": ipfs_sha256
+                        }
+                    )
+                ])
+        # the tower calls are the same as for one task
+        return calls + self._facts_calls(
+            ipfs_sha256=None,
+            hosts=[],
+            towers=towers,
+            tower_hosts=tower_hosts
+        )
+
+    def _task_facts(
+        self,
+        task_index: int,
+        tasks_number: int,
+        hosts: list,
+        towers: list,
+        facts: list
+    ) -> list:
+        r"""
+        Get the facts of one task from the results of the
+        _many_facts_calls reads, in the layout of _facts_calls.
+
+        Args:
+            task_index : The position of the task
+            tasks_number : The number of tasks
+            hosts : The hosts
+            towers : The towers
+            facts : The results of the _many_facts_calls reads
+
+        Returns:
+            list : The facts of the task
+        """
+        first_available_blocks = facts[:len(hosts)]
+        pair_facts = facts[len(hosts):len(hosts) * (1 + 2 * tasks_number)]
+        task_facts = []
+        for host_index in range(len(hosts)):
+            position = 2 * (host_index * tasks_number + task_index)
+            task_facts.extend([
+                pair_facts[position],
+                pair_facts[position + 1],
+                first_available_blocks[host_index]
+            ])
+        return task_facts + facts[len(hosts) * (1 + 2 * tasks_number):]
+
+    def _many_pairs(
+        self,
+        ipfs_sha256s: list[str],
+        ecosystem: list,
+        facts: list,
+        tower_hosts: bool
+    ) -> list[list[tuple[dict, dict]]]:
+        r"""
+        Join the (tower, host) pairs of every task.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+            ecosystem : The results of the _many_ecosystem_calls reads
+            facts : The results of the _many_facts_calls reads
+            tower_hosts : if the hosts of the towers were read
+
+        Returns:
+            list : The (tower, host) pairs of every task
+        """
+        hosts, towers = ecosystem[0], ecosystem[1]
+        graph = self._tower_host_graph(towers, facts, tower_hosts)
+        return [
+            self._join(
+                hosts,
+                towers,
+                self._task_facts(
+                    index, len(ipfs_sha256s), hosts, towers, facts
+                ),
+                ecosystem[3 + 2 * index],
+                graph
+            )
+            for index in range(len(ipfs_sha256s))
+        ]
+
+    def _many_tower_fee_calls(
+        self,
+        ipfs_sha256s: list[str],
+        ecosystem: list,
+        tasks_pairs: list[list[tuple[dict, dict]]]
+    ) -> tuple[list[list], list[tuple[callable, dict]]]:
+        r"""
+        Get the reads of the tower fees of all the tasks.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+            ecosystem : The results of the _many_ecosystem_calls reads
+            tasks_pairs : The (tower, host) pairs of every task
+
+        Returns:
+            tuple : (keys, calls) the fee keys of every task and
+                the list of (getter, kwargs) of all the tasks
+        """
+        tasks_keys = []
+        calls = []
+        for index, pairs in enumerate(tasks_pairs):
+            fee_keys, fee_calls = self._tower_fee_calls(
+                pairs,
+                ecosystem[3 + 2 * index]
+            )
+            tasks_keys.append(fee_keys)
+            calls.extend(fee_calls)
+        return tasks_keys, calls
+
+    def _many_towers_hosts(
+        self,
+        ipfs_sha256s: list[str],
+        ecosystem: list,
+        tasks_pairs: list[list[tuple[dict, dict]]],
+        tasks_keys: list[list],
+        fees: list[int]
+    ) -> dict[str, list]:
+        r"""
+        Make the results of the search of many tasks.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+            ecosystem : The results of the _many_ecosystem_calls reads
+            tasks_pairs : The (tower, host) pairs of every task
+            tasks_keys : The fee keys of every task, None if the
+                tower fees are computed locally
+            fees : The results of the _many_tower_fee_calls reads
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        towers_hosts = {}
+        position = 0
+        for index, ipfs_sha256 in enumerate(ipfs_sha256s):
+            task_size = ecosystem[3 + 2 * index]
+            if tasks_keys is None:
+                tower_fees = self._local_tower_fees(
+                    tasks_pairs[index],
+                    task_size
+                )
+            else:
+                fee_keys = tasks_keys[index]
+                tower_fees = dict(zip(
+                    fee_keys,
+                    fees[position:position + len(fee_keys)]
+                ))
+                position += len(fee_keys)
+            towers_hosts[ipfs_sha256] = self._towers_hosts(
+                ipfs_sha256,
+                tasks_pairs[index],
+                tower_fees,
+                ecosystem[4 + 2 * index],
+                ecosystem[2]
+            )
+        return towers_hosts
+
+    def _search_steps(
+        self,
+        ipfs_sha256: str
+    ) -> typing.Generator:
+        r"""
+        The steps of the search of one task. Every step yields
+        a list of reads and gets back their results.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : The list of (tower, host, fee, endblock) pairs
+        """
+        hosts, towers, task_size, task_fee, scheduler_fee = (
+            yield self._ecosystem_calls(ipfs_sha256)
+        )
+        # the hosts of the towers are not read again if the graph
+        # of the actor is at the same block
+        tower_hosts = not self.actor.tower_host_graph.is_current(
+            self.block_number,
+            towers
+        )
+        facts = yield self._facts_calls(
+            ipfs_sha256, hosts, towers, tower_hosts
+        )
+        graph = self._tower_host_graph(towers, facts, tower_hosts)
+        pairs = self._join(hosts, towers, facts, task_size, graph)
+        if self.local_tower_fees:
+            tower_fees = self._local_tower_fees(pairs, task_size)
+        else:
+            fee_keys, fee_calls = self._tower_fee_calls(pairs, task_size)
+            tower_fees = dict(zip(fee_keys, (yield fee_calls)))
+
+        towers_hosts = self._towers_hosts(
+            ipfs_sha256, pairs, tower_fees, task_fee, scheduler_fee
+        )
+        logger.debug(
+            f"Candidate search for {ipfs_sha256}: {self.stats()}"
+        )
+        return towers_hosts
+
+    def _search_many_steps(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> typing.Generator:
+        r"""
+        The steps of the search of many tasks. Every step yields
+        a list of reads and gets back their results.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        ipfs_sha256s = list(dict.fromkeys(ipfs_sha256s))
+        ecosystem = yield self._many_ecosystem_calls(ipfs_sha256s)
+        hosts, towers = ecosystem[0], ecosystem[1]
+        tower_hosts = not self.actor.tower_host_graph.is_current(
+            self.block_number,
+            towers
+        )
+        facts = yield self._many_facts_calls(
+            ipfs_sha256s, hosts, towers, tower_hosts
+        )
+        tasks_pairs = self._many_pairs(
+            ipfs_sha256s, ecosystem, facts, tower_hosts
+        )
+        if self.local_tower_fees:
+            tasks_keys, fees = None, []
+        else:
+            tasks_keys, fee_calls = self._many_tower_fee_calls(
+                ipfs_sha256s, ecosystem, tasks_pairs
+            )
+            fees = yield fee_calls
+
+        towers_hosts = self._many_towers_hosts(
+            ipfs_sha256s, ecosystem, tasks_pairs, tasks_keys, fees
+        )
+        logger.debug(
+            f"Candidate search for {len(ipfs_sha256s)} tasks: {self.stats()}"
+        )
+        return towers_hosts
+
+    def _start(
+        self,
+        block_number: int
+    ) -> None:
+        r"""
+        Start a search pinned to a block number. The block number
+        read is counted in the statistics.
+
+        Args:
+            block_number : The block number of all the reads
+        """
+        self.rpc_requests = 1
+        self.rpc_calls = 1
+        self.block_number = block_number
+
+    def _run(
+        self,
+        steps: typing.Generator
+    ):
+        r"""
+        Run the steps of a search with batch requests.
+
+        Args:
+            steps : The generator of the search
+
+        Returns:
+            The result of the search
+        """
+        try:
+            calls = next(steps)
+            while True:
+                calls = steps.send(self._batch_call(calls))
+        except StopIteration as e:
+            return e.value
+
+    def search(
+        self,
+        ipfs_sha256: str
+    ) -> list:
+        r"""
+        Get the (tower, host) pairs with their fees and the block number
+        when the results will be available for a given task.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : The list of (tower, host, fee, endblock) pairs
+        """
+        self._start(self.actor.w3.eth.block_number)
+        return self._run(self._search_steps(ipfs_sha256))
+
+    def search_many(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> dict[str, list]:
+        r"""
+        Get the (tower, host) pairs of many tasks. The hosts, towers,
+        tower hosts, tower sizes, host first available blocks and the
+        scheduler fee are read once for all the tasks, with the same
+        number of batch requests as for one task.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        self._start(self.actor.w3.eth.block_number)
+        return self._run(self._search_many_steps(ipfs_sha256s))
+
+
+class AsyncCandidateEngine(CandidateEngine):
+    def __init__(
+        self,
+        actor,
+        local_tower_fees: bool = False
+    ) -> None:
+        r"""
+        The asyncio version of the CandidateEngine. The reads of
+        every step are made concurrently with asyncio.gather and
+        pinned to the same block number.
+
+        Args:
+            actor : The AsyncMecaActiveActor used for the reads
+            local_tower_fees : if True the tower fees are computed
+                without any read
+        """
+        super().__init__(actor=actor, local_tower_fees=local_tower_fees)
+
+    async def _gather_calls(
+        self,
+        calls: list[tuple[callable, dict]]
+    ) -> list:
+        r"""
+        Make the reads concurrently at the pinned block.
+
+        Args:
+            calls : list of (getter, kwargs)
+
+        Returns:
+            list : The results in the order of the calls
+        """
+        self.rpc_requests += len(calls)
+        self.rpc_calls += len(calls)
+        with self.actor.at_block(self.block_number):
+            return list(await asyncio.gather(*[
+                getter(**kwargs) for getter, kwargs in calls
+            ]))
+
+    async def _run(
+        self,
+        steps: typing.Generator
+    ):
+        r"""
+        Run the steps of a search with concurrent reads.
+
+        Args:
+            steps : The generator of the search
+
+        Returns:
+            The result of the search
+        """
+        try:
+            calls = next(steps)
+            while True:
+                calls = steps.send(await self._gather_calls(calls))
+        except StopIteration as e:
+            return e.value
+
+    async def search(
+        self,
+        ipfs_sha256: str
+    ) -> list:
+        r"""
+        Get the (tower, host) pairs with their fees and the block number
+        when the results will be available for a given task.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : The list of (tower, host, fee, endblock) pairs
+        """
+        self._start(await self.actor.w3.eth.block_number)
+        return await self._run(self._search_steps(ipfs_sha256))
+
+    async def search_many(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> dict[str, list]:
+        r"""
+        Get the (tower, host) pairs of many tasks. The shared facts
+        are read once for all the tasks.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        self._start(await self.actor.w3.eth.block_number)
+        return await self._run(self._search_many_steps(ipfs_sha256s))
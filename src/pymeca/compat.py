@@ -0,0 +1,114 @@
+import json
+import itertools
+import typing
+import web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.encoding import Web3JsonEncoder
+from web3._utils.method_formatters import receipt_formatter
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+
+# The web3 internals used by pymeca. They are not part of the public
+# web3 API, so web3 is pinned to the 6.x versions (>=6.15.1,<7) and
+# every use of them is kept in this module.
+
+
+def encode_transaction_data(
+    function: web3.contract.contract.ContractFunction
+) -> str:
+    r"""
+    Get the call data of a contract function with the
+    arguments set.
+
+    Args:
+        function : contract function with the arguments set
+
+    Returns:
+        str : The hex encoded call data
+    """
+    return function._encode_transaction_data()
+
+
+def decode_function_output(
+    w3: web3.Web3,
+    function: web3.contract.contract.ContractFunction,
+    return_data: bytes
+) -> tuple:
+    r"""
+    Decode and normalize the output of a contract function in the
+    same way as ContractFunction.call does.
+
+    Args:
+        w3 : web3 instance
+        function : contract function which was called
+        return_data : the raw eth_call result
+
+    Returns:
+        tuple : The normalized outputs
+    """
+    output_types = get_abi_output_types(function.abi)
+    output_data = w3.codec.decode(output_types, return_data)
+    return map_abi_data(
+        itertools.chain(
+            BASE_RETURN_NORMALIZERS,
+            function._return_data_normalizers
+        ),
+        output_types,
+        output_data
+    )
+
+
+def dumps_json(
+    data: typing.Any
+) -> str:
+    r"""
+    Serialize JSON-RPC data which contains web3 types
+    (HexBytes, AttributeDict).
+
+    Args:
+        data : The JSON-RPC data
+
+    Returns:
+        str : The JSON string
+    """
+    return json.dumps(data, cls=Web3JsonEncoder)
+
+
+def format_receipt(
+    result: dict
+) -> dict:
+    r"""
+    Format a raw eth_getTransactionReceipt result like
+    w3.eth.get_transaction_receipt does.
+
+    Args:
+        result : The JSON-RPC result
+
+    Returns:
+        dict : The formatted receipt
+    """
+    return receipt_formatter(result)
+
+
+def post_batch_request(
+    provider: web3.HTTPProvider,
+    data: bytes
+) -> bytes:
+    r"""
+    Post a JSON-RPC batch request with the session and request
+    arguments of the HTTP provider. web3 6.x has no batch request
+    API, so the batch does not pass through the middlewares of
+    the web3 instance.
+
+    Args:
+        provider : The HTTP provider
+        data : The JSON encoded batch request
+
+    Returns:
+        bytes : The raw response
+    """
+    return make_post_request(
+        provider.endpoint_uri,
+        data,
+        **provider.get_request_kwargs()
+    )
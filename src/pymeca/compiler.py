@@ -0,0 +1,390 @@
+import os
+import re
+import json
+import pathlib
+import hashlib
+import logging
+import tempfile
+import pymeca.utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = pathlib.Path(
+    os.environ.get(
+        "PYMECA_COMPILE_CACHE",
+        pathlib.Path.home() / ".cache" / "pymeca" / "solc"
+    )
+)
+r"""
+The default directory of the compile cache, set by the
+PYMECA_COMPILE_CACHE environment variable
+"""
+
+_IMPORT_PATTERN = re.compile(
+    r"""import\s+(?:[^'";]*?\s+from\s+)?["']([^"']+)["']"""
+)
+
+
+def source_tree(
+    contract_file_path: str,
+    base_path: str = None
+) -> list[pathlib.Path]:
+    r"""
+    Get the source files of a contract: the contract file and all
+    the files it imports, recursively. The relative imports are
+    resolved from the importing file and the other ones from the
+    base path. The imports which are not files are skipped, solc
+    reports them.
+
+    Args:
+        contract_file_path : path to the contract file
+        base_path : The base path of the imports (default the
+            directory of the contract file)
+
+    Returns:
+        list[pathlib.Path] : The source files, contract file first
+    """
+    contract_file_path = pathlib.Path(contract_file_path).resolve()
+    if base_path is None:
+        base_path = contract_file_path.parent
+    base_path = pathlib.Path(base_path).resolve()
+
+    files = [contract_file_path]
+    seen = set(files)
+    position = 0
+    while position < len(files):
+        file_path = files[position]
+        position += 1
+        for import_path in _IMPORT_PATTERN.findall(file_path.read_text()):
+            if import_path.startswith("."):
+                imported = (file_path.parent / import_path).resolve()
+            else:
+                imported = (base_path / import_path).resolve()
+            if imported in seen or not imported.is_file():
+                continue
+            seen.add(imported)
+            files.append(imported)
+    return files
+
+
+def compile_key(
+    contract_file_path: str,
+    solc_version: str,
+    evm_version: str,
+    output_values: list[str],
+    optimize: bool = True,
+    base_path: str = None
+) -> str:
+    r"""
+    Get the content hash of a compilation: the source tree,
+    the solc version and the compile options.
+
+    Args:
+        contract_file_path : path to the contract file
+        solc_version : The solc version
+        evm_version : evm version
+        output_values : The output values of the compilation
+        optimize : if the optimizer is enabled
+        base_path : The base path of the imports (default the
+            directory of the contract file)
+
+    Returns:
+        str : The sha256 hex digest
+    """
+    contract_file_path = pathlib.Path(contract_file_path).resolve()
+    if base_path is None:
+        base_path = contract_file_path.parent
+    base_path = pathlib.Path(base_path).resolve()
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "solcVersion": str(solc_version),
+        "evmVersion": evm_version,
+        "outputValues": sorted(output_values),
+        "optimize": optimize
+    }, sort_keys=True).encode("utf-8"))
+    for file_path in source_tree(contract_file_path, base_path):
+        # the imports are resolved from the base path, so the
+        # paths are part of the source tree
+        if file_path == contract_file_path:
+            name = "<stdin>"
+        elif file_path.is_relative_to(base_path):
+            name = file_path.relative_to(base_path).as_posix()
+        else:
+            name = file_path.as_posix()
+        content = file_path.read_bytes()
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(len(content).to_bytes(8, "big") + content)
+    return digest.hexdigest()
+
+
+class CompileCache():
+    def __init__(
+        self,
+        directory: str = None
+    ) -> None:
+        r"""
+        On-disk cache of the solc outputs keyed by compile_key.
+        Every entry is a JSON file written atomically, so the
+        cache can be shared by concurrent processes.
+
+        Args:
+            directory : The cache directory (default
+                DEFAULT_CACHE_DIRECTORY)
+        """
+        if directory is None:
+            directory = DEFAULT_CACHE_DIRECTORY
+        self.directory = pathlib.Path(directory)
+        self.hits: int = 0
+        r"""
+        The number of compilations read from the cache
+        """
+        self.misses: int = 0
+        r"""
+        The number of compilations not found in the cache
+        """
+
+    def _path(
+        self,
+        key: str
+    ) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def get(
+        self,
+        key: str
+    ) -> dict:
+        r"""
+        Get a compilation output.
+
+        Args:
+            key : The compile key
+
+        Returns:
+            dict : The solc output, None if it is not in the cache
+        """
+        try:
+            with open(self._path(key), "r") as f:
+                output = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return output
+
+    def put(
+        self,
+        key: str,
+        output: dict
+    ) -> None:
+        r"""
+        Store a compilation output.
+
+        Args:
+            key : The compile key
+            output : The solc output
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False
+            ) as f:
+                json.dump(output, f)
+            os.replace(f.name, self._path(key))
+        except OSError as e:
+            # the cache is only an optimization
+            logger.warning(f"Could not write the compile cache: {e}")
+
+
+def compile_source_file(
+    contract_file_path: str,
+    output_values: list[str],
+    evm_version: str,
+    cache: CompileCache = None
+) -> dict:
+    r"""
+    Compile a contract file with solcx.compile_source, reading the
+    output from the compile cache if the source tree, the solc
+    version and the options did not change.
+
+    Args:
+        contract_file_path : path to the contract file
+        output_values : The output values of the compilation
+        evm_version : evm version
+        cache : The compile cache (default no cache)
+
+    Returns:
+        dict : The solc output by contract name
+    """
+    # solcx is only needed to compile the contracts
+    import solcx
+
+    contract_file_path = pathlib.Path(contract_file_path).resolve()
+    contracts_path = contract_file_path.parent
+
+    key = None
+    if cache is not None:
+        key = compile_key(
+            contract_file_path=contract_file_path,
+            solc_version=solcx.get_solc_version(),
+            evm_version=evm_version,
+            output_values=output_values,
+            optimize=True,
+            base_path=contracts_path
+        )
+        output = cache.get(key)
+        if output is not None:
+            logger.info(f"Compile cache hit for {contract_file_path}")
+            return output
+
+    output = solcx.compile_source(
+        contract_file_path.read_text(),
+        base_path=contracts_path,
+        output_values=output_values,
+        evm_version=evm_version,
+        optimize=True
+    )
+
+    if cache is not None:
+        cache.put(key, output)
+    return output
+
+
+_OUTPUT_SELECTION = {
+    "abi": "abi",
+    "bin": "evm.bytecode.object",
+    "bin-runtime": "evm.deployedBytecode.object"
+}
+
+
+def _standard_json_input(
+    contracts: list[tuple[pathlib.Path, str]],
+    base_path: pathlib.Path,
+    output_values: list[str],
+    evm_version: str
+) -> dict:
+    r"""
+    Get the solc standard JSON input compiling many contracts
+    with the optimizer.
+
+    Args:
+        contracts : The (contract file path, contract name) pairs
+        base_path : The base path of the sources
+        output_values : The output values ("abi", "bin" and/or
+            "bin-runtime")
+        evm_version : evm version
+
+    Returns:
+        dict : The standard JSON input
+    """
+    sources = {}
+    output_selection = {}
+    for contract_file_path, contract_name in contracts:
+        source_name = contract_file_path.relative_to(base_path).as_posix()
+        sources[source_name] = {"content": contract_file_path.read_text()}
+        output_selection.setdefault(source_name, {})[contract_name] = [
+            _OUTPUT_SELECTION[output_value] for output_value in output_values
+        ]
+    return {
+        "language": "Solidity",
+        "sources": sources,
+        "settings": {
+            "optimizer": {"enabled": True, "runs": 200},
+            "evmVersion": evm_version,
+            "outputSelection": output_selection
+        }
+    }
+
+
+def compile_contracts(
+    contracts: list[tuple[str, str]],
+    output_values: list[str] = ["abi", "bin"],
+    evm_version: str = "shanghai",
+    cache: CompileCache = None
+) -> list[tuple[list, str]]:
+    r"""
+    Compile many contracts in one solc standard JSON compilation,
+    so the solc start and the shared imports are paid once. The
+    imports are resolved from the common directory of the contract
+    files.
+
+    Args:
+        contracts : The (contract file path, contract name) pairs
+        output_values : The output values ("abi", "bin" and/or
+            "bin-runtime")
+        evm_version : evm version
+        cache : The compile cache (default no cache)
+
+    Returns:
+        list[tuple[list, str]] : The (abi, bytecode) of every contract
+            in the order of the contracts, "" if not in output_values.
+            With "bin-runtime" the tuples are (abi, bytecode, runtime
+            bytecode).
+    """
+    # solcx is only needed to compile the contracts
+    import solcx
+
+    contracts = [
+        (pathlib.Path(contract_file_path).resolve(), contract_name)
+        for contract_file_path, contract_name in contracts
+    ]
+    base_path = pathlib.Path(os.path.commonpath([
+        contract_file_path.parent for contract_file_path, _ in contracts
+    ]))
+
+    key = None
+    if cache is not None:
+        solc_version = solcx.get_solc_version()
+        digest = hashlib.sha256()
+        for contract_file_path, contract_name in contracts:
+            digest.update(contract_name.encode("utf-8") + b"\0")
+            digest.update(compile_key(
+                contract_file_path=contract_file_path,
+                solc_version=solc_version,
+                evm_version=evm_version,
+                output_values=output_values,
+                optimize=True,
+                base_path=base_path
+            ).encode("utf-8"))
+        key = digest.hexdigest()
+        output = cache.get(key)
+        if output is not None:
+            logger.info(f"Compile cache hit for {len(contracts)} contracts")
+            return [tuple(compiled) for compiled in output]
+
+    logger.info(f"Compiling {len(contracts)} contracts at {base_path}")
+    solc_output = solcx.compile_standard(
+        _standard_json_input(contracts, base_path, output_values, evm_version),
+        base_path=base_path,
+        allow_paths=[base_path]
+    )
+    output = []
+    for contract_file_path, contract_name in contracts:
+        source_name = contract_file_path.relative_to(base_path).as_posix()
+        compiled = solc_output.get("contracts", {}).get(
+            source_name, {}
+        ).get(contract_name)
+        if compiled is None:
+            raise pymeca.utils.MecaError(
+                f"Contract {contract_name} not found in the compiled contracts"
+            )
+        compile_info = [
+            compiled["abi"] if "abi" in output_values else "",
+            (
+                compiled["evm"]["bytecode"]["object"]
+                if "bin" in output_values
+                else ""
+            )
+        ]
+        if "bin-runtime" in output_values:
+            compile_info.append(
+                compiled["evm"]["deployedBytecode"]["object"]
+            )
+        output.append(tuple(compile_info))
+
+    if cache is not None:
+        cache.put(key, output)
+    return output
@@ -2,6 +2,8 @@ import pathlib
 import logging
 import web3
 import pymeca.utils
+import pymeca.transaction
+import pymeca.deployment
 import pymeca.pymeca
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,31 @@ def get_DAO_ADDRESS():
         return "0x" + "0" * 40
 
 
+def contracts_changed(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    contract_address: str,
+    tx_receipt: web3.datastructures.AttributeDict
+) -> bool:
+    r"""
+    Transform the receipt of a transaction which changes the
+    contracts of the ecosystem. The actors which use the DAO or
+    scheduler contract have to resolve again the contracts.
+
+    Args:
+        w3 : web3 instance (sync or async)
+        contract_address : The DAO or scheduler contract address
+        tx_receipt : The transaction receipt
+
+    Returns:
+        bool : success status
+    """
+    pymeca.pymeca.invalidate_contracts_cache(
+        w3=w3,
+        contract_address=contract_address
+    )
+    return tx_receipt.status == 1
+
+
 class MecaDAOOwner(pymeca.pymeca.MecaActor):
     def __init__(
         self,
@@ -70,6 +97,118 @@ class MecaDAOOwner(pymeca.pymeca.MecaActor):
         ).call()
 
     def set_scheduler(
+        self,
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
+        r"""
+        Set scheduler to the dao
+
+        Args:
+            contract_address : address of the scheduler contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.setSchedulerContract(
+            newSchedulerContract=contract_address
+        )
+
+        return self._transact(
+            function=function,
+            wait=wait,
+            transform=lambda tx_receipt: contracts_changed(
+                w3=self.w3,
+                contract_address=self.contract.address,
+                tx_receipt=tx_receipt
+            )
+        )
+
+
+class AsyncMecaContractOwner(pymeca.pymeca.AsyncMecaActor):
+    r"""
+    Base of the async contract owners. The owner of the contract
+    is verified when the actor is created with the create coroutine.
+
+    Example:
+        dao_owner = await AsyncMecaDAOOwner.create(
+            w3=w3,
+            private_key=private_key,
+            contract_address=dao_contract_address
+        )
+    """
+    @classmethod
+    async def create(
+        cls,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> "AsyncMecaContractOwner":
+        r"""
+        Create the contract owner and verify if the account
+        is the owner of the contract.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : contract address
+
+        Returns:
+            AsyncMecaContractOwner : The contract owner
+        """
+        contract_owner = cls(
+            w3=w3,
+            private_key=private_key,
+            contract_address=contract_address
+        )
+        # verify if the account is the owner
+        owner = await contract_owner.contract.functions.owner().call()
+        if contract_owner.account.address != owner:
+            raise pymeca.utils.MecaError(
+                "The account is not the owner of the contract"
+            )
+        return contract_owner
+
+
+class AsyncMecaDAOOwner(AsyncMecaContractOwner):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> None:
+        r"""
+        Initialize the MecaDAO owner with an async web3 instance.
+        Use the create coroutine to verify the owner.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : dao contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key
+        )
+        # get the contract abi
+        self.contract = self.w3.eth.contract(
+            address=contract_address,
+            abi=pymeca.utils.MECA_DAO_ABI
+        )
+
+    async def get_scheduler_address(self) -> str:
+        r"""
+        Get the scheduler address.
+
+        Returns:
+            str : scheduler contract address
+        """
+        return await self.contract.functions.getSchedulerContract(
+        ).call()
+
+    async def set_scheduler(
         self,
         contract_address: str
     ) -> bool:
@@ -82,20 +221,18 @@ class MecaDAOOwner(pymeca.pymeca.MecaActor):
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.setSchedulerContract(
-                newSchedulerContract=contract_address
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerContract(
+            newSchedulerContract=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return await self._transact(
+            function=function,
+            transform=lambda tx_receipt: contracts_changed(
+                w3=self.w3,
+                contract_address=self.contract.address,
+                tx_receipt=tx_receipt
+            )
+        )
 
 
 class MecaSchedulerOwner(pymeca.pymeca.MecaActor):
@@ -129,25 +266,26 @@ class MecaSchedulerOwner(pymeca.pymeca.MecaActor):
                 "The account is not the owner of the contract"
             )
 
-    def clear(self) -> bool:
+    def clear(
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Clear the scheduler
 
+        Args:
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.clear().build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
-        )
-
-        tx_receipt = self._execute_transaction(transaction)
+        function = self.contract.functions.clear()
 
-        return tx_receipt.status == 1
+        return self._transact(
+            function=function,
+            wait=wait
+        )
 
     def get_flag(self) -> bool:
         r"""
@@ -161,43 +299,43 @@ class MecaSchedulerOwner(pymeca.pymeca.MecaActor):
 
     def set_flag(
         self,
-        flag: bool
-    ) -> bool:
+        flag: bool,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set the scheduler flag
 
         Args:
             flag : scheduler flag
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.setSchedulerFlag(
-                newSchedulerFlag=flag
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerFlag(
+            newSchedulerFlag=flag
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return self._transact(
+            function=function,
+            wait=wait
+        )
 
     def _set_contract(
         self,
         contract_address: str,
-        contract_type: int
-    ) -> bool:
+        contract_type: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a contract on the scheduler.
 
         Args:
             contract_address : address of the contract
             contract_type : type of the contract (0: host, 1: tower, 2: task)
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
@@ -212,73 +350,84 @@ class MecaSchedulerOwner(pymeca.pymeca.MecaActor):
                 f"Invalid contract type {contract_type}"
             )
 
-        transaction = (
-            contract_functions[contract_type](
-                newAddress=contract_address
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = contract_functions[contract_type](
+            newAddress=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return self._transact(
+            function=function,
+            wait=wait,
+            transform=lambda tx_receipt: contracts_changed(
+                w3=self.w3,
+                contract_address=self.contract.address,
+                tx_receipt=tx_receipt
+            )
+        )
 
     def set_host_contract(
         self,
-        contract_address: str
-    ) -> bool:
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a new host contract for the scheduler
 
         Args:
             contract_address : address of the host contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
         return self._set_contract(
             contract_address=contract_address,
-            contract_type=0
+            contract_type=0,
+            wait=wait
         )
 
     def set_tower_contract(
         self,
-        contract_address: str
-    ) -> bool:
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a new tower contract for the scheduler
 
         Args:
             contract_address : address of the tower contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
         return self._set_contract(
             contract_address=contract_address,
-            contract_type=1
+            contract_type=1,
+            wait=wait
         )
 
     def set_task_contract(
         self,
-        contract_address: str
-    ) -> bool:
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a new task contract for the scheduler
 
         Args:
             contract_address : address of the task contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
         return self._set_contract(
             contract_address=contract_address,
-            contract_type=2
+            contract_type=2,
+            wait=wait
         )
 
     def _get_contract_address(
@@ -334,6 +483,222 @@ class MecaSchedulerOwner(pymeca.pymeca.MecaActor):
         return self._get_contract_address(2)
 
 
+class AsyncMecaSchedulerOwner(AsyncMecaContractOwner):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> None:
+        r"""
+        Initialize the MecaScheduler owner with an async web3 instance.
+        Use the create coroutine to verify the owner.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : scheduler contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key
+        )
+
+        # get the contract abi
+        self.contract = self.w3.eth.contract(
+            address=contract_address,
+            abi=pymeca.utils.MECA_SCHEDULER_ABI
+        )
+
+    async def clear(self) -> bool:
+        r"""
+        Clear the scheduler
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
+
+        return await self._transact(
+            function=function
+        )
+
+    async def get_flag(self) -> bool:
+        r"""
+        Get the scheduler flag
+
+        Returns:
+            bool : scheduler flag
+        """
+        return await self.contract.functions.schedulerFlag(
+        ).call()
+
+    async def set_flag(
+        self,
+        flag: bool
+    ) -> bool:
+        r"""
+        Set the scheduler flag
+
+        Args:
+            flag : scheduler flag
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.setSchedulerFlag(
+            newSchedulerFlag=flag
+        )
+
+        return await self._transact(
+            function=function
+        )
+
+    async def _set_contract(
+        self,
+        contract_address: str,
+        contract_type: int
+    ) -> bool:
+        r"""
+        Set a contract on the scheduler.
+
+        Args:
+            contract_address : address of the contract
+            contract_type : type of the contract (0: host, 1: tower, 2: task)
+
+        Returns:
+            bool : success status
+        """
+        contract_functions = {
+            0: self.contract.functions.setHostContract,
+            1: self.contract.functions.setTowerContract,
+            2: self.contract.functions.setTaskContract
+        }
+        if contract_type not in contract_functions:
+            raise pymeca.utils.MecaError(
+                f"Invalid contract type {contract_type}"
+            )
+
+        function = contract_functions[contract_type](
+            newAddress=contract_address
+        )
+
+        return await self._transact(
+            function=function,
+            transform=lambda tx_receipt: contracts_changed(
+                w3=self.w3,
+                contract_address=self.contract.address,
+                tx_receipt=tx_receipt
+            )
+        )
+
+    async def set_host_contract(
+        self,
+        contract_address: str
+    ) -> bool:
+        r"""
+        Set a new host contract for the scheduler
+
+        Args:
+            contract_address : address of the host contract
+
+        Returns:
+            bool : success status
+        """
+        return await self._set_contract(
+            contract_address=contract_address,
+            contract_type=0
+        )
+
+    async def set_tower_contract(
+        self,
+        contract_address: str
+    ) -> bool:
+        r"""
+        Set a new tower contract for the scheduler
+
+        Args:
+            contract_address : address of the tower contract
+
+        Returns:
+            bool : success status
+        """
+        return await self._set_contract(
+            contract_address=contract_address,
+            contract_type=1
+        )
+
+    async def set_task_contract(
+        self,
+        contract_address: str
+    ) -> bool:
+        r"""
+        Set a new task contract for the scheduler
+
+        Args:
+            contract_address : address of the task contract
+
+        Returns:
+            bool : success status
+        """
+        return await self._set_contract(
+            contract_address=contract_address,
+            contract_type=2
+        )
+
+    async def _get_contract_address(
+        self,
+        contract_type: int
+    ) -> str:
+        r"""
+        Get the contract address of one of the contracts
+        from the scheduler.
+
+        Args:
+            contract_type : type of the contract (0: host, 1: tower, 2: task)
+
+        Returns:
+            str : contract address
+        """
+        contract_functions = {
+            0: self.contract.functions.getHostContract,
+            1: self.contract.functions.getTowerContract,
+            2: self.contract.functions.getTaskContract
+        }
+        if contract_type not in contract_functions:
+            raise pymeca.utils.MecaError(
+                f"Invalid contract type {contract_type}"
+            )
+        return await contract_functions[contract_type]().call()
+
+    async def get_host_contract_address(self) -> str:
+        r"""
+        Get the host contract address
+
+        Returns:
+            str : host contract address
+        """
+        return await self._get_contract_address(0)
+
+    async def get_tower_contract_address(self) -> str:
+        r"""
+        Get the tower contract address
+
+        Returns:
+            str : tower contract address
+        """
+        return await self._get_contract_address(1)
+
+    async def get_task_contract_address(self) -> str:
+        r"""
+        Get the task contract address
+
+        Returns:
+            str : task contract address
+        """
+        return await self._get_contract_address(2)
+
+
 class MecaTowerContractOwner(pymeca.pymeca.MecaActor):
     def __init__(
         self,
@@ -377,51 +742,121 @@ class MecaTowerContractOwner(pymeca.pymeca.MecaActor):
 
     def set_scheduler(
         self,
-        contract_address: str
-    ) -> bool:
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a new scheduler contract for the tower.
 
         Args:
             contract_address : address of the scheduler contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.setSchedulerContractAddress(
-                newSchedulerContractAddress=contract_address
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerContractAddress(
+            newSchedulerContractAddress=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return self._transact(
+            function=function,
+            wait=wait
+        )
 
-    def clear(self) -> bool:
+    def clear(
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Clear the tower contract
 
+        Args:
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
+
+        return self._transact(
+            function=function,
+            wait=wait
+        )
+
+
+class AsyncMecaTowerContractOwner(AsyncMecaContractOwner):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> None:
+        r"""
+        Initialize the MecaTowerContract owner with an async web3 instance.
+        Use the create coroutine to verify the owner.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : tower contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key
+        )
+
+        # get the contract abi
+        self.contract = self.w3.eth.contract(
+            address=contract_address,
+            abi=pymeca.utils.MECA_TOWER_ABI
+        )
+
+    async def get_scheduler_address(self) -> str:
+        r"""
+        Get the scheduler address
+
+        Returns:
+            str : scheduler contract address
+        """
+        return await self.contract.functions.schedulerContractAddress(
+        ).call()
+
+    async def set_scheduler(
+        self,
+        contract_address: str
+    ) -> bool:
+        r"""
+        Set a new scheduler contract for the tower.
+
+        Args:
+            contract_address : address of the scheduler contract
+
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.clear().build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerContractAddress(
+            newSchedulerContractAddress=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
+        return await self._transact(
+            function=function
+        )
+
+    async def clear(self) -> bool:
+        r"""
+        Clear the tower contract
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
 
-        return tx_receipt.status == 1
+        return await self._transact(
+            function=function
+        )
 
 
 class MecaHostContractOwner(pymeca.pymeca.MecaActor):
@@ -467,51 +902,121 @@ class MecaHostContractOwner(pymeca.pymeca.MecaActor):
 
     def set_scheduler(
         self,
-        contract_address: str
-    ) -> bool:
+        contract_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Set a new scheduler contract for the host.
 
         Args:
             contract_address : address of the scheduler contract
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.setSchedulerContractAddress(
-                newSchedulerContractAddress=contract_address
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerContractAddress(
+            newSchedulerContractAddress=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return self._transact(
+            function=function,
+            wait=wait
+        )
 
-    def clear(self) -> bool:
+    def clear(
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Clear the host contract
 
+        Args:
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
+
+        return self._transact(
+            function=function,
+            wait=wait
+        )
+
+
+class AsyncMecaHostContractOwner(AsyncMecaContractOwner):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> None:
+        r"""
+        Initialize the MecaHostContract owner with an async web3 instance.
+        Use the create coroutine to verify the owner.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : host contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key
+        )
+
+        # get the contract abi
+        self.contract = self.w3.eth.contract(
+            address=contract_address,
+            abi=pymeca.utils.MECA_HOST_ABI
+        )
+
+    async def get_scheduler_address(self) -> str:
+        r"""
+        Get the scheduler address
+
+        Returns:
+            str : scheduler contract address
+        """
+        return await self.contract.functions.schedulerContractAddress(
+        ).call()
+
+    async def set_scheduler(
+        self,
+        contract_address: str
+    ) -> bool:
+        r"""
+        Set a new scheduler contract for the host.
+
+        Args:
+            contract_address : address of the scheduler contract
+
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.clear().build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.setSchedulerContractAddress(
+            newSchedulerContractAddress=contract_address
         )
 
-        tx_receipt = self._execute_transaction(transaction)
+        return await self._transact(
+            function=function
+        )
+
+    async def clear(self) -> bool:
+        r"""
+        Clear the host contract
+
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
 
-        return tx_receipt.status == 1
+        return await self._transact(
+            function=function
+        )
 
 
 class MecaTaskContractOwner(pymeca.pymeca.MecaActor):
@@ -545,29 +1050,71 @@ class MecaTaskContractOwner(pymeca.pymeca.MecaActor):
                 "The account is not the owner of the contract"
             )
 
-    def clear(self) -> bool:
+    def clear(
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Clear the task contract
 
+        Args:
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
         Returns:
             bool : success status
         """
-        transaction = (
-            self.contract.functions.clear().build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                )
-            })
+        function = self.contract.functions.clear()
+
+        return self._transact(
+            function=function,
+            wait=wait
+        )
+
+
+class AsyncMecaTaskContractOwner(AsyncMecaContractOwner):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        contract_address: str
+    ) -> None:
+        r"""
+        Initialize the MecaTaskContract owner with an async web3 instance.
+        Use the create coroutine to verify the owner.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key of the account
+            contract_address : task contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key
+        )
+
+        # get the contract abi
+        self.contract = self.w3.eth.contract(
+            address=contract_address,
+            abi=pymeca.utils.MECA_TASK_ABI
         )
 
-        tx_receipt = self._execute_transaction(transaction)
+    async def clear(self) -> bool:
+        r"""
+        Clear the task contract
 
-        return tx_receipt.status == 1
+        Returns:
+            bool : success status
+        """
+        function = self.contract.functions.clear()
+
+        return await self._transact(
+            function=function
+        )
 
 
 def init_meca_envirnoment(
-    endpoint_uri: str,
+    endpoint_uri: str | None,
     private_key: str,
     dao_contract_file_path: str,
     dao_contract_name: str,
@@ -587,11 +1134,17 @@ def init_meca_envirnoment(
     tower_failed_task_penalty: int,
     task_contract_file_path: str,
     task_contract_name: str,
-    task_addition_fee: int
+    task_addition_fee: int,
+    dao_contract_address: str = None,
+    w3: web3.Web3 = None
 ) -> dict:
     r"""
     Initialize the MECA ecosystem by deploying the contracts
-    and connecting them.
+    and connecting them. With the address of an existing DAO, the
+    contracts of its ecosystem whose code is the one of the local
+    sources and whose fees, stakes and penalties are the given ones
+    are reused, only the missing or stale contracts are deployed
+    and only the wrong wiring is sent.
 
     Args:
         endpoint_uri : blockchain endpoint uri
@@ -615,12 +1168,17 @@ def init_meca_envirnoment(
         task_contract_file_path : task contract file path
         task_contract_name : task contract name
         task_addition_fee : task addition fee
+        dao_contract_address : address of the DAO of an existing
+            ecosystem to reuse (default deploy all the contracts)
+        w3 : web3 instance used instead of the endpoint uri, like
+            the in-process chain of pymeca.testing.tester_web3
 
     Returns:
         dict : addresses of the contracts
     """
     # initialize the web3 instance
-    w3 = web3.Web3(web3.HTTPProvider(endpoint_uri))
+    if w3 is None:
+        w3 = web3.Web3(web3.HTTPProvider(endpoint_uri))
     if not w3.is_connected():
         raise pymeca.utils.MecaError("Blockchain endpoint is not connected")
 
@@ -638,58 +1196,105 @@ def init_meca_envirnoment(
     logger.debug(f"""Task Contract {task_contract_name} :
                  {task_contract_file_path}""")
 
-    dao_contract_address = pymeca.utils.deploy_contract(
+    # compile all the contracts with one solc compilation
+    contract_types = ["dao", "scheduler", "host", "tower", "task"]
+    compile_infos = dict(zip(
+        contract_types,
+        pymeca.utils.get_contracts_compile_info(
+            contracts=[
+                (dao_contract_file_path, dao_contract_name),
+                (scheduler_contract_file_path, scheduler_contract_name),
+                (host_contract_file_path, host_contract_name),
+                (tower_contract_file_path, tower_contract_name),
+                (task_contract_file_path, task_contract_name)
+            ],
+            output_values=["abi", "bin", "bin-runtime"]
+        )
+    ))
+
+    # reuse the contracts of the existing ecosystem whose code
+    # is the one of the local sources and whose constants are the
+    # constructor arguments
+    current = {}
+    if dao_contract_address is not None:
+        current = pymeca.deployment.current_meca_contracts(
+            w3=w3,
+            owner_address=w3.eth.account.from_key(private_key).address,
+            dao_contract_address=dao_contract_address,
+            runtime_bytecodes={
+                contract_type: compile_info[2]
+                for contract_type, compile_info in compile_infos.items()
+            },
+            parameters={
+                "scheduler": {
+                    "SCHEDULER_FEE": scheduler_fee
+                },
+                "host": {
+                    "HOST_REGISTER_FEE": host_register_fee,
+                    "HOST_INITIAL_STAKE": host_initial_stake,
+                    "FAILED_TASK_PENALTY": host_failed_task_penalty,
+                    "TASK_REGISTER_FEE": host_task_register_fee
+                },
+                "tower": {
+                    "TOWER_INITIAL_STAKE": tower_initial_stake,
+                    "HOST_REQUEST_FEE": tower_host_request_fee,
+                    "FAILED_TASK_PENALTY": tower_failed_task_penalty
+                },
+                "task": {
+                    "TASK_ADDITION_FEE": task_addition_fee
+                }
+            }
+        )
+        logger.info(f"Reusing the contracts {sorted(current)}")
+
+    # the nonces and addresses of the contracts are known before
+    # the deployment, so all the deploy transactions are sent at once
+    constructor_arguments = {
+        "dao": {},
+        "scheduler": {
+            "schedulerFee": scheduler_fee
+        },
+        "host": {
+            "hostRegisterFee": host_register_fee,
+            "hostInitialStake": host_initial_stake,
+            "failedTaskPenalty": host_failed_task_penalty,
+            "taskRegisterFee": host_task_register_fee
+        },
+        "tower": {
+            "towerInitialStake": tower_initial_stake,
+            "hostRequestFee": tower_host_request_fee,
+            "failedTaskPenalty": tower_failed_task_penalty
+        },
+        "task": {
+            "taskAdditionFee": task_addition_fee
+        }
+    }
+    planner = pymeca.deployment.DeploymentPlanner(
         w3=w3,
-        private_key=private_key,
-        contract_file_path=dao_contract_file_path,
-        contract_name=dao_contract_name
+        private_key=private_key
     )
+    contract_addresses = {}
+    for contract_type in contract_types:
+        if contract_type in current:
+            contract_addresses[contract_type] = current[contract_type]
+        else:
+            contract_addresses[contract_type] = planner.add(
+                contract_type,
+                compile_infos[contract_type][:2],
+                **constructor_arguments[contract_type]
+            )
+    planner.deploy()
 
-    logger.debug(f"DAO Contract Address : {dao_contract_address}")
-
-    scheduler_contract_address = pymeca.utils.deploy_contract(
-        w3=w3,
-        private_key=private_key,
-        contract_file_path=scheduler_contract_file_path,
-        contract_name=scheduler_contract_name,
-        schedulerFee=scheduler_fee
-    )
+    dao_contract_address = contract_addresses["dao"]
+    scheduler_contract_address = contract_addresses["scheduler"]
+    host_contract_address = contract_addresses["host"]
+    tower_contract_address = contract_addresses["tower"]
+    task_contract_address = contract_addresses["task"]
 
+    logger.debug(f"DAO Contract Address : {dao_contract_address}")
     logger.debug(f"Scheduler Contract Address : {scheduler_contract_address}")
-
-    host_contract_address = pymeca.utils.deploy_contract(
-        w3=w3,
-        private_key=private_key,
-        contract_file_path=host_contract_file_path,
-        contract_name=host_contract_name,
-        hostRegisterFee=host_register_fee,
-        hostInitialStake=host_initial_stake,
-        failedTaskPenalty=host_failed_task_penalty,
-        taskRegisterFee=host_task_register_fee
-    )
-
     logger.debug(f"Host Contract Address : {host_contract_address}")
-
-    tower_contract_address = pymeca.utils.deploy_contract(
-        w3=w3,
-        private_key=private_key,
-        contract_file_path=tower_contract_file_path,
-        contract_name=tower_contract_name,
-        towerInitialStake=tower_initial_stake,
-        hostRequestFee=tower_host_request_fee,
-        failedTaskPenalty=tower_failed_task_penalty
-    )
-
     logger.debug(f"Tower Contract Address : {tower_contract_address}")
-
-    task_contract_address = pymeca.utils.deploy_contract(
-        w3=w3,
-        private_key=private_key,
-        contract_file_path=task_contract_file_path,
-        contract_name=task_contract_name,
-        taskAdditionFee=task_addition_fee
-    )
-
     logger.debug(f"Task Contract Address : {task_contract_address}")
 
     # set the class for every contract
@@ -716,26 +1321,77 @@ def init_meca_envirnoment(
 
     logger.info("Made the contracts owner instances")
 
-    # set the scheduler to the dao
-    meca_dao_owner.set_scheduler(scheduler_contract_address)
-
-    # set the scheduler to the host
-    meca_host_owner.set_scheduler(scheduler_contract_address)
-
-    # set the scheduler to the tower
-    meca_tower_owner.set_scheduler(scheduler_contract_address)
-
-    # set the task to the scheduler
-    meca_scheduler_owner.set_task_contract(task_contract_address)
-
-    # set the host to the scheduler
-    meca_scheduler_owner.set_host_contract(host_contract_address)
-
-    # set the tower to the scheduler
-    meca_scheduler_owner.set_tower_contract(tower_contract_address)
-
-    # set the scheduler flag
-    meca_scheduler_owner.set_flag(True)
+    # the (current value, wanted value, setter) of every wiring, the
+    # new contracts are not wired yet
+    wirings = [
+        # the scheduler of the dao
+        (
+            meca_dao_owner.get_scheduler_address
+            if "dao" in current else None,
+            scheduler_contract_address,
+            meca_dao_owner.set_scheduler
+        ),
+        # the scheduler of the host
+        (
+            meca_host_owner.get_scheduler_address
+            if "host" in current else None,
+            scheduler_contract_address,
+            meca_host_owner.set_scheduler
+        ),
+        # the scheduler of the tower
+        (
+            meca_tower_owner.get_scheduler_address
+            if "tower" in current else None,
+            scheduler_contract_address,
+            meca_tower_owner.set_scheduler
+        ),
+        # the task of the scheduler
+        (
+            meca_scheduler_owner.get_task_contract_address
+            if "scheduler" in current else None,
+            task_contract_address,
+            meca_scheduler_owner.set_task_contract
+        ),
+        # the host of the scheduler
+        (
+            meca_scheduler_owner.get_host_contract_address
+            if "scheduler" in current else None,
+            host_contract_address,
+            meca_scheduler_owner.set_host_contract
+        ),
+        # the tower of the scheduler
+        (
+            meca_scheduler_owner.get_tower_contract_address
+            if "scheduler" in current else None,
+            tower_contract_address,
+            meca_scheduler_owner.set_tower_contract
+        )
+    ]
+    wirings = [
+        (wanted_address, setter)
+        for getter, wanted_address, setter in wirings
+        if getter is None or getter() != wanted_address
+    ]
+    scheduler_flag = (
+        "scheduler" in current and meca_scheduler_owner.get_flag()
+    )
+    if len(wirings) > 0 and scheduler_flag:
+        # rewire the running scheduler with the flag off
+        meca_scheduler_owner.set_flag(False)
+        scheduler_flag = False
+
+    # the wiring transactions are sent without waiting for each other
+    futures = [
+        setter(wanted_address, wait=False)
+        for wanted_address, setter in wirings
+    ]
+    for future in futures:
+        future.result()
+    logger.info(f"Sent {len(futures)} wiring transactions")
+
+    # set the scheduler flag when the scheduler is wired
+    if not scheduler_flag:
+        meca_scheduler_owner.set_flag(True)
 
     # save the addresses to the file
     addresses = {
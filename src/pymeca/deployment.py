@@ -0,0 +1,363 @@
+import logging
+import web3
+import web3.exceptions
+from eth_account import Account
+import pymeca.utils
+import pymeca.transaction
+
+logger = logging.getLogger(__name__)
+
+
+def _rlp_string(
+    value: bytes
+) -> bytes:
+    r"""
+    RLP encode a short byte string (less than 56 bytes).
+
+    Args:
+        value : The bytes
+
+    Returns:
+        bytes : The encoded bytes
+    """
+    if len(value) == 1 and value[0] < 0x80:
+        return value
+    return bytes([0x80 + len(value)]) + value
+
+
+def contract_address(
+    deployer_address: str,
+    nonce: int
+) -> str:
+    r"""
+    Get the address of the contract created by an account with
+    a nonce: keccak(rlp([deployer, nonce]))[12:].
+
+    Args:
+        deployer_address : The address of the deployer account
+        nonce : The nonce of the deploy transaction
+
+    Returns:
+        str : The checksum address of the contract
+    """
+    payload = (
+        _rlp_string(bytes.fromhex(deployer_address[2:])) +
+        _rlp_string(nonce.to_bytes((nonce.bit_length() + 7) // 8, "big"))
+    )
+    encoded = bytes([0xc0 + len(payload)]) + payload
+    return web3.Web3.to_checksum_address(
+        web3.Web3.keccak(encoded)[12:]
+    )
+
+
+class DeploymentPlanner():
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str
+    ) -> None:
+        r"""
+        Plan the deployment of many contracts by one account. Every
+        contract gets its nonce when it is added, so its address is
+        known before it is deployed, and all the deploy transactions
+        are sent without waiting for each other. The nonces come
+        from the shared nonce manager of the account, so the
+        transactions of the actors of the same account follow them.
+
+        Example:
+            planner = DeploymentPlanner(w3, private_key)
+            dao_address = planner.add("dao", dao_compile_info)
+            addresses = planner.deploy()
+
+        Args:
+            w3 : web3 instance
+            private_key : private key of the deployer account
+        """
+        self.w3 = w3
+        self.private_key = private_key
+        self.account = Account.from_key(private_key)
+        self.nonce_manager = pymeca.transaction.get_nonce_manager(
+            w3=w3,
+            address=self.account.address
+        )
+        self.contracts: dict[str, dict] = {}
+        r"""
+        The planned contracts by name
+        """
+
+    def add(
+        self,
+        name: str,
+        compile_info: tuple[list, str],
+        **kwargs
+    ) -> str:
+        r"""
+        Add a contract to deploy.
+
+        Args:
+            name : The name of the contract in the plan
+            compile_info : The (abi, bytecode) of the contract
+            kwargs : constructor arguments
+
+        Returns:
+            str : The address the contract will have
+        """
+        if name in self.contracts:
+            raise pymeca.utils.MecaError(
+                f"The contract {name} is already in the deployment plan"
+            )
+        nonce = self.nonce_manager.allocate(self.w3)
+        address = contract_address(self.account.address, nonce)
+        self.contracts[name] = {
+            "compileInfo": compile_info,
+            "arguments": kwargs,
+            "nonce": nonce,
+            "address": address
+        }
+        return address
+
+    def _send(
+        self,
+        contract: dict
+    ) -> bytes:
+        r"""
+        Build, sign and send the deploy transaction of a contract.
+
+        Args:
+            contract : The planned contract
+
+        Returns:
+            bytes : The transaction hash
+        """
+        contract_abi, contract_bytecode = contract["compileInfo"]
+        constructor_function = self.w3.eth.contract(
+            abi=contract_abi,
+            bytecode=contract_bytecode
+        ).constructor(**contract["arguments"])
+        gas_to_send = pymeca.utils.get_gas_to_send(
+            w3=self.w3,
+            account=self.account,
+            gas_estimate=constructor_function.estimate_gas({
+                "from": self.account.address
+            })
+        )
+        transaction = constructor_function.build_transaction({
+            "from": self.account.address,
+            "gas": gas_to_send,
+            "nonce": contract["nonce"]
+        })
+        signed_transaction = self.w3.eth.account.sign_transaction(
+            transaction, self.private_key
+        )
+        return self.w3.eth.send_raw_transaction(
+            signed_transaction.rawTransaction
+        )
+
+    def deploy(self) -> dict[str, str]:
+        r"""
+        Send all the deploy transactions and wait until they are mined.
+
+        Returns:
+            dict[str, str] : The addresses of the contracts by name
+        """
+        poller = pymeca.transaction.get_receipt_poller(self.w3)
+        futures = {}
+        try:
+            for name, contract in self.contracts.items():
+                futures[name] = pymeca.transaction.TransactionFuture(
+                    w3=self.w3,
+                    tx_hash=self._send(contract),
+                    nonce_manager=self.nonce_manager
+                )
+                poller.watch(futures[name])
+        except Exception:
+            # the nonces of the failed and next transactions are not used
+            for _ in range(len(self.contracts) - len(futures)):
+                self.nonce_manager.release(resync=True)
+            raise
+
+        addresses = {}
+        for name, future in futures.items():
+            tx_receipt = future.receipt()
+            if tx_receipt.contractAddress != self.contracts[name]["address"]:
+                raise pymeca.utils.MecaError(
+                    f"The contract {name} was deployed at "
+                    f"{tx_receipt.contractAddress} instead of "
+                    f"{self.contracts[name]['address']}"
+                )
+            addresses[name] = tx_receipt.contractAddress
+        block_numbers = sorted(set(
+            future.tx_receipt.blockNumber for future in futures.values()
+        ))
+        logger.info(
+            f"Deployed {len(addresses)} contracts in the blocks "
+            f"{block_numbers}"
+        )
+        return addresses
+
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def code_matches(
+    w3: web3.Web3,
+    contract_address: str,
+    runtime_bytecode: str
+) -> bool:
+    r"""
+    Check if the code of a deployed contract is the runtime bytecode
+    of the local sources, by comparing their keccak hashes.
+
+    Args:
+        w3 : web3 instance
+        contract_address : The address of the contract
+        runtime_bytecode : The runtime bytecode of the local sources
+
+    Returns:
+        bool : True if the deployed code is the local one
+    """
+    if contract_address is None or contract_address == ZERO_ADDRESS:
+        return False
+    code = w3.eth.get_code(contract_address)
+    if len(code) == 0:
+        return False
+    return (
+        web3.Web3.keccak(code) ==
+        web3.Web3.keccak(hexstr=runtime_bytecode)
+    )
+
+
+def _view_call(
+    w3: web3.Web3,
+    contract_address: str,
+    abi: list,
+    function_name: str
+):
+    r"""
+    Call a view function of a contract, None if the call fails
+    (no code or another contract at the address).
+
+    Args:
+        w3 : web3 instance
+        contract_address : The address of the contract
+        abi : The abi of the contract
+        function_name : The name of the view function
+
+    Returns:
+        Any : The result of the call or None
+    """
+    if contract_address is None or contract_address == ZERO_ADDRESS:
+        return None
+    contract = w3.eth.contract(address=contract_address, abi=abi)
+    try:
+        return contract.functions[function_name]().call()
+    except (web3.exceptions.Web3Exception, ValueError):
+        return None
+
+
+def find_meca_contracts(
+    w3: web3.Web3,
+    dao_contract_address: str
+) -> dict[str, str]:
+    r"""
+    Find the contracts of a deployed MECA ecosystem from its DAO:
+    the scheduler of the DAO, and the host, tower and task contracts
+    of the scheduler.
+
+    Args:
+        w3 : web3 instance
+        dao_contract_address : The address of the DAO contract
+
+    Returns:
+        dict[str, str] : The addresses by contract type ("dao",
+            "scheduler", "host", "tower", "task"), None if not found
+    """
+    scheduler_contract_address = _view_call(
+        w3, dao_contract_address,
+        pymeca.utils.MECA_DAO_ABI, "getSchedulerContract"
+    )
+    addresses = {
+        "dao": dao_contract_address,
+        "scheduler": scheduler_contract_address
+    }
+    for contract_type, function_name in [
+        ("host", "getHostContract"),
+        ("tower", "getTowerContract"),
+        ("task", "getTaskContract")
+    ]:
+        addresses[contract_type] = _view_call(
+            w3, scheduler_contract_address,
+            pymeca.utils.MECA_SCHEDULER_ABI, function_name
+        )
+    return addresses
+
+
+def current_meca_contracts(
+    w3: web3.Web3,
+    owner_address: str,
+    dao_contract_address: str,
+    runtime_bytecodes: dict[str, str],
+    parameters: dict[str, dict[str, int]] = None
+) -> dict[str, str]:
+    r"""
+    Get the contracts of a deployed MECA ecosystem which can be
+    reused: their code is the runtime bytecode of the local sources,
+    they are owned by the account and their constants (fees, stakes,
+    penalties set by the constructor) are the given ones.
+
+    Args:
+        w3 : web3 instance
+        owner_address : The address of the owner account
+        dao_contract_address : The address of the DAO contract
+        runtime_bytecodes : The runtime bytecode of the local sources
+            by contract type
+        parameters : The wanted values of the constants by contract
+            type and constant name, like {"scheduler":
+            {"SCHEDULER_FEE": 10}}
+
+    Returns:
+        dict[str, str] : The addresses of the current contracts by
+            contract type
+    """
+    abis = {
+        contract_type: getattr(pymeca.utils, attribute)
+        for attribute, contract_type in pymeca.utils.ABI_ATTRIBUTES.items()
+    }
+    current = {}
+    for contract_type, contract_address in find_meca_contracts(
+        w3=w3,
+        dao_contract_address=dao_contract_address
+    ).items():
+        if contract_type not in runtime_bytecodes:
+            continue
+        if not code_matches(
+            w3, contract_address, runtime_bytecodes[contract_type]
+        ):
+            logger.info(f"The {contract_type} contract is missing or stale")
+            continue
+        owner = _view_call(
+            w3, contract_address, abis[contract_type], "owner"
+        )
+        if owner != owner_address:
+            logger.info(
+                f"The {contract_type} contract {contract_address} "
+                f"is not owned by {owner_address}"
+            )
+            continue
+        changed = [
+            name
+            for name, value in (parameters or {}).get(
+                contract_type, {}
+            ).items()
+            if _view_call(
+                w3, contract_address, abis[contract_type], name
+            ) != value
+        ]
+        if len(changed) > 0:
+            logger.info(
+                f"The {contract_type} contract {contract_address} "
+                f"has other values of {changed}"
+            )
+            continue
+        current[contract_type] = contract_address
+    return current
@@ -0,0 +1,763 @@
+import logging
+import threading
+import sqlite3
+import json
+import collections.abc
+import web3
+import pymeca.utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10000
+r"""
+The default number of blocks of one eth_getLogs request
+"""
+
+
+def block_ranges(
+    from_block: int,
+    to_block: int,
+    chunk_size: int
+) -> list[tuple[int, int]]:
+    r"""
+    Split a block range in ranges of at most chunk_size blocks.
+
+    Args:
+        from_block : The first block
+        to_block : The last block
+        chunk_size : The maximum number of blocks of a range
+
+    Returns:
+        list[tuple[int, int]] : The (from, to) block ranges
+    """
+    ranges = []
+    start = from_block
+    while start <= to_block:
+        end = min(start + chunk_size - 1, to_block)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def argument_filters_key(
+    argument_filters: dict
+) -> tuple:
+    r"""
+    Get a hashable key of argument filters. A filter value can be
+    a list of values (any of them matches), so the lists are turned
+    in tuples.
+
+    Args:
+        argument_filters : The filters on the event arguments
+
+    Returns:
+        tuple : The sorted (name, value) pairs of the filters
+    """
+    return tuple(sorted(
+        (
+            (name, tuple(value))
+            if isinstance(value, list)
+            else (name, value)
+        )
+        for name, value in (argument_filters or {}).items()
+    ))
+
+
+def _checksum_value(
+    value
+):
+    r"""
+    Get the checksum address of an address filter value.
+
+    Args:
+        value : The filter value
+
+    Returns:
+        The checksum address or the value if it is not an address
+    """
+    if isinstance(value, str) and web3.Web3.is_address(value):
+        return web3.Web3.to_checksum_address(value)
+    return value
+
+
+def _argument_filters(
+    argument_filters: dict
+) -> dict:
+    r"""
+    Get the argument filters with checksum addresses. The filters
+    of get_logs match the decoded addresses, which are checksum
+    addresses, while the actors use lowercase addresses.
+
+    Args:
+        argument_filters : The filters on the event arguments
+
+    Returns:
+        dict : The filters with checksum addresses
+    """
+    if argument_filters is None:
+        return None
+    return {
+        name: (
+            [_checksum_value(item) for item in value]
+            if isinstance(value, list)
+            else _checksum_value(value)
+        )
+        for name, value in argument_filters.items()
+    }
+
+
+class EventReader():
+    def __init__(
+        self,
+        event_name: str,
+        argument_filters: dict = None,
+        from_block: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        keep_events: bool = True
+    ) -> None:
+        r"""
+        Incremental reader of the events of a contract. The reader
+        remembers the last processed block, so every read fetches
+        with eth_getLogs only the blocks added since the previous
+        read, in ranges of at most chunk_size blocks. The decoded
+        events are accumulated for the full view.
+
+        Example:
+            reader = pymeca.events.EventReader(
+                event_name="TaskFinished"
+            )
+            new_events = reader.read(contract=scheduler_contract)
+            all_events = reader.events
+
+        Args:
+            event_name : The name of the event in the contract ABI
+            argument_filters : The filters on the indexed arguments
+            from_block : The first block to read
+            chunk_size : The maximum number of blocks of one
+                eth_getLogs request
+            keep_events : if False the read events are not
+                accumulated, for the readers which only need
+                the new events
+        """
+        if chunk_size <= 0:
+            raise pymeca.utils.MecaError(
+                "The chunk size must be positive"
+            )
+        self.event_name = event_name
+        self.argument_filters = argument_filters
+        self.from_block = from_block
+        self.chunk_size = chunk_size
+        self.keep_events = keep_events
+        self.contract_address = None
+        r"""
+        The address of the contract of the read events
+        """
+        self.last_block = None
+        r"""
+        The last processed block or None if nothing was read
+        """
+        self.events: list = []
+        r"""
+        All the events read so far
+        """
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        r"""
+        Forget the read events, the next read starts again
+        from the first block.
+        """
+        with self._lock:
+            self.contract_address = None
+            self.last_block = None
+            self.events = []
+
+    def _next_block(self) -> int:
+        r"""
+        Get the first block which is not read yet.
+
+        Returns:
+            int : The block number
+        """
+        if self.last_block is None:
+            return self.from_block
+        return self.last_block + 1
+
+    def _ranges(
+        self,
+        contract_address: str,
+        block_number: int
+    ) -> list[tuple[int, int]]:
+        r"""
+        Get the block ranges which are not read yet. The events
+        are forgotten if the contract changed.
+
+        Args:
+            contract_address : The address of the contract
+            block_number : The last block to read
+
+        Returns:
+            list[tuple[int, int]] : The (from, to) block ranges
+        """
+        if self.contract_address != contract_address:
+            if self.contract_address is not None:
+                logger.debug(
+                    f"The {self.event_name} contract changed to "
+                    f"{contract_address}, read the events again"
+                )
+            self.contract_address = contract_address
+            self.last_block = None
+            self.events = []
+        return block_ranges(
+            from_block=self._next_block(),
+            to_block=block_number,
+            chunk_size=self.chunk_size
+        )
+
+    def _get_logs_kwargs(
+        self,
+        from_block: int,
+        to_block: int
+    ) -> dict:
+        r"""
+        Get the arguments of the get_logs request of a block range.
+
+        Args:
+            from_block : The first block
+            to_block : The last block
+
+        Returns:
+            dict : The get_logs arguments
+        """
+        return {
+            "argument_filters": _argument_filters(self.argument_filters),
+            "fromBlock": from_block,
+            "toBlock": to_block
+        }
+
+    def read(
+        self,
+        contract: web3.contract.Contract,
+        to_block: int = None
+    ) -> list:
+        r"""
+        Read the events of the blocks added since the previous read.
+
+        Args:
+            contract : The contract emitting the events
+            to_block : The last block to read (default the
+                current block)
+
+        Returns:
+            list : The new events
+        """
+        with self._lock:
+            if to_block is None:
+                block_number = contract.w3.eth.block_number
+            else:
+                block_number = to_block
+            new_events = []
+            contract_event = contract.events[self.event_name]
+            for from_block, to_block in self._ranges(
+                contract_address=contract.address,
+                block_number=block_number
+            ):
+                events = [
+                    pymeca.utils.dict_from_event(event)
+                    for event in contract_event.get_logs(
+                        **self._get_logs_kwargs(from_block, to_block)
+                    )
+                ]
+                # keep the progress if a later chunk fails
+                new_events.extend(events)
+                if self.keep_events:
+                    self.events.extend(events)
+                self.last_block = to_block
+            return new_events
+
+    async def async_read(
+        self,
+        contract: web3.contract.AsyncContract,
+        to_block: int = None
+    ) -> list:
+        r"""
+        Read the events of the blocks added since the previous read
+        with an async web3 contract.
+
+        Args:
+            contract : The async contract emitting the events
+            to_block : The last block to read (default the
+                current block)
+
+        Returns:
+            list : The new events
+        """
+        if to_block is None:
+            block_number = await contract.w3.eth.block_number
+        else:
+            block_number = to_block
+        new_events = []
+        contract_event = contract.events[self.event_name]
+        with self._lock:
+            ranges = self._ranges(
+                contract_address=contract.address,
+                block_number=block_number
+            )
+        for from_block, to_block in ranges:
+            events = await contract_event.get_logs(
+                **self._get_logs_kwargs(from_block, to_block)
+            )
+            events = [pymeca.utils.dict_from_event(event) for event in events]
+            with self._lock:
+                # another read already processed the range
+                if (
+                    self.contract_address != contract.address or
+                    self._next_block() != from_block
+                ):
+                    continue
+                new_events.extend(events)
+                if self.keep_events:
+                    self.events.extend(events)
+                self.last_block = to_block
+        return new_events
+
+
+# the scheduler events of the event store
+STORED_EVENTS = [
+    "TaskSent",
+    "TaskFinished"
+]
+
+# the event arguments which can be queried in the event store
+STORE_COLUMNS = {
+    "taskId": "task_id",
+    "hostAddress": "host_address",
+    "towerAddress": "tower_address",
+    "sender": "owner",
+    "owner": "owner"
+}
+
+_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    contract TEXT NOT NULL,
+    event TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    task_id TEXT,
+    host_address TEXT,
+    tower_address TEXT,
+    owner TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (contract, transaction_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_task_id ON events (task_id);
+CREATE INDEX IF NOT EXISTS events_host_address ON events (host_address);
+CREATE INDEX IF NOT EXISTS events_tower_address ON events (tower_address);
+CREATE INDEX IF NOT EXISTS events_owner ON events (owner);
+CREATE INDEX IF NOT EXISTS events_block_number
+    ON events (contract, event, block_number);
+CREATE TABLE IF NOT EXISTS cursors (
+    contract TEXT NOT NULL,
+    event TEXT NOT NULL,
+    last_block INTEGER NOT NULL,
+    PRIMARY KEY (contract, event)
+);
+"""
+
+
+def _store_value(
+    column: str,
+    value: str
+) -> str:
+    r"""
+    Normalize a task id or an address for the event store.
+
+    Args:
+        column : The column of the value
+        value : The task id or the address
+
+    Returns:
+        str : The lowercase value, the task ids without 0x
+    """
+    if value is None:
+        return None
+    value = str(value).lower()
+    if column == "task_id" and value.startswith("0x"):
+        value = value[2:]
+    return value
+
+
+def _json_value(
+    value
+):
+    r"""
+    Transform the web3 values of a decoded event for JSON.
+
+    Args:
+        value : The value which is not JSON serializable
+
+    Returns:
+        The JSON serializable value
+    """
+    if isinstance(value, collections.abc.Mapping):
+        return dict(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def _event_value(
+    value
+):
+    r"""
+    Get back the decoded value of an event argument from its JSON
+    value. The structs and arrays are decoded as tuples, which JSON
+    stores as lists.
+
+    Args:
+        value : The JSON value
+
+    Returns:
+        The decoded value
+    """
+    if isinstance(value, list):
+        return tuple(_event_value(item) for item in value)
+    return value
+
+
+def _event_from_json(
+    data: str
+) -> dict:
+    r"""
+    Get back a stored event in the shape of the events read from
+    the blockchain (pymeca.utils.dict_from_event).
+
+    Args:
+        data : The JSON of the event
+
+    Returns:
+        dict : The event
+    """
+    event = json.loads(data)
+    event["args"] = {
+        name: _event_value(value)
+        for name, value in event["args"].items()
+    }
+    return event
+
+
+class EventStore():
+    def __init__(
+        self,
+        path: str = ":memory:",
+        from_block: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        r"""
+        Persistent SQLite index of the TaskSent and TaskFinished
+        events of the scheduler contract. The events are indexed on
+        the task id, the host, the tower, the owner and the block
+        number. A cursor per contract and event records the last
+        synchronized block, so a new process using the same file
+        resumes from the cursor instead of reading all the history.
+
+        Example:
+            event_store = pymeca.events.EventStore(path="events.db")
+            user = pymeca.user.MecaUser(...)
+            user.event_store = event_store
+
+        Args:
+            path : The path of the SQLite database
+            from_block : The first block to read
+            chunk_size : The maximum number of blocks of one
+                eth_getLogs request
+        """
+        if chunk_size <= 0:
+            raise pymeca.utils.MecaError(
+                "The chunk size must be positive"
+            )
+        self.path = path
+        self.from_block = from_block
+        self.chunk_size = chunk_size
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_STORE_SCHEMA)
+
+    def close(self) -> None:
+        r"""
+        Close the SQLite database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def cursor(
+        self,
+        contract_address: str,
+        event_name: str
+    ) -> int:
+        r"""
+        Get the last synchronized block of an event.
+
+        Args:
+            contract_address : The address of the contract
+            event_name : The name of the event
+
+        Returns:
+            int : The block number or None if the event
+                was never synchronized
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_block FROM cursors "
+                "WHERE contract = ? AND event = ?",
+                (contract_address.lower(), event_name)
+            ).fetchone()
+        if row is None:
+            return None
+        return row["last_block"]
+
+    def _pending_ranges(
+        self,
+        contract_address: str,
+        event_name: str,
+        block_number: int
+    ) -> list[tuple[int, int]]:
+        r"""
+        Get the block ranges of an event after the cursor.
+
+        Args:
+            contract_address : The address of the contract
+            event_name : The name of the event
+            block_number : The last block to synchronize
+
+        Returns:
+            list[tuple[int, int]] : The (from, to) block ranges
+        """
+        last_block = self.cursor(
+            contract_address=contract_address,
+            event_name=event_name
+        )
+        return block_ranges(
+            from_block=(
+                self.from_block if last_block is None else last_block + 1
+            ),
+            to_block=block_number,
+            chunk_size=self.chunk_size
+        )
+
+    def _row(
+        self,
+        contract_address: str,
+        event: dict
+    ) -> tuple:
+        r"""
+        Get the table row of a decoded event. The TaskFinished
+        events take the host, the tower and the owner of the
+        TaskSent event of the same task.
+
+        Args:
+            contract_address : The address of the contract
+            event : The decoded event
+
+        Returns:
+            tuple : The row of the events table
+        """
+        args = event["args"]
+        task_id = _store_value("task_id", args.get("taskId"))
+        host_address = _store_value("host_address", args.get("hostAddress"))
+        tower_address = _store_value(
+            "tower_address",
+            args.get("towerAddress")
+        )
+        owner = _store_value("owner", args.get("sender"))
+        if event["event"] == "TaskFinished":
+            sent = self._connection.execute(
+                "SELECT host_address, tower_address, owner FROM events "
+                "WHERE contract = ? AND event = 'TaskSent' "
+                "AND task_id = ? AND block_number <= ? "
+                "ORDER BY block_number DESC, log_index DESC LIMIT 1",
+                (contract_address, task_id, event["blockNumber"])
+            ).fetchone()
+            if sent is not None:
+                host_address = sent["host_address"]
+                tower_address = sent["tower_address"]
+                owner = sent["owner"]
+        return (
+            contract_address,
+            event["event"],
+            event["blockNumber"],
+            _store_value("transaction_hash", event["transactionHash"]),
+            event["logIndex"],
+            task_id,
+            host_address,
+            tower_address,
+            owner,
+            json.dumps(event, default=_json_value)
+        )
+
+    def _store(
+        self,
+        contract_address: str,
+        event_name: str,
+        to_block: int,
+        events: list
+    ) -> None:
+        r"""
+        Store the events of a block range and move the cursor
+        in the same SQLite transaction.
+
+        Args:
+            contract_address : The address of the contract
+            event_name : The name of the event
+            to_block : The last block of the range
+            events : The decoded events of the range
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO events VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(contract_address, event) for event in events]
+            )
+            self._connection.execute(
+                "INSERT INTO cursors VALUES (?, ?, ?) "
+                "ON CONFLICT (contract, event) DO UPDATE SET "
+                "last_block = MAX(last_block, excluded.last_block)",
+                (contract_address, event_name, to_block)
+            )
+
+    def sync(
+        self,
+        contract: web3.contract.Contract
+    ) -> int:
+        r"""
+        Store the scheduler events of the blocks after the cursors.
+
+        Args:
+            contract : The scheduler contract
+
+        Returns:
+            int : The last synchronized block
+        """
+        contract_address = contract.address.lower()
+        block_number = contract.w3.eth.block_number
+        # the TaskSent events first for the owners of the finished tasks
+        for event_name in STORED_EVENTS:
+            contract_event = contract.events[event_name]
+            for from_block, to_block in self._pending_ranges(
+                contract_address=contract_address,
+                event_name=event_name,
+                block_number=block_number
+            ):
+                events = contract_event.get_logs(
+                    fromBlock=from_block,
+                    toBlock=to_block
+                )
+                self._store(
+                    contract_address=contract_address,
+                    event_name=event_name,
+                    to_block=to_block,
+                    events=[
+                        pymeca.utils.dict_from_event(event)
+                        for event in events
+                    ]
+                )
+        return block_number
+
+    async def async_sync(
+        self,
+        contract: web3.contract.AsyncContract
+    ) -> int:
+        r"""
+        Store the scheduler events of the blocks after the cursors
+        with an async web3 contract.
+
+        Args:
+            contract : The async scheduler contract
+
+        Returns:
+            int : The last synchronized block
+        """
+        contract_address = contract.address.lower()
+        block_number = await contract.w3.eth.block_number
+        for event_name in STORED_EVENTS:
+            contract_event = contract.events[event_name]
+            for from_block, to_block in self._pending_ranges(
+                contract_address=contract_address,
+                event_name=event_name,
+                block_number=block_number
+            ):
+                events = await contract_event.get_logs(
+                    fromBlock=from_block,
+                    toBlock=to_block
+                )
+                self._store(
+                    contract_address=contract_address,
+                    event_name=event_name,
+                    to_block=to_block,
+                    events=[
+                        pymeca.utils.dict_from_event(event)
+                        for event in events
+                    ]
+                )
+        return block_number
+
+    def query(
+        self,
+        contract_address: str,
+        event_name: str,
+        argument_filters: dict = None,
+        from_block: int = None,
+        to_block: int = None
+    ) -> list:
+        r"""
+        Get the stored events of the scheduler contract.
+
+        Args:
+            contract_address : The address of the scheduler contract
+            event_name : The name of the event
+                (TaskSent, TaskFinished)
+            argument_filters : The filters on taskId, hostAddress,
+                towerAddress and sender (or owner), a list of values
+                matches any of them
+            from_block : The first block of the events
+            to_block : The last block of the events
+
+        Returns:
+            list : The events in the chain order, in the same shape
+                as the events read from the blockchain
+        """
+        conditions = ["contract = ?", "event = ?"]
+        parameters = [contract_address.lower(), event_name]
+        for name, value in (argument_filters or {}).items():
+            if name not in STORE_COLUMNS:
+                raise pymeca.utils.MecaError(
+                    f"The event store can not filter on {name}"
+                )
+            column = STORE_COLUMNS[name]
+            if isinstance(value, list):
+                conditions.append(
+                    f"{column} IN ({', '.join('?' * len(value))})"
+                )
+                parameters.extend(
+                    _store_value(column, item) for item in value
+                )
+            else:
+                conditions.append(f"{column} = ?")
+                parameters.append(_store_value(column, value))
+        if from_block is not None:
+            conditions.append("block_number >= ?")
+            parameters.append(from_block)
+        if to_block is not None:
+            conditions.append("block_number <= ?")
+            parameters.append(to_block)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM events WHERE " +
+                " AND ".join(conditions) +
+                " ORDER BY block_number, log_index",
+                parameters
+            ).fetchall()
+        return [_event_from_json(row["data"]) for row in rows]
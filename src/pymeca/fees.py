@@ -0,0 +1,223 @@
+import logging
+import numpy
+import pymeca.utils
+import pymeca.records
+
+logger = logging.getLogger(__name__)
+
+FIXED_FEE_TYPE = 0
+r"""
+Tower fee type of a fixed fee for every task
+"""
+
+SIZE_BLOCK_FEE_TYPE = 1
+r"""
+Tower fee type of a fee for every unit of size and every block
+"""
+
+_UINT64_MAX = 2 ** 64 - 1
+
+
+def fee_breakdown(
+    task_fee: int,
+    tower_fee: int,
+    host_fee: int,
+    scheduler_fee: int
+) -> dict:
+    r"""
+    Get the fees of running a task on a (tower, host) pair.
+
+    Args:
+        task_fee : The fee of the task owner
+        tower_fee : The fee of the tower
+        host_fee : The fee of the host
+        scheduler_fee : The fee of the scheduler
+
+    Returns:
+        dict : The fees
+        {
+            "insurance"
+            "tower"
+            "host"
+            "schedule"
+            "task"
+        }
+    """
+    total_fee = (
+        task_fee +
+        tower_fee +
+        host_fee +
+        scheduler_fee
+    )
+    insurance_fee = int(total_fee / 10)
+    return {
+        "insurance": insurance_fee,
+        "tower": tower_fee,
+        "host": host_fee,
+        "schedule": scheduler_fee,
+        "task": task_fee
+    }
+
+
+def send_task_value(
+    task_fee: int,
+    tower_fee: int,
+    host_fee: int,
+    scheduler_fee: int
+) -> int:
+    r"""
+    Get the value which has to be sent with the sendTask
+    transaction to the scheduler.
+
+    Args:
+        task_fee : The fee of the task owner
+        tower_fee : The fee of the tower
+        host_fee : The fee of the host
+        scheduler_fee : The fee of the scheduler
+
+    Returns:
+        int : The value of the transaction (Wei)
+    """
+    insurance_fee = (task_fee + tower_fee + host_fee) / 10
+    return int(
+        task_fee +
+        tower_fee +
+        host_fee +
+        insurance_fee +
+        scheduler_fee
+    )
+
+
+class Quote(pymeca.records.Record):
+    r"""
+    Quote of running a task on a (tower, host) pair, made by the
+    candidate search. It is a dictionary with the keys of the search
+    results and keeps the task and the block of the reads, so
+    it can be sent with send_task_on_blockchain(quote=quote)
+    without reading the fees again.
+    """
+    __slots__ = ("ipfs_sha256", "block_number")
+
+    def __init__(
+        self,
+        ipfs_sha256: str,
+        block_number: int,
+        tower_address: str,
+        host_address: str,
+        end_block: int,
+        fee: dict
+    ) -> None:
+        super().__init__(
+            towerAddress=tower_address,
+            hostAddress=host_address,
+            endBlock=end_block,
+            fee=fee
+        )
+        self.ipfs_sha256 = ipfs_sha256
+        self.block_number = block_number
+
+    @property
+    def value(self) -> int:
+        r"""
+        The value which has to be sent with the sendTask transaction.
+        """
+        return send_task_value(
+            task_fee=self.fee["task"],
+            tower_fee=self.fee["tower"],
+            host_fee=self.fee["host"],
+            scheduler_fee=self.fee["schedule"]
+        )
+
+    def age(
+        self,
+        block_number: int
+    ) -> int:
+        r"""
+        Get the number of blocks since the reads of the quote.
+
+        Args:
+            block_number : The current block number
+
+        Returns:
+            int : The age of the quote in blocks
+        """
+        return block_number - self.block_number
+
+
+def tower_fee(
+    fee_type: int,
+    fee: int,
+    size: int,
+    block_timeout_limit: int
+) -> int:
+    r"""
+    Get the fee of a tower to run a task of a given size for a
+    number of blocks, like the getTowerFee of the tower contract,
+    without any read.
+
+    Args:
+        fee_type : The fee type of the tower
+        fee : The fee of the tower
+        size : The size of the task
+        block_timeout_limit : The number of blocks to run the task
+
+    Returns:
+        int : The fee for the task to be run on the tower (Wei)
+    """
+    if fee_type == FIXED_FEE_TYPE:
+        return fee
+    if fee_type == SIZE_BLOCK_FEE_TYPE:
+        return fee * size * block_timeout_limit
+    raise pymeca.utils.MecaError(
+        f"Unknown tower fee type {fee_type}"
+    )
+
+
+def tower_fees(
+    fee_types: list[int],
+    fees: list[int],
+    sizes: list[int],
+    block_timeout_limits: list[int]
+) -> numpy.ndarray:
+    r"""
+    Get the tower fees of many (tower, size, block timeout)
+    combinations at once, the vectorized version of tower_fee.
+    The fees are computed in uint64 when the largest product
+    fits, else with the exact python integers.
+
+    Args:
+        fee_types : The fee type of every combination
+        fees : The tower fee of every combination
+        sizes : The task size of every combination
+        block_timeout_limits : The number of blocks of every combination
+
+    Returns:
+        numpy.ndarray : The fees (Wei)
+    """
+    fee_types = numpy.asarray(fee_types)
+    known = (
+        (fee_types == FIXED_FEE_TYPE) |
+        (fee_types == SIZE_BLOCK_FEE_TYPE)
+    )
+    if not numpy.all(known):
+        raise pymeca.utils.MecaError(
+            f"Unknown tower fee types {set(fee_types[~known].tolist())}"
+        )
+    values = [list(fees), list(sizes), list(block_timeout_limits)]
+    largest = 1
+    for column in values:
+        largest *= max(column, default=0)
+    if min(min(column, default=0) for column in values) >= 0 and (
+        largest <= _UINT64_MAX
+    ):
+        dtype = numpy.uint64
+    else:
+        dtype = object
+    fees, sizes, block_timeout_limits = [
+        numpy.array(column, dtype=dtype) for column in values
+    ]
+    return numpy.where(
+        fee_types == FIXED_FEE_TYPE,
+        fees,
+        fees * sizes * block_timeout_limits
+    )
@@ -0,0 +1,298 @@
+import logging
+import asyncio
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class TowerHostGraph():
+    def __init__(self) -> None:
+        r"""
+        Bipartite index of the tower <-> host memberships. The
+        graph is built from the towers and one batch of their
+        hosts, pinned to the same block, and answers the tower ->
+        hosts and host -> towers lookups in O(1). When it is
+        refreshed on a new block only the towers whose hosts
+        changed are updated in the index.
+
+        Example:
+            graph = actor.get_tower_host_graph().refresh(actor)
+            towers = graph.get_host_towers(host_address)
+            hosts = graph.get_tower_hosts(tower_address)
+        """
+        self.block_number: int = None
+        r"""
+        The block number of the last refresh
+        """
+        self.towers: dict[str, dict] = {}
+        r"""
+        The towers by owner address
+        """
+        self.tower_hosts: dict[str, list[str]] = {}
+        r"""
+        The hosts of every tower
+        """
+        self.host_towers: dict[str, set[str]] = {}
+        r"""
+        The towers of every host
+        """
+        self.rpc_requests: int = 0
+        r"""
+        The number of JSON-RPC round trips of the refreshes
+        """
+        self._tower_positions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _set_tower(
+        self,
+        tower: dict,
+        hosts: list[str]
+    ) -> bool:
+        r"""
+        Set a tower and its hosts, updating the host -> towers
+        index only if the hosts changed.
+
+        Args:
+            tower : The tower
+            hosts : The hosts of the tower
+
+        Returns:
+            bool : True if the hosts of the tower changed
+        """
+        tower_address = tower["owner"]
+        self.towers[tower_address] = tower
+        old_hosts = self.tower_hosts.get(tower_address)
+        if old_hosts == hosts:
+            return False
+        for host_address in set(old_hosts or []) - set(hosts):
+            self._remove_membership(tower_address, host_address)
+        for host_address in hosts:
+            self.host_towers.setdefault(host_address, set()).add(
+                tower_address
+            )
+        self.tower_hosts[tower_address] = list(hosts)
+        return True
+
+    def _remove_membership(
+        self,
+        tower_address: str,
+        host_address: str
+    ) -> None:
+        r"""
+        Remove a host from the towers of the host -> towers index.
+
+        Args:
+            tower_address : The tower address
+            host_address : The host address
+        """
+        towers = self.host_towers.get(host_address)
+        if towers is None:
+            return
+        towers.discard(tower_address)
+        if len(towers) == 0:
+            del self.host_towers[host_address]
+
+    def _remove_tower(
+        self,
+        tower_address: str
+    ) -> None:
+        r"""
+        Remove a tower which is not registered anymore.
+
+        Args:
+            tower_address : The tower address
+        """
+        for host_address in self.tower_hosts.pop(tower_address, []):
+            self._remove_membership(tower_address, host_address)
+        self.towers.pop(tower_address, None)
+
+    def update(
+        self,
+        block_number: int,
+        towers: list,
+        towers_hosts: list[list[str]]
+    ) -> None:
+        r"""
+        Update the graph with the towers and their hosts read
+        at a block.
+
+        Args:
+            block_number : The block of the reads
+            towers : The towers
+            towers_hosts : The hosts of every tower in the same order
+        """
+        with self._lock:
+            tower_addresses = set(tower["owner"] for tower in towers)
+            for tower_address in list(self.towers):
+                if tower_address not in tower_addresses:
+                    self._remove_tower(tower_address)
+            changed = 0
+            for tower, hosts in zip(towers, towers_hosts):
+                if self._set_tower(tower, hosts):
+                    changed += 1
+            # keep the order of the tower contract
+            self.towers = {tower["owner"]: tower for tower in towers}
+            self._tower_positions = {
+                tower["owner"]: position
+                for position, tower in enumerate(towers)
+            }
+            self.block_number = block_number
+        logger.debug(
+            f"Tower host graph at block {block_number}: "
+            f"{changed} towers changed"
+        )
+
+    def is_current(
+        self,
+        block_number: int,
+        towers: list = None
+    ) -> bool:
+        r"""
+        Check if the graph is at a block and has the given towers.
+
+        Args:
+            block_number : The block number
+            towers : The towers (default not checked)
+
+        Returns:
+            bool : True if the graph can be used at the block
+        """
+        with self._lock:
+            if self.block_number != block_number:
+                return False
+            if towers is None:
+                return True
+            return (
+                set(tower["owner"] for tower in towers) ==
+                set(self.towers)
+            )
+
+    def refresh(
+        self,
+        actor
+    ) -> "TowerHostGraph":
+        r"""
+        Read the towers and their hosts at the current block if the
+        graph is older. The towers and the hosts of the known towers
+        are read in one batch request, only the new towers need
+        a second one.
+
+        Args:
+            actor : The MecaActiveActor used for the reads
+
+        Returns:
+            TowerHostGraph : The graph
+        """
+        block_number = actor.w3.eth.block_number
+        if self.is_current(block_number):
+            return self
+        batch = actor.batch(block_identifier=block_number)
+        towers_result = batch.add(actor.get_towers)
+        hosts_results = {
+            tower_address: batch.add(
+                actor.get_tower_hosts,
+                tower_address=tower_address
+            )
+            for tower_address in list(self.towers)
+        }
+        batch.send()
+        self.rpc_requests += batch.rpc_requests
+        towers = towers_result.result()
+        # the hosts of the removed towers are not used
+        hosts_by_tower = {
+            tower["owner"]: hosts_results[tower["owner"]].result()
+            for tower in towers
+            if tower["owner"] in hosts_results
+        }
+        new_towers = [
+            tower["owner"] for tower in towers
+            if tower["owner"] not in hosts_by_tower
+        ]
+        if len(new_towers) > 0:
+            batch = actor.batch(block_identifier=block_number)
+            for tower_address in new_towers:
+                batch.add(
+                    actor.get_tower_hosts,
+                    tower_address=tower_address
+                )
+            hosts_by_tower.update(zip(new_towers, batch.execute()))
+            self.rpc_requests += batch.rpc_requests
+        self.update(
+            block_number=block_number,
+            towers=towers,
+            towers_hosts=[
+                hosts_by_tower[tower["owner"]] for tower in towers
+            ]
+        )
+        return self
+
+    async def async_refresh(
+        self,
+        actor
+    ) -> "TowerHostGraph":
+        r"""
+        Read the towers and their hosts at the current block if the
+        graph is older, with concurrent reads.
+
+        Args:
+            actor : The AsyncMecaActiveActor used for the reads
+
+        Returns:
+            TowerHostGraph : The graph
+        """
+        block_number = await actor.w3.eth.block_number
+        if self.is_current(block_number):
+            return self
+        with actor.at_block(block_number):
+            towers = await actor.get_towers()
+            towers_hosts = await asyncio.gather(*[
+                actor.get_tower_hosts(tower_address=tower["owner"])
+                for tower in towers
+            ])
+        self.rpc_requests += 1 + len(towers)
+        self.update(
+            block_number=block_number,
+            towers=towers,
+            towers_hosts=list(towers_hosts)
+        )
+        return self
+
+    def get_tower_hosts(
+        self,
+        tower_address: str
+    ) -> list[str]:
+        r"""
+        Get the hosts of a tower.
+
+        Args:
+            tower_address : The tower address
+
+        Returns:
+            list[str] : The host addresses
+        """
+        with self._lock:
+            return list(self.tower_hosts.get(tower_address, []))
+
+    def get_host_towers(
+        self,
+        host_address: str
+    ) -> list:
+        r"""
+        Get the towers a host can run tasks for, in the order
+        of the towers of the tower contract.
+
+        Args:
+            host_address : The host address
+
+        Returns:
+            list : The towers
+        """
+        with self._lock:
+            tower_addresses = sorted(
+                self.host_towers.get(host_address, set()),
+                key=lambda tower_address: self._tower_positions[tower_address]
+            )
+            return [
+                self.towers[tower_address]
+                for tower_address in tower_addresses
+            ]
@@ -1,35 +1,45 @@
 import logging
+import typing
 import web3
 import pymeca.pymeca
 import pymeca.utils
+import pymeca.transaction
 
 logger = logging.getLogger(__name__)
 
 
-class MecaHost(pymeca.pymeca.MecaActiveActor):
-    def __init__(
-        self,
-        w3: web3.Web3,
-        private_key: str,
-        dao_contract_address: str
-    ):
-        r"""
-        init the a meca host actor.
-
-        Args:
-            w3: web3 instance
-            private_key: private key of the host
-            dao_contract_address: dao contract address
-        """
-        super().__init__(
-            w3=w3,
-            private_key=private_key,
-            dao_contract_address=dao_contract_address
+def bytes_from_hex_public_key(
+    public_key: str
+) -> list[bytes]:
+    r"""
+    Get the bytes from the hex public key. It transforms
+    in an array of bytes32 of size 2
+
+    Args:
+        public_key: public key in hex
+
+    Returns:
+        list[bytes]: list of 2 bytes array of 32 bytes
+    """
+    if public_key.startswith("0x"):
+        public_key = public_key[2:]
+    if len(public_key) != 128:
+        raise pymeca.utils.MecaError(
+            "The public key must be 64 bytes long"
         )
-        self.registered = None
-        r"""
-        If the host is registered in the ecosystem
-        """
+    return [
+        bytes.fromhex(public_key[:64]),
+        bytes.fromhex(public_key[64:])
+    ]
+
+
+class MecaHostBase():
+    r"""
+    The host functions written once for the MecaHost and the
+    AsyncMecaHost. They return the value for a MecaHost and an
+    awaitable for an AsyncMecaHost (see pymeca.pymeca.io_steps).
+    Only the iterator of the received tasks is in both classes.
+    """
 
     # helper functions
     def _bytes_from_hex_public_key(
@@ -46,17 +56,9 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
         Returns:
             list[bytes]: list of 2 bytes array of 32 bytes
         """
-        if public_key.startswith("0x"):
-            public_key = public_key[2:]
-        if len(public_key) != 128:
-            raise pymeca.utils.MecaError(
-                "The public key must be 64 bytes long"
-            )
-        return [
-            bytes.fromhex(public_key[:64]),
-            bytes.fromhex(public_key[64:])
-        ]
+        return bytes_from_hex_public_key(public_key)
 
+    @pymeca.pymeca.io_steps
     def is_registered(self) -> bool:
         r"""
         Check if the host is registered
@@ -65,13 +67,14 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
             bool: if the host is registered
         """
         if self.registered is None:
-            self.registered = self.is_host_registered(
+            self.registered = yield self.is_host_registered(
                 address=self.account.address
             )
         return self.registered
 
     # helper getter functions
     # host related functions
+    @pymeca.pymeca.io_steps
     def get_my_tasks(
         self
     ) -> list:
@@ -81,11 +84,11 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
         Returns:
             list: list of tasks
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        return self.get_host_tasks(self.account.address)
+        return (yield self.get_host_tasks(self.account.address))
 
     # task related functions
     def get_task_block_timeout(
@@ -126,6 +129,7 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
         )
 
     # tower related functions
+    @pymeca.pymeca.io_steps
     def get_my_towers(
         self
     ) -> list:
@@ -135,20 +139,22 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
         Returns:
             list: list of towers
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        return self.get_host_towers(self.account.address)
+        return (yield self.get_host_towers(self.account.address))
 
     # setters
     # host related functions
+    @pymeca.pymeca.io_steps
     def register(
         self,
         block_timeout_limit: int,
         public_key: str,
-        initial_deposit: int
-    ) -> bool:
+        initial_deposit: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register the host in the ecosystem
 
@@ -156,158 +162,166 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
             block_timeout_limit: the number of block gets for queue task
             public_key: public key of the host
             initial_deposit: initial deposit
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the registration was successful
         """
-        if self.is_registered():
+        if (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is already registered"
             )
-        if initial_deposit < self.get_host_initial_stake():
+        if initial_deposit < (yield self.get_host_initial_stake()):
             raise pymeca.utils.MecaError(
                 "The initial deposit is less than the minimum deposit"
             )
-        transaction = self.get_host_contract(
-        ).functions.registerAsHost(
+        function = (yield self.get_host_contract(
+        )).functions.registerAsHost(
             publicKey=self._bytes_from_hex_public_key(public_key),
             blockTimeoutLimit=block_timeout_limit
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address),
-            "value": initial_deposit
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
-
-        self.registered = self.is_host_registered(self.account.address)
+        )
 
-        return tx_receipt.status == 1
+        # the registration is checked again when it is needed
+        self.registered = None
+        return (yield self._transact(
+            function=function,
+            value=initial_deposit,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def increase_stake(
         self,
-        amount: int
-    ) -> bool:
+        amount: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Increase stake of the host in the ecosystem.
 
         Args:
             amount: amount to increase
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the increase was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = (
-            self.get_host_contract(
-            ).functions.addStake(
-            ).build_transaction({
-                "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.account.address
-                ),
-                "value": amount
-            })
+        function = (yield self.get_host_contract(
+        )).functions.addStake(
         )
 
-        tx_receipt = self._execute_transaction(transaction)
-
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            value=amount,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_public_key(
         self,
-        public_key: str
-    ) -> bool:
+        public_key: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update public key of the host.
 
         Args:
             public_key: public key in hex
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the update was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.updatePublicKey(
+        function = (yield self.get_host_contract(
+        )).functions.updatePublicKey(
             newPublicKey=self._bytes_from_hex_public_key(public_key)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_block_timeout_limit(
         self,
-        new_block_timeout_limit: int
-    ) -> bool:
+        new_block_timeout_limit: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update block timeout limit of the host.
 
         Args:
             new_block_timeout_limit: new block timeout limit
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the update was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.updateBlockTimeoutLimit(
+        function = (yield self.get_host_contract(
+        )).functions.updateBlockTimeoutLimit(
             newBlockTimeoutLimit=new_block_timeout_limit
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def unregister(
-        self
-    ) -> bool:
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Unregister the host from the ecosystem.
 
+        Args:
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
+
         Returns:
             bool: if the unregister was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.deleteHost(
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
-
-        self.registered = self.is_host_registered(self.account.address)
+        function = (yield self.get_host_contract(
+        )).functions.deleteHost(
+        )
 
-        return tx_receipt.status == 1
+        # the registration is checked again when it is needed
+        self.registered = None
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
     # task related functions
+    @pymeca.pymeca.io_steps
     def add_task(
         self,
         ipfs_sha256: str,
         block_timeout: int,
-        fee: int
-    ) -> bool:
+        fee: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Add a task for the host in the ecosystem.
 
@@ -315,232 +329,358 @@ class MecaHost(pymeca.pymeca.MecaActiveActor):
             ipfs_sha256: ipfs sha256 of the task
             block_timeout: block timeout limit
             fee: fee of the task
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the add was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.addTask(
+        function = (yield self.get_host_contract(
+        )).functions.addTask(
             ipfsSha256=ipfs_sha256,
             blockTimeout=block_timeout,
             fee=fee
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address),
-            "value": self.get_host_task_register_fee()
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            value=(yield self.get_host_task_register_fee()),
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_task_block_timeout(
         self,
         ipfs_sha256: str,
-        block_timeout: int
-    ) -> bool:
+        block_timeout: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update the number of blocks a task will take.
 
         Args:
             ipfs_sha256: ipfs sha256 of the task
             block_timeout: block timeout limit
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the update was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.updateTaskBlockTimeout(
+        function = (yield self.get_host_contract(
+        )).functions.updateTaskBlockTimeout(
             ipfsSha256=ipfs_sha256,
             newBlockTimeout=block_timeout
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_task_fee(
         self,
         ipfs_sha256: str,
-        fee: int
-    ) -> bool:
+        fee: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update the fee of the task for the host.
 
         Args:
             ipfs_sha256: ipfs sha256 of the task
             fee: fee of the task
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the update was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.updateTaskFee(
+        function = (yield self.get_host_contract(
+        )).functions.updateTaskFee(
             ipfsSha256=ipfs_sha256,
             newFee=fee
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def delete_task(
         self,
-        ipfs_sha256: str
-    ) -> bool:
+        ipfs_sha256: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Remove the task from the host.
 
         Args:
             ipfs_sha256: ipfs sha256 of the task
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the delete was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_host_contract(
-        ).functions.deleteTask(
+        function = (yield self.get_host_contract(
+        )).functions.deleteTask(
             ipfsSha256=ipfs_sha256
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address)
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
     # tower related functions
+    @pymeca.pymeca.io_steps
     def register_for_tower(
         self,
-        tower_address: str
-    ) -> bool:
+        tower_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register the host for a tower as pending host.
 
         Args:
             tower_address: tower address
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the register was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_tower_contract(
-        ).functions.registerMeForTower(
+        function = (yield self.get_tower_contract(
+        )).functions.registerMeForTower(
             towerAddress=tower_address
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(self.account.address),
-            "value": self.get_tower_host_request_fee()
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            value=(yield self.get_tower_host_request_fee()),
+            wait=wait
+        ))
 
     # schedule related functions
+    @pymeca.pymeca.io_steps
     def register_task_output(
         self,
         task_id: str,
-        output_hash: str
-    ) -> bool:
+        output_hash: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register the output of the task.
 
         Args:
             task_id : Task ID.
             output_hash: the hash of the output of the task
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the register was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_scheduler_contract(
-        ).functions.registerTaskOutput(
+        function = (yield self.get_scheduler_contract(
+        )).functions.registerTaskOutput(
             taskId=self._bytes_from_hex(task_id),
             outputHash=self._bytes_from_hex(output_hash)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def wrong_input_hash(
         self,
-        task_id: str
-    ) -> bool:
+        task_id: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register the wrong input hash of the task.
 
         Args:
             task_id : Task ID.
+            wait: if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool: if the register was successful
         """
-        if not self.is_registered():
+        if not (yield self.is_registered()):
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        transaction = self.get_scheduler_contract(
-        ).functions.wrongInputHash(
+        function = (yield self.get_scheduler_contract(
+        )).functions.wrongInputHash(
             taskId=self._bytes_from_hex(task_id)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def get_received_tasks(
-        self
+        self,
+        new_only: bool = False
     ) -> list:
         r"""
         Get all TaskSent events received by the host.
 
+        Args:
+            new_only : if True return only the events which are new
+                since the previous call
+
         Returns:
             list: A list of TaskSent events.
         """
+        if not (yield self.is_registered()):
+            raise pymeca.utils.MecaError(
+                "The host is not registered"
+            )
+        return (yield self.get_sent_tasks(
+            {'hostAddress': self.account.address.lower()},
+            new_only=new_only
+        ))
+
+
+class MecaHost(pymeca.pymeca.MecaActiveActor, MecaHostBase):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str,
+        dao_contract_address: str
+    ):
+        r"""
+        init the a meca host actor.
+
+        Args:
+            w3: web3 instance
+            private_key: private key of the host
+            dao_contract_address: dao contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
+        self.registered = None
+        r"""
+        If the host is registered in the ecosystem
+        """
+
+    def iter_received_tasks(
+        self,
+        from_block: int = None,
+        poll_interval: float = 1.0
+    ) -> typing.Iterator[dict]:
+        r"""
+        Yield the TaskSent events received by the host as the
+        new blocks arrive.
+
+        Args:
+            from_block : The first block to read (default the next
+                block)
+            poll_interval : The number of seconds between the reads
+                of the new blocks
+
+        Returns:
+            typing.Iterator[dict] : The TaskSent events
+        """
         if not self.is_registered():
             raise pymeca.utils.MecaError(
                 "The host is not registered"
             )
-        return super().get_sent_tasks({'hostAddress': self.account.address.lower()})
-        
+        yield from self.iter_events(
+            event_name="TaskSent",
+            argument_filters={'hostAddress': self.account.address.lower()},
+            from_block=from_block,
+            poll_interval=poll_interval
+        )
+
+
+class AsyncMecaHost(pymeca.pymeca.AsyncMecaActiveActor, MecaHostBase):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        dao_contract_address: str
+    ):
+        r"""
+        init the a meca host actor using an async web3 instance.
+
+        Args:
+            w3: web3 instance
+            private_key: private key of the host
+            dao_contract_address: dao contract address
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
+        self.registered = None
+        r"""
+        If the host is registered in the ecosystem
+        """
 
+    async def iter_received_tasks(
+        self,
+        from_block: int = None,
+        poll_interval: float = 1.0
+    ) -> typing.AsyncIterator[dict]:
+        r"""
+        Yield the TaskSent events received by the host as the
+        new blocks arrive.
+
+        Args:
+            from_block : The first block to read (default the next
+                block)
+            poll_interval : The number of seconds between the reads
+                of the new blocks
+
+        Returns:
+            typing.AsyncIterator[dict] : The TaskSent events
+        """
+        if not await self.is_registered():
+            raise pymeca.utils.MecaError(
+                "The host is not registered"
+            )
+        async for event in self.iter_events(
+            event_name="TaskSent",
+            argument_filters={'hostAddress': self.account.address.lower()},
+            from_block=from_block,
+            poll_interval=poll_interval
+        ):
+            yield event
@@ -0,0 +1,421 @@
+import logging
+import asyncio
+import numpy
+import web3
+import pymeca.utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+r"""
+The default number of eth_call of one JSON-RPC batch request
+"""
+
+_UINT64_MAX = 2 ** 64 - 1
+
+
+def values_array(
+    values: list[int],
+    shape: tuple[int, int]
+) -> numpy.ndarray:
+    r"""
+    Store the contract values in a uint64 array, or in an object
+    array if a value does not fit in 64 bits.
+
+    Args:
+        values : The values in the row-major order
+        shape : The shape of the array
+
+    Returns:
+        numpy.ndarray : The values
+    """
+    if all(0 <= value <= _UINT64_MAX for value in values):
+        dtype = numpy.uint64
+    else:
+        dtype = object
+    return numpy.array(values, dtype=dtype).reshape(shape)
+
+
+class HostTaskMatrix():
+    def __init__(
+        self,
+        block_number: int,
+        hosts: list[str],
+        tasks: list,
+        block_timeouts: numpy.ndarray,
+        fees: numpy.ndarray = None
+    ) -> None:
+        r"""
+        The host x task support matrix: the block timeout and the
+        fee of every (host, task) pair read at the same block. A
+        host supports a task if the block timeout is positive. The
+        queries per host or per task do not make any read.
+
+        Example:
+            matrix = actor.get_host_task_matrix()
+            tasks = matrix.get_host_tasks(host_address)
+            hosts = matrix.get_task_hosts(ipfs_sha256)
+
+        Args:
+            block_number : The block of the reads
+            hosts : The host addresses (rows)
+            tasks : The tasks (columns)
+            block_timeouts : The block timeouts (hosts x tasks)
+            fees : The fees (hosts x tasks) or None if they
+                were not read
+        """
+        self.block_number = block_number
+        self.hosts = hosts
+        self.tasks = tasks
+        self.block_timeouts = block_timeouts
+        self.fees = fees
+        self.host_index: dict[str, int] = {
+            host_address: index for index, host_address in enumerate(hosts)
+        }
+        r"""
+        The row of every host address
+        """
+        self.task_index: dict[str, int] = {
+            task["ipfsSha256"]: index for index, task in enumerate(tasks)
+        }
+        r"""
+        The column of every task ipfs sha256
+        """
+
+    @property
+    def supported(self) -> numpy.ndarray:
+        r"""
+        The boolean matrix of the (host, task) pairs which are
+        supported.
+        """
+        return self.block_timeouts > 0
+
+    def _row(
+        self,
+        host_address: str
+    ) -> int:
+        r"""
+        Get the row of a host, None if the host is not in the matrix.
+
+        Args:
+            host_address : The host address
+
+        Returns:
+            int : The row
+        """
+        return self.host_index.get(
+            web3.Web3.to_checksum_address(host_address)
+        )
+
+    def get_host_tasks(
+        self,
+        host_address: str
+    ) -> list:
+        r"""
+        Get the tasks a host can run.
+
+        Args:
+            host_address : The host address
+
+        Returns:
+            list : The tasks
+        """
+        row = self._row(host_address)
+        if row is None:
+            return []
+        return [
+            self.tasks[column]
+            for column in numpy.flatnonzero(self.block_timeouts[row] > 0)
+        ]
+
+    def get_task_hosts(
+        self,
+        ipfs_sha256: str
+    ) -> list[str]:
+        r"""
+        Get the hosts which can run a task.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list[str] : The host addresses
+        """
+        column = self.task_index.get(ipfs_sha256)
+        if column is None:
+            return []
+        return [
+            self.hosts[row]
+            for row in numpy.flatnonzero(self.block_timeouts[:, column] > 0)
+        ]
+
+    def get_block_timeout(
+        self,
+        host_address: str,
+        ipfs_sha256: str
+    ) -> int:
+        r"""
+        Get the block timeout of a task on a host.
+
+        Args:
+            host_address : The host address
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            int : The block timeout, 0 if not supported
+        """
+        row = self._row(host_address)
+        column = self.task_index.get(ipfs_sha256)
+        if row is None or column is None:
+            return 0
+        return int(self.block_timeouts[row, column])
+
+    def get_fee(
+        self,
+        host_address: str,
+        ipfs_sha256: str
+    ) -> int:
+        r"""
+        Get the fee of a task on a host.
+
+        Args:
+            host_address : The host address
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            int : The fee of the task on the host
+        """
+        if self.fees is None:
+            raise pymeca.utils.MecaError(
+                "The fees were not read in the matrix"
+            )
+        row = self._row(host_address)
+        column = self.task_index.get(ipfs_sha256)
+        if row is None or column is None:
+            return 0
+        return int(self.fees[row, column])
+
+
+def _pair_calls(
+    actor,
+    hosts: list[str],
+    tasks: list,
+    fees: bool
+) -> list[tuple[callable, dict]]:
+    r"""
+    Get the reads of the block timeout (and fee) of every
+    (host, task) pair in the row-major order.
+
+    Args:
+        actor : The active actor
+        hosts : The host addresses
+        tasks : The tasks
+        fees : if True the fees are read too
+
+    Returns:
+        list : list of (getter, kwargs)
+    """
+    getters = [actor.get_host_task_block_timeout]
+    if fees:
+        getters.append(actor.get_host_task_fee)
+    return [
+        (
+            getter,
+            {
+                "host_address": host_address,
+                "ipfs_sha256": task["ipfsSha256"]
+            }
+        )
+        for host_address in hosts
+        for task in tasks
+        for getter in getters
+    ]
+
+
+def _matrix_from_values(
+    block_number: int,
+    hosts: list[str],
+    tasks: list,
+    values: list[int],
+    fees: bool
+) -> HostTaskMatrix:
+    r"""
+    Make the matrix from the values of the _pair_calls reads.
+
+    Args:
+        block_number : The block of the reads
+        hosts : The host addresses
+        tasks : The tasks
+        values : The values of the reads
+        fees : if the fees were read
+
+    Returns:
+        HostTaskMatrix : The matrix
+    """
+    shape = (len(hosts), len(tasks))
+    step = 2 if fees else 1
+    return HostTaskMatrix(
+        block_number=block_number,
+        hosts=hosts,
+        tasks=tasks,
+        block_timeouts=values_array(values[0::step], shape),
+        fees=values_array(values[1::step], shape) if fees else None
+    )
+
+
+def _batch_values(
+    actor,
+    calls: list[tuple[callable, dict]],
+    block_number: int,
+    batch_size: int
+) -> list[int]:
+    r"""
+    Make the reads in batch requests of at most batch_size calls.
+    A reverted read is taken as 0 (not supported).
+
+    Args:
+        actor : The MecaActiveActor
+        calls : list of (getter, kwargs)
+        block_number : The block of the reads
+        batch_size : The maximum number of calls of a batch request
+
+    Returns:
+        list[int] : The values
+    """
+    values = []
+    for start in range(0, len(calls), batch_size):
+        batch = actor.batch(block_identifier=block_number)
+        results = [
+            batch.add(getter, **kwargs)
+            for getter, kwargs in calls[start:start + batch_size]
+        ]
+        batch.send()
+        for result in results:
+            try:
+                values.append(result.result())
+            except web3.exceptions.ContractLogicError:
+                values.append(0)
+    return values
+
+
+def get_host_task_matrix(
+    actor,
+    host_addresses: list[str] = None,
+    fees: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> HostTaskMatrix:
+    r"""
+    Read the host x task support matrix with batch requests
+    pinned to the current block.
+
+    Args:
+        actor : The MecaActiveActor used for the reads
+        host_addresses : The hosts (default all the registered hosts)
+        fees : if True the fees are read too
+        batch_size : The maximum number of calls of a batch request
+
+    Returns:
+        HostTaskMatrix : The matrix
+    """
+    if batch_size <= 0:
+        raise pymeca.utils.MecaError(
+            "The batch size must be positive"
+        )
+    block_number = actor.w3.eth.block_number
+    if host_addresses is None:
+        tasks, hosts = actor.batch_call(
+            [(actor.get_tasks, {}), (actor.get_hosts, {})],
+            block_identifier=block_number
+        )
+        host_addresses = [host["owner"] for host in hosts]
+    else:
+        tasks = actor.batch_call(
+            [(actor.get_tasks, {})],
+            block_identifier=block_number
+        )[0]
+    host_addresses = [
+        web3.Web3.to_checksum_address(host_address)
+        for host_address in host_addresses
+    ]
+    values = _batch_values(
+        actor=actor,
+        calls=_pair_calls(actor, host_addresses, tasks, fees),
+        block_number=block_number,
+        batch_size=batch_size
+    )
+    logger.debug(
+        f"Host task matrix of {len(host_addresses)} hosts and "
+        f"{len(tasks)} tasks at block {block_number}"
+    )
+    return _matrix_from_values(
+        block_number, host_addresses, tasks, values, fees
+    )
+
+
+async def _gather_value(
+    getter: callable,
+    kwargs: dict
+) -> int:
+    r"""
+    Make an async read, a reverted read is taken as 0.
+
+    Args:
+        getter : The async getter
+        kwargs : The getter arguments
+
+    Returns:
+        int : The value
+    """
+    try:
+        return await getter(**kwargs)
+    except web3.exceptions.ContractLogicError:
+        return 0
+
+
+async def async_get_host_task_matrix(
+    actor,
+    host_addresses: list[str] = None,
+    fees: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> HostTaskMatrix:
+    r"""
+    Read the host x task support matrix with concurrent reads
+    pinned to the current block, at most batch_size at a time.
+
+    Args:
+        actor : The AsyncMecaActiveActor used for the reads
+        host_addresses : The hosts (default all the registered hosts)
+        fees : if True the fees are read too
+        batch_size : The maximum number of concurrent reads
+
+    Returns:
+        HostTaskMatrix : The matrix
+    """
+    if batch_size <= 0:
+        raise pymeca.utils.MecaError(
+            "The batch size must be positive"
+        )
+    block_number = await actor.w3.eth.block_number
+    with actor.at_block(block_number):
+        if host_addresses is None:
+            tasks, hosts = await asyncio.gather(
+                actor.get_tasks(),
+                actor.get_hosts()
+            )
+            host_addresses = [host["owner"] for host in hosts]
+        else:
+            tasks = await actor.get_tasks()
+        host_addresses = [
+            web3.Web3.to_checksum_address(host_address)
+            for host_address in host_addresses
+        ]
+        calls = _pair_calls(actor, host_addresses, tasks, fees)
+        values = []
+        for start in range(0, len(calls), batch_size):
+            values.extend(await asyncio.gather(*[
+                _gather_value(getter, kwargs)
+                for getter, kwargs in calls[start:start + batch_size]
+            ]))
+    return _matrix_from_values(
+        block_number, host_addresses, tasks, values, fees
+    )
@@ -0,0 +1,190 @@
+import logging
+import asyncio
+import threading
+import weakref
+import web3
+
+logger = logging.getLogger(__name__)
+
+# the constructor constants of the MECA contracts
+PARAMETER_NAMES = {
+    "scheduler": [
+        "SCHEDULER_FEE"
+    ],
+    "host": [
+        "HOST_REGISTER_FEE",
+        "TASK_REGISTER_FEE",
+        "HOST_INITIAL_STAKE",
+        "FAILED_TASK_PENALTY"
+    ],
+    "tower": [
+        "TOWER_INITIAL_STAKE",
+        "FAILED_TASK_PENALTY",
+        "HOST_REQUEST_FEE"
+    ],
+    "task": [
+        "TASK_ADDITION_FEE"
+    ]
+}
+
+
+class ProtocolParameters():
+    def __init__(self) -> None:
+        r"""
+        The constant fees, stakes and penalties of the MECA contracts.
+        The constants of a contract are loaded with one batched fetch
+        and kept until the address of the contract changes. It is
+        shared by all the actors of the same DAO.
+        """
+        self.fetches: int = 0
+        r"""
+        The number of batched fetches of the constants
+        """
+        self._parameters: dict[str, tuple[str, dict]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(
+        self,
+        contract_type: str,
+        contract_address: str
+    ) -> dict:
+        r"""
+        Get the cached constants of a contract.
+
+        Args:
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+            contract_address : The current address of the contract
+
+        Returns:
+            dict : The constants or None if the contract changed
+        """
+        with self._lock:
+            cached = self._parameters.get(contract_type)
+        if cached is None or cached[0] != contract_address:
+            return None
+        return cached[1]
+
+    def _store(
+        self,
+        contract_type: str,
+        contract_address: str,
+        values: list
+    ) -> dict:
+        r"""
+        Cache the constants of a contract.
+
+        Args:
+            contract_type : The contract type
+            contract_address : The address of the contract
+            values : The values in the order of PARAMETER_NAMES
+
+        Returns:
+            dict : The constants
+        """
+        parameters = dict(zip(PARAMETER_NAMES[contract_type], values))
+        with self._lock:
+            self._parameters[contract_type] = (contract_address, parameters)
+            self.fetches += 1
+        logger.debug(
+            f"Loaded the {contract_type} parameters of {contract_address}"
+        )
+        return parameters
+
+    def get(
+        self,
+        actor,
+        contract_type: str
+    ) -> dict:
+        r"""
+        Get the constants of a contract, loading them in one batch
+        request if the contract is new.
+
+        Args:
+            actor : The MecaActiveActor used for the reads
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+
+        Returns:
+            dict : The constants by name
+        """
+        contract = actor._get_contract(contract_type)
+        parameters = self._cached(contract_type, contract.address)
+        if parameters is not None:
+            return parameters
+        batch = actor.batch()
+        for name in PARAMETER_NAMES[contract_type]:
+            batch.add(
+                lambda name=name: actor._call(contract.functions[name]())
+            )
+        return self._store(
+            contract_type=contract_type,
+            contract_address=contract.address,
+            values=batch.execute()
+        )
+
+    async def async_get(
+        self,
+        actor,
+        contract_type: str
+    ) -> dict:
+        r"""
+        Get the constants of a contract with an async actor, loading
+        them with concurrent reads if the contract is new.
+
+        Args:
+            actor : The AsyncMecaActiveActor used for the reads
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+
+        Returns:
+            dict : The constants by name
+        """
+        contract = await actor._get_contract(contract_type)
+        parameters = self._cached(contract_type, contract.address)
+        if parameters is not None:
+            return parameters
+        values = await asyncio.gather(*[
+            contract.functions[name]().call()
+            for name in PARAMETER_NAMES[contract_type]
+        ])
+        return self._store(
+            contract_type=contract_type,
+            contract_address=contract.address,
+            values=values
+        )
+
+    def invalidate(self) -> None:
+        r"""
+        Forget all the constants, they are loaded again when needed.
+        """
+        with self._lock:
+            self._parameters = {}
+
+
+_protocol_parameters = weakref.WeakKeyDictionary()
+_protocol_parameters_lock = threading.Lock()
+
+
+def get_protocol_parameters(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    dao_contract_address: str
+) -> ProtocolParameters:
+    r"""
+    Get the protocol parameters of a DAO on the provider of the
+    web3 instance. All the actors of the same DAO and provider share
+    them. They are kept by provider object, not by endpoint uri, so
+    a restarted chain behind the same uri is read again.
+
+    Args:
+        w3 : web3 instance
+        dao_contract_address : The DAO contract address
+
+    Returns:
+        ProtocolParameters : The protocol parameters
+    """
+    with _protocol_parameters_lock:
+        parameters = _protocol_parameters.setdefault(w3.provider, {})
+        if dao_contract_address not in parameters:
+            parameters[dao_contract_address] = ProtocolParameters()
+        return parameters[dao_contract_address]
@@ -1,10 +1,113 @@
 import logging
+import time
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import typing
 from eth_account import Account
 import web3
 import pymeca.utils
+import pymeca.records
+import pymeca.transaction
+import pymeca.cache
+import pymeca.events
+import pymeca.parameters
+import pymeca.graph
+import pymeca.matrix
+import pymeca.snapshot
+import pymeca.candidates
 
 logger = logging.getLogger(__name__)
 
+# the generation of the contracts of every (blockchain, DAO or
+# scheduler contract address), incremented every time a contract owner
+# changes them, the active actors resolve again their contracts
+_contracts_generations: dict[tuple, int] = {}
+
+
+def _contracts_key(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    contract_address: str
+) -> tuple:
+    r"""
+    Get the key of the contracts generation of a DAO or
+    scheduler contract.
+
+    Args:
+        w3 : web3 instance (sync or async)
+        contract_address : The DAO or scheduler contract address
+
+    Returns:
+        tuple : The (blockchain, contract address) key
+    """
+    return (pymeca.utils.provider_key(w3), contract_address)
+
+
+def invalidate_contracts_cache(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    contract_address: str
+) -> None:
+    r"""
+    Invalidate the cached contracts of the active actors which
+    use a DAO or scheduler contract. It is called after a transaction
+    which changes the scheduler of the DAO or the host/tower/task
+    contracts of the scheduler.
+
+    Args:
+        w3 : web3 instance (sync or async)
+        contract_address : The DAO or scheduler contract address
+    """
+    key = _contracts_key(w3, contract_address)
+    _contracts_generations[key] = _contracts_generations.get(key, 0) + 1
+
+
+def contracts_generation(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    contracts_addresses: list[str]
+) -> tuple[int, ...]:
+    r"""
+    Get the generation of the contracts resolved from a DAO
+    and its scheduler.
+
+    Args:
+        w3 : web3 instance (sync or async)
+        contracts_addresses : The DAO and scheduler contract addresses
+
+    Returns:
+        tuple[int, ...] : The generation of every contract address
+    """
+    return tuple(
+        _contracts_generations.get(_contracts_key(w3, contract_address), 0)
+        for contract_address in contracts_addresses
+    )
+
+
+def io_steps(
+    method: callable
+) -> callable:
+    r"""
+    Decorate a method written once for the sync and async actors.
+    The method is a generator which yields the reads and the
+    transactions of the actor and gets back their results, ex:
+        stake = yield self.get_host_stake(host_address=address)
+    The sync actors run it with the values of the calls and return
+    the result, the async actors with the awaited values and return
+    a coroutine (see MecaActor._run and AsyncMecaActor._run).
+
+    Args:
+        method : The generator method
+
+    Returns:
+        callable : The method of the actor
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._run(method(self, *args, **kwargs))
+    return wrapper
+
 
 class MecaActor():
     def __init__(
@@ -22,6 +125,83 @@ class MecaActor():
         self.w3 = w3
         self.private_key = private_key
         self.account = Account.from_key(private_key)
+        self.nonce_manager = pymeca.transaction.get_nonce_manager(
+            w3=w3,
+            address=self.account.address
+        )
+        r"""
+        The local nonce allocator of the account
+        """
+
+    def _run(
+        self,
+        steps: typing.Generator
+    ):
+        r"""
+        Run the steps of an io_steps method. The results of the
+        calls are already the values.
+
+        Args:
+            steps : The generator of the method
+
+        Returns:
+            The result of the method
+        """
+        try:
+            value = next(steps)
+            while True:
+                value = steps.send(value)
+        except StopIteration as e:
+            return e.value
+
+    def _gather(
+        self,
+        *values
+    ) -> list:
+        r"""
+        Get the results of independent calls of an io_steps method.
+        The sync calls are already made.
+
+        Args:
+            values : The results of the calls
+
+        Returns:
+            list : The results
+        """
+        return list(values)
+
+    def _send_transaction(
+        self,
+        transaction: dict
+    ) -> bytes:
+        r"""
+        Sign and send the given transaction without waiting for it.
+        The nonce of the account is resynced if the sending fails.
+
+        Args:
+            transaction : transaction
+
+        Returns:
+            bytes : The transaction hash
+        """
+        try:
+            # verify the balance
+            account_balance = self.w3.eth.get_balance(self.account.address)
+            if account_balance < (
+                transaction["gas"] * self.w3.eth.gas_price
+            ):
+                raise ValueError(
+                    "Insufficient balance"
+                )
+            singed_transaction = self.w3.eth.account.sign_transaction(
+                transaction, self.private_key
+            )
+            return self.w3.eth.send_raw_transaction(
+                singed_transaction.rawTransaction
+            )
+        except Exception:
+            self.nonce_manager.resync()
+            raise
 
     def _execute_transaction(
         self,
@@ -32,19 +212,80 @@ class MecaActor():
 
         Args:
             transaction : transaction
+
+        Returns:
+            web3.datastructures.AttributeDict : The transaction receipt,
+                also if the transaction is reverted
         """
-        # verify the balance
-        account_balance = self.w3.eth.get_balance(self.account.address)
-        if account_balance < (transaction["gas"] * self.w3.eth.gas_price):
-            raise ValueError(
-                "Insufficient balance"
-            )
+        # the nonce of the transaction is not allocated by the manager
+        future = pymeca.transaction.TransactionFuture(
+            w3=self.w3,
+            tx_hash=self._send_transaction(transaction),
+            on_receipt=self._on_receipt
+        )
+        pymeca.transaction.get_receipt_poller(self.w3).watch(future)
+        return future.receipt()
+
+    def _on_receipt(
+        self,
+        tx_receipt: web3.datastructures.AttributeDict
+    ) -> None:
+        r"""
+        Called with the receipt of every transaction of the actor
+        before its future is resolved.
+
+        Args:
+            tx_receipt : The transaction receipt
+        """
+        pass
+
+    def _transact(
+        self,
+        function: web3.contract.contract.ContractFunction,
+        value: int = None,
+        wait: bool = True,
+        transform: callable = None
+    ):
+        r"""
+        Build, sign and send a contract transaction using a nonce
+        allocated locally, so many transactions of the account
+        can be in flight at the same time.
 
-        return pymeca.utils.sign_send_wait_transaction(
+        Args:
+            function : The contract function to transact
+            value : The value sent with the transaction (Wei)
+            wait : If True wait for the transaction to be mined
+            transform : Function to transform the receipt in the result
+                (default the success status of the transaction)
+
+        Returns:
+            The result of the transaction if wait is True,
+            otherwise the TransactionFuture
+        """
+        transaction_params = {
+            "from": self.account.address,
+            "nonce": self.nonce_manager.allocate(self.w3)
+        }
+        if value is not None:
+            transaction_params["value"] = value
+        try:
+            transaction = function.build_transaction(transaction_params)
+            tx_hash = self._send_transaction(transaction)
+        except Exception:
+            self.nonce_manager.release(resync=True)
+            raise
+
+        future = pymeca.transaction.TransactionFuture(
             w3=self.w3,
-            transaction=transaction,
-            private_key=self.private_key
+            tx_hash=tx_hash,
+            nonce_manager=self.nonce_manager,
+            transform=transform,
+            on_receipt=self._on_receipt
         )
+        pymeca.transaction.get_receipt_poller(self.w3).watch(future)
+        if wait:
+            return future.result()
+        return future
 
     def sign_bytes(
         self,
@@ -64,18 +305,218 @@ class MecaActor():
             message_bytes=bytes_to_sign
         )
     
+
+class AsyncMecaActor():
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str
+    ) -> None:
+        r"""
+        Meca Actor using an async web3 instance. The transaction
+        methods of the derived classes are coroutines.
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key
+        """
+        self.w3 = w3
+        self.private_key = private_key
+        self.account = Account.from_key(private_key)
+        self.nonce_manager = pymeca.transaction.get_nonce_manager(
+            w3=w3,
+            address=self.account.address
+        )
+        r"""
+        The local nonce allocator of the account
+        """
+
+    async def _run(
+        self,
+        steps: typing.Generator
+    ):
+        r"""
+        Run the steps of an io_steps method, awaiting the results
+        of the calls. The errors are raised in the steps.
+
+        Args:
+            steps : The generator of the method
+
+        Returns:
+            The result of the method
+        """
+        try:
+            step = next(steps)
+            while True:
+                try:
+                    value = await step if inspect.isawaitable(step) else step
+                except Exception as e:
+                    step = steps.throw(e)
+                else:
+                    step = steps.send(value)
+        except StopIteration as e:
+            return e.value
+
+    def _gather(
+        self,
+        *awaitables
+    ) -> asyncio.Future:
+        r"""
+        Make independent calls of an io_steps method concurrently.
+
+        Args:
+            awaitables : The calls
+
+        Returns:
+            asyncio.Future : The future of the list of results
+        """
+        return asyncio.gather(*awaitables)
+
+    async def _execute_transaction(
+        self,
+        transaction: dict
+    ) -> web3.datastructures.AttributeDict:
+        r"""
+        Execute the given transaction. The nonce of the account is
+        resynced if the sending fails or the transaction is reverted.
+
+        Args:
+            transaction : transaction
+
+        Returns:
+            web3.datastructures.AttributeDict : The transaction receipt,
+                also if the transaction is reverted
+        """
+        try:
+            # verify the balance
+            account_balance = await self.w3.eth.get_balance(
+                self.account.address
+            )
+            gas_price = await self.w3.eth.gas_price
+            if account_balance < (transaction["gas"] * gas_price):
+                raise ValueError(
+                    "Insufficient balance"
+                )
+            singed_transaction = self.w3.eth.account.sign_transaction(
+                transaction, self.private_key
+            )
+            tx_hash = await self.w3.eth.send_raw_transaction(
+                singed_transaction.rawTransaction
+            )
+            tx_receipt = await self.w3.eth.wait_for_transaction_receipt(
+                tx_hash
+            )
+        except Exception:
+            self.nonce_manager.resync()
+            raise
+        if tx_receipt.status != 1:
+            self.nonce_manager.resync()
+        return tx_receipt
+
+    async def _transact(
+        self,
+        function: web3.contract.async_contract.AsyncContractFunction,
+        value: int = None,
+        wait: bool = True,
+        transform: callable = None
+    ):
+        r"""
+        Build, sign, send and wait a contract transaction using
+        a nonce allocated locally, so many transactions of the
+        account can be gathered.
+
+        Args:
+            function : The contract function to transact
+            value : The value sent with the transaction (Wei)
+            wait : If True wait for the transaction to be mined
+            transform : Function to transform the receipt in the result
+                (default the success status of the transaction)
+
+        Returns:
+            The result of the transaction if wait is True, otherwise
+            the asyncio.Task of the result (the nonce is already
+            allocated)
+        """
+        transaction_params = {
+            "from": self.account.address,
+            "nonce": await self.nonce_manager.async_allocate(self.w3)
+        }
+        if value is not None:
+            transaction_params["value"] = value
+        try:
+            transaction = await function.build_transaction(
+                transaction_params
+            )
+        except Exception:
+            self.nonce_manager.release(resync=True)
+            raise
+
+        if wait:
+            return await self._execute_transact(
+                transaction=transaction,
+                transform=transform
+            )
+        return asyncio.ensure_future(self._execute_transact(
+            transaction=transaction,
+            transform=transform
+        ))
+
+    async def _execute_transact(
+        self,
+        transaction: dict,
+        transform: callable = None
+    ):
+        r"""
+        Execute a built transaction and transform its receipt.
+        The allocated nonce of the transaction is released.
+
+        Args:
+            transaction : transaction
+            transform : Function to transform the receipt in the result
+                (default the success status of the transaction)
+
+        Returns:
+            The result of the transaction
+        """
+        try:
+            tx_receipt = await self._execute_transaction(transaction)
+        finally:
+            self.nonce_manager.release()
+        if transform is None:
+            return tx_receipt.status == 1
+        return transform(tx_receipt)
+
+    def sign_bytes(
+        self,
+        bytes_to_sign: bytes
+    ) -> bytes:
+        r"""
+        Sign the given bytes
+
+        Args:
+            bytes_to_sign : bytes
+
+        Returns:
+            bytes : The signature
+        """
+        return pymeca.utils.sign_bytes(
+            private_key=self.private_key,
+            message_bytes=bytes_to_sign
+        )
+
+
 def task_from_tuple(
     task_tuple: tuple
-) -> dict:
+) -> pymeca.records.Task:
     r"""
     Transform task tuple from the web3 result in
-    a dictionary
+    a task record
 
     Args:
         task_tuple : task tuple
 
     Returns:
-        task : task dictionary
+        task : task record
         {
             "ipfsSha256"
             "owner"
@@ -84,27 +525,27 @@ def task_from_tuple(
             "size"
         }
     """
-    return {
-        "ipfsSha256": "0x" + task_tuple[0].hex().strip(),
-        "owner": task_tuple[1],
-        "fee": task_tuple[2],
-        "computingType": task_tuple[3],
-        "size": task_tuple[4]
-    }
+    return pymeca.records.Task(
+        ipfs_sha256_bytes=task_tuple[0],
+        owner=task_tuple[1],
+        fee=task_tuple[2],
+        computing_type=task_tuple[3],
+        size=task_tuple[4]
+    )
 
 
 def running_task_fee_from_tuple(
     running_task_fee_tuple: tuple
-) -> dict:
+) -> pymeca.records.RunningTaskFee:
     r"""
     Transform a running task fee tuple from the web3 result in
-    a dictionary
+    a running task fee record
 
     Args:
         running_task_fee_tuple : The fee of a runing task
 
     Returns:
-        running_task_fee : running task fee dictionary
+        running_task_fee : running task fee record
         {
             "tower"
             "host"
@@ -113,27 +554,27 @@ def running_task_fee_from_tuple(
             "insurance"
         }
     """
-    return {
-        "tower": running_task_fee_tuple[0],
-        "host": running_task_fee_tuple[1],
-        "scheduler": running_task_fee_tuple[2],
-        "task": running_task_fee_tuple[3],
-        "insurance": running_task_fee_tuple[4]
-    }
+    return pymeca.records.RunningTaskFee(
+        tower=running_task_fee_tuple[0],
+        host=running_task_fee_tuple[1],
+        scheduler=running_task_fee_tuple[2],
+        task=running_task_fee_tuple[3],
+        insurance=running_task_fee_tuple[4]
+    )
 
 
 def running_task_from_tuple(
     running_task_tuple: tuple
-) -> dict:
+) -> pymeca.records.RunningTask:
     r"""
     Transform a running task tuple from the web3 result in
-    a dictionary
+    a running task record
 
     Args:
         running_task_tuple : running task tuple
 
     Returns:
-        running_task : running task dictionary
+        running_task : running task record
         {
             "ipfsSha256"
             "inputHash"
@@ -148,55 +589,73 @@ def running_task_from_tuple(
         }
     """
     # raise ValueError(running_task_tuple)
-    return {
-        "ipfsSha256": "0x" + running_task_tuple[0].hex().strip(),
-        "inputHash": "0x" + running_task_tuple[1].hex().strip(),
-        "outputHash": "0x" + running_task_tuple[2].hex().strip(),
-        "size": running_task_tuple[3],
-        "towerAddress": running_task_tuple[4],
-        "hostAddress": running_task_tuple[5],
-        "owner": running_task_tuple[6],
-        "startBlock": running_task_tuple[7],
-        "blockTimeout": running_task_tuple[8],
-        "fee": running_task_fee_from_tuple(running_task_tuple[9])
-    }
+    return pymeca.records.RunningTask(
+        ipfs_sha256_bytes=running_task_tuple[0],
+        input_hash_bytes=running_task_tuple[1],
+        output_hash_bytes=running_task_tuple[2],
+        size=running_task_tuple[3],
+        tower_address=running_task_tuple[4],
+        host_address=running_task_tuple[5],
+        owner=running_task_tuple[6],
+        start_block=running_task_tuple[7],
+        block_timeout=running_task_tuple[8],
+        fee=running_task_fee_from_tuple(running_task_tuple[9])
+    )
 
 
 def tee_task_from_tuple(
     tee_task_tuple: tuple
-) -> dict:
+) -> pymeca.records.TeeTask:
     r"""
     Transform a tee task tuple from the web3 result in
-    a dictionary
+    a tee task record
 
     Args:
         tee_task_tuple : tee task tuple
 
     Returns:
-        tee_task : tee task dictionary
+        tee_task : tee task record
         {
             "encryptedInputHash"
             "initialInputHash"
         }
     """
-    return {
-        "encryptedInputHash": "0x" + tee_task_tuple[0].hex().strip(),
-        "initialInputHash": "0x" + tee_task_tuple[1].hex().strip(),
-    }
+    return pymeca.records.TeeTask(
+        encrypted_input_hash_bytes=tee_task_tuple[0],
+        initial_input_hash_bytes=tee_task_tuple[1]
+    )
+
+
+def public_key_from_bytes_array(
+    bytes_array: list[bytes]
+) -> str:
+    r"""
+    Get the hex public key from the bytes32 array of the
+    host contract.
+
+    Args:
+        bytes_array : The bytes32 array of the public key
+
+    Returns:
+        str : The public key starting with 0x
+    """
+    return "0x" + "".join([
+        x.hex().strip() for x in bytes_array
+    ])
 
 
 def host_from_tuple(
     host_tuple: tuple
-) -> dict:
+) -> pymeca.records.Host:
     r"""
     Transform a host tuple from the web3 result in
-    a dictionary
+    a host record
 
     Args:
         host_tuple : host tuple
 
     Returns:
-        host : host dictionary
+        host : host record
         {
             "owner"
             "eccPublicKey"
@@ -204,28 +663,26 @@ def host_from_tuple(
             "stake"
         }
     """
-    return {
-        "owner": host_tuple[0],
-        "eccPublicKey": "0x" + "".join([
-            x.hex().strip() for x in host_tuple[1]
-        ]),
-        "blockTimeoutLimit": host_tuple[2],
-        "stake": host_tuple[3]
-    }
+    return pymeca.records.Host(
+        owner=host_tuple[0],
+        public_key_bytes=tuple(host_tuple[1]),
+        block_timeout_limit=host_tuple[2],
+        stake=host_tuple[3]
+    )
 
 
 def tower_from_tuple(
     tower_tuple: tuple
-) -> dict:
+) -> pymeca.records.Tower:
     r"""
     Transform a tower tuple from the web3 result in
-    a dictionary
+    a tower record
 
     Args:
         tower_tuple : tower tuple
 
     Returns:
-        tower : tower dictionary
+        tower : tower record
         {
             "owner"
             "sizeLimit"
@@ -235,127 +692,419 @@ def tower_from_tuple(
             "stake"
         }
     """
-    return {
-        "owner": tower_tuple[0],
-        "sizeLimit": tower_tuple[1],
-        "publicConnection": tower_tuple[2],
-        "feeType": tower_tuple[3],
-        "fee": tower_tuple[4],
-        "stake": tower_tuple[5]
-    }
+    return pymeca.records.Tower(
+        owner=tower_tuple[0],
+        size_limit=tower_tuple[1],
+        public_connection=tower_tuple[2],
+        fee_type=tower_tuple[3],
+        fee=tower_tuple[4],
+        stake=tower_tuple[5]
+    )
 
 
-class MecaActiveActor(MecaActor):
+class BatchResult():
     def __init__(
         self,
-        w3: web3.Web3,
-        private_key: str,
-        dao_contract_address: str
+        function: web3.contract.contract.ContractFunction,
+        decode: callable = None
     ) -> None:
         r"""
-        Meca Active Actor which is interacting with the blockchain
-        as a getter for infromation. Specific functions for diiferent
-        type of actors are implemented in the derived classes.
+        The result of a contract read which is part of a batch.
+        The value is available after the batch is executed.
 
         Args:
-            w3 : web3 instance
-            private_key : private key
-            dao_contract_address : The DAO contract address
+            function : The contract function to call
+            decode : Function to transform the call result
         """
-        super().__init__(w3=w3, private_key=private_key)
+        self.function = function
+        self.decode = decode
+        self._done = False
+        self._value = None
+        self._error = None
 
-        # get the dao contract
-        self.dao_contract = self.w3.eth.contract(
-            address=dao_contract_address,
-            abi=pymeca.utils.MECA_DAO_ABI
-        )
-        """
-        The DAO contract used to interact with the blockchain
-        ecosystem
-        """
-        self.task_finished_events_filter = None
-        """
-        TaskFinished event filter
-        """
-        self.task_sent_events_filter = None
-        """
-        TaskSent event filter
+    def done(self) -> bool:
+        r"""
+        Check if the batch of the result was executed
+
+        Returns:
+            bool : True if the result is available
         """
+        return self._done
 
-    # helper functions
-    def _bytes_from_hex(
+    def set_response(
         self,
-        hex_string: str
-    ) -> bytes:
+        w3: web3.Web3,
+        response: dict
+    ) -> None:
         r"""
-        Convert a hex string to bytes. Usseful for making
-        the input for bytesX in the smart contracts
+        Set the result from the JSON-RPC response
 
         Args:
-            hex_string : hex string
-
-        Returns:
-            bytes : bytes
+            w3 : web3 instance
+            response : The JSON-RPC response of the eth_call
         """
-        if hex_string.startswith("0x"):
-            hex_string = hex_string[2:]
-        return bytes.fromhex(hex_string)
+        self._done = True
+        if "error" in response:
+            error = response["error"]
+            message = (
+                error.get("message", str(error))
+                if isinstance(error, dict)
+                else str(error)
+            )
+            if "revert" in message.lower():
+                self._error = web3.exceptions.ContractLogicError(message)
+            else:
+                self._error = pymeca.utils.MecaError(
+                    f"Batch call {self.function.fn_name} failed: {message}"
+                )
+            return
+        try:
+            value = pymeca.utils.decode_function_result(
+                w3=w3,
+                function=self.function,
+                return_data=response["result"]
+            )
+            self._value = self.decode(value) if self.decode else value
+        except Exception as e:
+            self._error = e
 
-    # dao contract functions
-    def get_scheduler_contract_address(self) -> str:
+    def result(self):
         r"""
-        Get the scheduler contract address
+        Get the value of the call
 
         Returns:
-            str : The scheduler contract address
+            The decoded value of the call
         """
-        return self.dao_contract.functions.getSchedulerContract().call()
+        if not self._done:
+            raise pymeca.utils.MecaError(
+                "The batch was not executed yet"
+            )
+        if self._error is not None:
+            raise self._error
+        return self._value
 
-    def get_scheduler_contract(self) -> web3.contract.Contract:
+
+class MecaBatch():
+    def __init__(
+        self,
+        actor: "MecaActiveActor",
+        block_identifier: int | str = None
+    ) -> None:
         r"""
-        Get the scheduler contract
+        A batch of contract reads which are sent as one
+        JSON-RPC batch request.
 
-        Returns:
-            web3.contract.Contract : The scheduler contract
+        Args:
+            actor : The actor which makes the reads
+            block_identifier : The block for all the reads
+                (default latest)
         """
-        return self.w3.eth.contract(
-            address=self.get_scheduler_contract_address(),
-            abi=pymeca.utils.MECA_SCHEDULER_ABI
-        )
-
-    # scheduler contract functions
-    def get_scheduler_flag(self) -> bool:
+        self.actor = actor
+        self.block_identifier = block_identifier
+        self.results: list[BatchResult] = []
+        self.executed = False
+        self.rpc_requests: int = 0
         r"""
-        Get the scheduler flag
-
-        Returns:
-            bool : The scheduler flag
+        The number of JSON-RPC requests sent for the batch
         """
-        return self.get_scheduler_contract(
-        ).functions.schedulerFlag().call()
 
-    def get_tower_contract_address(self) -> str:
+    def add(
+        self,
+        getter: callable,
+        *args,
+        **kwargs
+    ) -> BatchResult:
         r"""
-        Get the tower contract address
+        Add a getter of the actor to the batch. The getter
+        has to make exactly one contract read.
+
+        Args:
+            getter : The actor getter (ex: actor.get_tower_fee)
+            args : The getter arguments
+            kwargs : The getter keyword arguments
 
         Returns:
-            str : The tower contract address
+            BatchResult : The result available after execution
         """
-        return self.get_scheduler_contract(
-        ).functions.getTowerContract().call()
+        if self.executed:
+            raise pymeca.utils.MecaError(
+                "The batch was already executed"
+            )
+        self.actor._batch_collector = []
+        try:
+            getter(*args, **kwargs)
+            collected = self.actor._batch_collector
+        except Exception as e:
+            raise pymeca.utils.MecaError(
+                f"The getter {getter.__name__} can not be batched: {e}"
+            ) from e
+        finally:
+            self.actor._batch_collector = None
+        if len(collected) != 1:
+            raise pymeca.utils.MecaError(
+                f"The getter {getter.__name__} can not be batched"
+            )
+        self.results.append(collected[0])
+        return collected[0]
 
-    def get_tower_contract(self) -> web3.contract.Contract:
+    def send(self) -> None:
         r"""
-        Get the tower contract
-
-        Returns:
-            web3.contract.Contract : The tower contract
+        Send the batch request and set the results. The errors
+        of the calls are raised by the BatchResult.result.
         """
-        return self.w3.eth.contract(
-            address=self.get_tower_contract_address(),
-            abi=pymeca.utils.MECA_TOWER_ABI
+        if self.executed:
+            raise pymeca.utils.MecaError(
+                "The batch was already executed"
+            )
+        self.executed = True
+        block_param = pymeca.utils.block_identifier_param(
+            self.block_identifier
+        )
+        responses, self.rpc_requests = pymeca.utils.make_batch_request(
+            w3=self.actor.w3,
+            requests=[
+                (
+                    "eth_call",
+                    [
+                        pymeca.utils.encode_function_call(
+                            batch_result.function
+                        ),
+                        block_param
+                    ]
+                )
+                for batch_result in self.results
+            ]
+        )
+        for batch_result, response in zip(self.results, responses):
+            batch_result.set_response(self.actor.w3, response)
+
+    def execute(self) -> list:
+        r"""
+        Send the batch request and get the values.
+
+        Returns:
+            list : The values of the calls in the order they were added
+        """
+        self.send()
+        return [batch_result.result() for batch_result in self.results]
+
+    def __enter__(self) -> "MecaBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None and not self.executed:
+            self.send()
+
+
+class MecaActiveActorBase():
+    r"""
+    The getters of the active actors written once for the
+    MecaActiveActor and the AsyncMecaActiveActor. Only the I/O
+    (_call, _run, _parameter, refresh_contracts, ...) is implemented
+    by the sync and async classes, so the getters return the value
+    for a MecaActiveActor and an awaitable for an AsyncMecaActiveActor.
+    """
+
+    def __init__(
+        self,
+        dao_contract_address: str,
+        contracts_refresh_blocks: int = None,
+        event_store: pymeca.events.EventStore = None
+    ) -> None:
+        r"""
+        Set the state shared by the sync and async active actors.
+        The web3 instance of the actor has to be set before.
+
+        Args:
+            dao_contract_address : The DAO contract address
+            contracts_refresh_blocks : The number of blocks after which
+                the cached scheduler/host/tower/task contracts are
+                resolved again from the DAO
+            event_store : The persistent index of the scheduler events
+        """
+        # get the dao contract
+        self.dao_contract = self.w3.eth.contract(
+            address=dao_contract_address,
+            abi=pymeca.utils.MECA_DAO_ABI
+        )
+        """
+        The DAO contract used to interact with the blockchain
+        ecosystem
+        """
+        self.event_readers: dict[tuple, pymeca.events.EventReader] = {}
+        """
+        The incremental readers of the scheduler events
+        """
+        self.events_chunk_size = pymeca.events.DEFAULT_CHUNK_SIZE
+        """
+        The maximum number of blocks of one eth_getLogs request
+        """
+        self.event_store = event_store
+        """
+        The persistent index of the scheduler events (opt-in)
+        """
+        self._event_store_blocks: dict[tuple, int] = {}
+        self._registry_indexes: dict[str, tuple[tuple, dict]] = {}
+        self.tower_host_graph = pymeca.graph.TowerHostGraph()
+        """
+        The tower <-> host memberships shared by the tower and host
+        lookups and the candidate search
+        """
+        self.contracts_refresh_blocks = contracts_refresh_blocks
+        """
+        The number of blocks the cached contracts are valid
+        """
+        self.protocol_parameters = (
+            pymeca.parameters.get_protocol_parameters(
+                w3=self.w3,
+                dao_contract_address=dao_contract_address
+            )
+        )
+        """
+        The constant fees and stakes of the contracts shared
+        by the actors of the same DAO
+        """
+        self._contracts = None
+        self._contracts_block = None
+        self._contracts_generation = None
+
+    # helper functions
+
+    def _bytes_from_hex(
+        self,
+        hex_string: str
+    ) -> bytes:
+        r"""
+        Convert a hex string to bytes. Usseful for making
+        the input for bytesX in the smart contracts
+
+        Args:
+            hex_string : hex string
+
+        Returns:
+            bytes : bytes
+        """
+        return pymeca.utils.bytes_from_hex(hex_string)
+
+    @io_steps
+    def _read(
+        self,
+        contract_type: str,
+        function_name: str,
+        arguments: dict = None,
+        decode: callable = None
+    ):
+        r"""
+        Make a read of a function of the scheduler, host, tower
+        or task contract.
+
+        Args:
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+            function_name : The name of the contract function
+            arguments : The arguments of the contract function
+            decode : Function to transform the call result
+
+        Returns:
+            The decoded value of the call (a BatchResult when
+            a batch is collecting)
+        """
+        contract = yield self._get_contract(contract_type)
+        return (yield self._call(
+            contract.functions[function_name](**(arguments or {})),
+            decode=decode
+        ))
+
+    @io_steps
+    def _get_contract(
+        self,
+        contract_type: str
+    ) -> web3.contract.Contract:
+        r"""
+        Get a cached contract resolving again the contracts
+        if the cache is missing or stale.
+
+        Args:
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+
+        Returns:
+            web3.contract.Contract : The contract
+        """
+        if (
+            self._contracts is None or
+            self._contracts_generation != contracts_generation(
+                self.w3,
+                [
+                    self.dao_contract.address,
+                    self._contracts["scheduler"].address
+                ]
+            ) or
+            (
+                self.contracts_refresh_blocks is not None and
+                (yield self._current_block_number()) >= (
+                    self._contracts_block + self.contracts_refresh_blocks
+                )
+            )
+        ):
+            yield self.refresh_contracts()
+        return self._contracts[contract_type]
+
+    # dao contract functions
+
+    @io_steps
+    def get_scheduler_contract_address(self) -> str:
+        r"""
+        Get the scheduler contract address
+
+        Returns:
+            str : The scheduler contract address
+        """
+        return (yield self.get_scheduler_contract()).address
+
+    def get_scheduler_contract(self) -> web3.contract.Contract:
+        r"""
+        Get the scheduler contract
+
+        Returns:
+            web3.contract.Contract : The scheduler contract
+        """
+        return self._get_contract("scheduler")
+
+    # scheduler contract functions
+
+    def get_scheduler_flag(self) -> bool:
+        r"""
+        Get the scheduler flag
+
+        Returns:
+            bool : The scheduler flag
+        """
+        return self._read(
+            contract_type="scheduler",
+            function_name="schedulerFlag"
         )
 
+    @io_steps
+    def get_tower_contract_address(self) -> str:
+        r"""
+        Get the tower contract address
+
+        Returns:
+            str : The tower contract address
+        """
+        return (yield self.get_tower_contract()).address
+
+    def get_tower_contract(self) -> web3.contract.Contract:
+        r"""
+        Get the tower contract
+
+        Returns:
+            web3.contract.Contract : The tower contract
+        """
+        return self._get_contract("tower")
+
+    @io_steps
     def get_host_contract_address(self) -> str:
         r"""
         Get the host contract address
@@ -363,8 +1112,7 @@ class MecaActiveActor(MecaActor):
         Returns:
             str : The host contract address
         """
-        return self.get_scheduler_contract(
-        ).functions.getHostContract().call()
+        return (yield self.get_host_contract()).address
 
     def get_host_contract(self) -> web3.contract.Contract:
         r"""
@@ -373,11 +1121,9 @@ class MecaActiveActor(MecaActor):
         Returns:
             web3.contract.Contract : The host contract
         """
-        return self.w3.eth.contract(
-            address=self.get_host_contract_address(),
-            abi=pymeca.utils.MECA_HOST_ABI
-        )
+        return self._get_contract("host")
 
+    @io_steps
     def get_task_contract_address(self) -> str:
         r"""
         Get the task contract address
@@ -385,8 +1131,7 @@ class MecaActiveActor(MecaActor):
         Returns:
             str : The task contract address
         """
-        return self.get_scheduler_contract(
-        ).functions.getTaskContract().call()
+        return (yield self.get_task_contract()).address
 
     def get_task_contract(self) -> web3.contract.Contract:
         r"""
@@ -395,10 +1140,7 @@ class MecaActiveActor(MecaActor):
         Returns:
             web3.contract.Contract : The task contract
         """
-        return self.w3.eth.contract(
-            address=self.get_task_contract_address(),
-            abi=pymeca.utils.MECA_TASK_ABI
-        )
+        return self._get_contract("task")
 
     def get_scheduler_fee(self) -> int:
         r"""
@@ -407,8 +1149,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The scheduler fee
         """
-        return self.get_scheduler_contract(
-        ).functions.SCHEDULER_FEE().call()
+        return self._parameter(
+            contract_type="scheduler",
+            name="SCHEDULER_FEE"
+        )
 
     def get_host_first_available_block(
         self,
@@ -424,10 +1168,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The first available block number
         """
-        return self.get_scheduler_contract(
-        ).functions.getHostFirstAvailableBlock(
-            hostAddress=host_address
-        ).call()
+        return self._read(
+            contract_type="scheduler",
+            function_name="getHostFirstAvailableBlock",
+            arguments={
+                "hostAddress": host_address
+            }
+        )
 
     def get_tower_current_size(
         self,
@@ -442,10 +1189,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The current used size of the tower
         """
-        return self.get_scheduler_contract(
-        ).functions.getTowerCurrentSize(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="scheduler",
+            function_name="getTowerCurrentSize",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_running_task(
         self,
@@ -461,11 +1211,14 @@ class MecaActiveActor(MecaActor):
         Returns:
             dict : The running task
         """
-        tuple_running_task = self.get_scheduler_contract(
-        ).functions.getRunningTask(
-            taskId=self._bytes_from_hex(task_id)
-        ).call()
-        return running_task_from_tuple(tuple_running_task)
+        return self._read(
+            contract_type="scheduler",
+            function_name="getRunningTask",
+            arguments={
+                "taskId": self._bytes_from_hex(task_id)
+            },
+            decode=running_task_from_tuple
+        )
 
     def get_tee_task(
         self,
@@ -481,13 +1234,17 @@ class MecaActiveActor(MecaActor):
         Returns:
             dict : The tee task
         """
-        tuple_tee_task = self.get_scheduler_contract(
-        ).functions.getTeeTask(
-            taskId=self._bytes_from_hex(task_id)
-        ).call()
-        return tee_task_from_tuple(tuple_tee_task)
+        return self._read(
+            contract_type="scheduler",
+            function_name="getTeeTask",
+            arguments={
+                "taskId": self._bytes_from_hex(task_id)
+            },
+            decode=tee_task_from_tuple
+        )
 
     # host contract functions
+
     def get_host_register_fee(
         self
     ) -> int:
@@ -497,8 +1254,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The host register fee (Wei)
         """
-        return self.get_host_contract(
-        ).functions.HOST_REGISTER_FEE().call()
+        return self._parameter(
+            contract_type="host",
+            name="HOST_REGISTER_FEE"
+        )
 
     def get_host_task_register_fee(
         self
@@ -510,8 +1269,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The host task register fee (Wei)
         """
-        return self.get_host_contract(
-        ).functions.TASK_REGISTER_FEE().call()
+        return self._parameter(
+            contract_type="host",
+            name="TASK_REGISTER_FEE"
+        )
 
     def get_host_initial_stake(
         self
@@ -523,8 +1284,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The initial stake (Wei)
         """
-        return self.get_host_contract(
-        ).functions.HOST_INITIAL_STAKE().call()
+        return self._parameter(
+            contract_type="host",
+            name="HOST_INITIAL_STAKE"
+        )
 
     def get_host_failed_task_penalty(
         self
@@ -536,8 +1299,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The failed task penalty percentage
         """
-        return self.get_host_contract(
-        ).functions.FAILED_TASK_PENALTY().call()
+        return self._parameter(
+            contract_type="host",
+            name="FAILED_TASK_PENALTY"
+        )
 
     def get_host_public_key(
         self,
@@ -552,13 +1317,14 @@ class MecaActiveActor(MecaActor):
         Returns:
             str : The public key of the host starting with 0x
         """
-        bytes_array = self.get_host_contract(
-        ).functions.getHostPublicKey(
-            hostAddress=host_address
-        ).call()
-        return "0x" + "".join([
-                x.hex().strip() for x in bytes_array
-        ])
+        return self._read(
+            contract_type="host",
+            function_name="getHostPublicKey",
+            arguments={
+                "hostAddress": host_address
+            },
+            decode=public_key_from_bytes_array
+        )
 
     def get_host_block_timeout_limit(
         self,
@@ -574,10 +1340,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The block timeout limit
         """
-        return self.get_host_contract(
-        ).functions.getHostBlockTimeoutLimit(
-            hostAddress=host_address
-        ).call()
+        return self._read(
+            contract_type="host",
+            function_name="getHostBlockTimeoutLimit",
+            arguments={
+                "hostAddress": host_address
+            }
+        )
 
     def get_host_stake(
         self,
@@ -592,10 +1361,74 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The stake of the host
         """
-        return self.get_host_contract(
-        ).functions.getHostStake(
-            hostAddress=host_address
-        ).call()
+        return self._read(
+            contract_type="host",
+            function_name="getHostStake",
+            arguments={
+                "hostAddress": host_address
+            }
+        )
+
+    @io_steps
+    def _registry_index(
+        self,
+        contract_type: str
+    ) -> dict:
+        r"""
+        Get the registered hosts or towers by owner address. The
+        index is built from one getHosts/getTowers read and reused
+        until a new block.
+
+        Args:
+            contract_type : The contract type (host, tower)
+
+        Returns:
+            dict : The hosts or towers by owner address
+        """
+        contract = yield self._get_contract(contract_type)
+        block_number = yield self._current_block_number()
+        key = (contract.address, block_number)
+        cached = self._registry_indexes.get(contract_type)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if contract_type == "host":
+            function = contract.functions.getHosts()
+            from_tuple = host_from_tuple
+        else:
+            function = contract.functions.getTowers()
+            from_tuple = tower_from_tuple
+        entries = yield self._call(
+            function,
+            decode=lambda tuples: [from_tuple(entry) for entry in tuples],
+            block_identifier=block_number
+        )
+        index = {entry["owner"]: entry for entry in entries}
+        self._registry_indexes[contract_type] = (key, index)
+        return index
+
+    def get_hosts_index(
+        self
+    ) -> dict:
+        r"""
+        Get the registered hosts by owner address. The index is
+        built once per block.
+
+        Returns:
+            dict : The hosts by owner address
+        """
+        return self._registry_index(contract_type="host")
+
+    def get_towers_index(
+        self
+    ) -> dict:
+        r"""
+        Get the registered towers by owner address. The index is
+        built once per block.
+
+        Returns:
+            dict : The towers by owner address
+        """
+        return self._registry_index(contract_type="tower")
 
     def get_hosts(
         self
@@ -606,9 +1439,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of hosts
         """
-        tuple_hots = self.get_host_contract(
-        ).functions.getHosts().call()
-        return [host_from_tuple(host) for host in tuple_hots]
+        return self._read(
+            contract_type="host",
+            function_name="getHosts",
+            decode=lambda tuple_hosts: [
+                host_from_tuple(host) for host in tuple_hosts
+            ]
+        )
 
     def get_host_task_block_timeout(
         self,
@@ -626,11 +1463,14 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The number of block to run a task
         """
-        return self.get_host_contract(
-        ).functions.getTaskBlockTimeout(
-            hostAddress=host_address,
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="host",
+            function_name="getTaskBlockTimeout",
+            arguments={
+                "hostAddress": host_address,
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
     def get_host_task_fee(
         self,
@@ -647,18 +1487,24 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The fee for the task
         """
-        return self.get_host_contract(
-        ).functions.getTaskFee(
-            hostAddress=host_address,
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="host",
+            function_name="getTaskFee",
+            arguments={
+                "hostAddress": host_address,
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
+    @io_steps
     def is_host_registered(
         self,
         address: str
     ) -> bool:
         r"""
-        Check if a host is registered in the system.
+        Check if a host is registered in the system. The stake of
+        the host is read first, which reverts for an unknown host,
+        and only a zero stake is checked in the hosts index.
 
         Args:
             address : The host address
@@ -666,13 +1512,19 @@ class MecaActiveActor(MecaActor):
         Returns:
             bool : True if the host is registered, False otherwise
         """
-        hosts_list = self.get_hosts()
-        for host in hosts_list:
-            if host["owner"] == address:
-                return True
-        return False
+        address = web3.Web3.to_checksum_address(address)
+        try:
+            stake = yield self.get_host_stake(host_address=address)
+        except web3.exceptions.ContractLogicError:
+            return False
+        if stake > 0:
+            return True
+        return address in (yield self._registry_index(
+            contract_type="host"
+        ))
 
     # tower contract functions
+
     def get_tower_initial_stake(
         self
     ) -> int:
@@ -683,8 +1535,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The initial stake (Wei)
         """
-        return self.get_tower_contract(
-        ).functions.TOWER_INITIAL_STAKE().call()
+        return self._parameter(
+            contract_type="tower",
+            name="TOWER_INITIAL_STAKE"
+        )
 
     def get_tower_failed_task_penalty(
         self
@@ -696,8 +1550,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The failed task penalty percentage
         """
-        return self.get_tower_contract(
-        ).functions.FAILED_TASK_PENALTY().call()
+        return self._parameter(
+            contract_type="tower",
+            name="FAILED_TASK_PENALTY"
+        )
 
     def get_tower_host_request_fee(
         self
@@ -708,8 +1564,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The host request fee (Wei)
         """
-        return self.get_tower_contract(
-        ).functions.HOST_REQUEST_FEE().call()
+        return self._parameter(
+            contract_type="tower",
+            name="HOST_REQUEST_FEE"
+        )
 
     def get_tower_size_limit(
         self,
@@ -724,10 +1582,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The size limit
         """
-        return self.get_tower_contract(
-        ).functions.getTowerSizeLimit(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerSizeLimit",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_tower_public_uri(
         self,
@@ -743,10 +1604,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             str : The public URI
         """
-        return self.get_tower_contract(
-        ).functions.getTowerPublicConnection(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerPublicConnection",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_tower_fee(
         self,
@@ -766,12 +1630,15 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The fee for the task to be run on the tower (Wei)
         """
-        return self.get_tower_contract(
-        ).functions.getTowerFee(
-            towerAddress=tower_address,
-            size=size,
-            blockTimeoutLimit=block_timeout_limit
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerFee",
+            arguments={
+                "towerAddress": tower_address,
+                "size": size,
+                "blockTimeoutLimit": block_timeout_limit
+            }
+        )
 
     def get_tower_stake(
         self,
@@ -786,10 +1653,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The stake of the tower
         """
-        return self.get_tower_contract(
-        ).functions.getTowerStake(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerStake",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_tower_pending_hosts(
         self,
@@ -804,10 +1674,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of pending hosts
         """
-        return self.get_tower_contract(
-        ).functions.getTowerPendingHosts(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerPendingHosts",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_tower_hosts(
         self,
@@ -822,10 +1695,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of hosts
         """
-        return self.get_tower_contract(
-        ).functions.getTowerHosts(
-            towerAddress=tower_address
-        ).call()
+        return self._read(
+            contract_type="tower",
+            function_name="getTowerHosts",
+            arguments={
+                "towerAddress": tower_address
+            }
+        )
 
     def get_towers(
         self
@@ -836,16 +1712,23 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of towers
         """
-        tuple_towers = self.get_tower_contract(
-        ).functions.getTowers().call()
-        return [tower_from_tuple(tower) for tower in tuple_towers]
+        return self._read(
+            contract_type="tower",
+            function_name="getTowers",
+            decode=lambda tuple_towers: [
+                tower_from_tuple(tower) for tower in tuple_towers
+            ]
+        )
 
+    @io_steps
     def is_tower_registered(
         self,
         address: str
     ) -> bool:
         r"""
-        Check if a tower is registered in the system.
+        Check if a tower is registered in the system. The stake of
+        the tower is read first, which reverts for an unknown tower,
+        and only a zero stake is checked in the towers index.
 
         Args:
             address : The tower address
@@ -853,13 +1736,19 @@ class MecaActiveActor(MecaActor):
         Returns:
             bool : True if the tower is registered, False otherwise
         """
-        towers_list = self.get_towers()
-        for tower in towers_list:
-            if tower["owner"] == address:
-                return True
-        return False
+        address = web3.Web3.to_checksum_address(address)
+        try:
+            stake = yield self.get_tower_stake(tower_address=address)
+        except web3.exceptions.ContractLogicError:
+            return False
+        if stake > 0:
+            return True
+        return address in (yield self._registry_index(
+            contract_type="tower"
+        ))
 
     # task contract functions
+
     def get_task_addition_fee(
         self
     ) -> int:
@@ -870,8 +1759,10 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The task addition fee (Wei)
         """
-        return self.get_task_contract(
-        ).functions.TASK_ADDITION_FEE().call()
+        return self._parameter(
+            contract_type="task",
+            name="TASK_ADDITION_FEE"
+        )
 
     def get_task_task_fee(
         self,
@@ -887,10 +1778,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The task fee (Wei)
         """
-        return self.get_task_contract(
-        ).functions.getTaskFee(
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="task",
+            function_name="getTaskFee",
+            arguments={
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
     def get_task_task_size(
         self,
@@ -907,10 +1801,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The task size (bytes)
         """
-        return self.get_task_contract(
-        ).functions.getTaskSize(
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="task",
+            function_name="getTaskSize",
+            arguments={
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
     def get_task_computing_type(
         self,
@@ -925,10 +1822,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             int : The computing type
         """
-        return self.get_task_contract(
-        ).functions.getTaskComputingType(
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="task",
+            function_name="getTaskComputingType",
+            arguments={
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
     def get_task_owner(
         self,
@@ -943,10 +1843,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             str : The owner of the task
         """
-        return self.get_task_contract(
-        ).functions.getTaskOwner(
-            ipfsSha256=ipfs_sha256
-        ).call()
+        return self._read(
+            contract_type="task",
+            function_name="getTaskOwner",
+            arguments={
+                "ipfsSha256": ipfs_sha256
+            }
+        )
 
     def get_tasks(
         self
@@ -957,11 +1860,17 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of tasks
         """
-        tuple_list = self.get_task_contract(
-        ).functions.getTasks().call()
-        return [task_from_tuple(task) for task in tuple_list]
+        return self._read(
+            contract_type="task",
+            function_name="getTasks",
+            decode=lambda tuple_list: [
+                task_from_tuple(task) for task in tuple_list
+            ]
+        )
 
     # combine contract functions
+
+    @io_steps
     def get_host_tasks(
         self,
         host_address: str
@@ -975,17 +1884,13 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of tasks the host can run
         """
-        all_tasks = self.get_tasks()
-        host_tasks = []
-        for task in all_tasks:
-            block_timeout = self.get_host_task_block_timeout(
-                host_address=host_address,
-                ipfs_sha256=task["ipfsSha256"]
-            )
-            if block_timeout > 0:
-                host_tasks.append(task)
-        return host_tasks
+        matrix = yield self.get_host_task_matrix(
+            host_addresses=[host_address],
+            fees=False
+        )
+        return matrix.get_host_tasks(host_address=host_address)
 
+    @io_steps
     def get_host_towers(
         self,
         host_address: str
@@ -999,216 +1904,901 @@ class MecaActiveActor(MecaActor):
         Returns:
             list : The list of towers the host can run tasks for
         """
-        towers = self.get_towers()
-        host_towers = []
-        for tower in towers:
-            hosts = self.get_tower_hosts(
-                tower_address=tower["owner"]
-            )
-            if host_address in hosts:
-                host_towers.append(tower)
-        return host_towers
+        graph = yield self.get_tower_host_graph()
+        return graph.get_host_towers(host_address=host_address)
 
-    def get_towers_hosts_for_task(
+    def _event_reader(
         self,
-        ipfs_sha256: str
-    ) -> list:
+        event_name: str,
+        argument_filters: dict = None
+    ) -> pymeca.events.EventReader:
         r"""
-        Get the (tower, host) pairs with their fees and the block number
-        when the results will be available for a given task.
+        Get the incremental reader of the scheduler events with
+        the given argument filters.
 
         Args:
-            ipfs_sha256 : The ipfs sha256 hash of the task
+            event_name : The name of the event
+            argument_filters : The filters on the indexed arguments,
+                a list of values matches any of them
 
         Returns:
-            list : The list of (tower, host, fee, endblock) pairs
+            pymeca.events.EventReader : The event reader
         """
-        # get all hosts
-        hosts = self.get_hosts()
-        # filter the hosts that have the task
-        # and compute the fees
-        hosts = [
-            {
-                "owner": host["owner"],
-                "eccPublicKey": host["eccPublicKey"],
-                "blockTimeoutLimit": host["blockTimeoutLimit"],
-                "fee": self.get_host_task_fee(
-                    host_address=host["owner"],
-                    ipfs_sha256=ipfs_sha256
-                ),
-                "blockTimeout": self.get_host_task_block_timeout(
-                    host_address=host["owner"],
-                    ipfs_sha256=ipfs_sha256
-                )
-            }
-            for host in hosts
-            if self.get_host_task_block_timeout(
-                host_address=host["owner"],
-                ipfs_sha256=ipfs_sha256
-            ) > 0
-        ]
-        # get task size and task fee
-        task_size = self.get_task_task_size(
-            ipfs_sha256=ipfs_sha256
-        )
-        task_fee = self.get_task_task_fee(
-            ipfs_sha256=ipfs_sha256
+        key = (
+            event_name,
+            pymeca.events.argument_filters_key(argument_filters)
         )
-        # get towers
-        towers = self.get_towers()
-        # filter the hosts which can run the task
-        hosts = [
-            {
-                "owner": host["owner"],
-                "eccPublicKey": host["eccPublicKey"],
-                "endBlock": (
-                    host["blockTimeout"] +
-                    self.get_host_first_available_block(
-                        host_address=host["owner"]
-                    )
-                ),
-                "fee": host["fee"],
-                "blockTimeout": host["blockTimeout"]
-            }
-            for host in hosts
-            if (
-                (
-                    host["blockTimeout"] +
-                    self.get_host_first_available_block(
-                        host_address=host["owner"]
-                    )
-                ) <= (
-                    self.w3.eth.get_block("latest")["number"] +
-                    host["blockTimeoutLimit"]
-                )
-            )
-        ]
-        # filter the towers which have the size to run the task
-        towers = [
-            {
-                "owner": tower["owner"],
-                "publicConnection": tower["publicConnection"]
-            }
-            for tower in towers
-            if (
-                (
-                    self.get_tower_current_size(tower_address=tower["owner"]) +
-                    task_size
-                ) <= (
-                    tower["sizeLimit"]
-                )
-            )
-        ]
-        # make the join of towers and hosts and make the list of
-        # possible combinations of running the tasks with pairs
-        # of towers and hosts
-        schedule_fee: int = self.get_scheduler_fee()
-
-        def fee_dict(
-            tower_fee: int,
-            host_fee: int,
-        ) -> dict:
-            total_fee = (
-                task_fee +
-                tower_fee +
-                host_fee +
-                schedule_fee
-            )
-            insurance_fee = int(total_fee / 10)
-            return {
-                "insurance": insurance_fee,
-                "tower": tower_fee,
-                "host": host_fee,
-                "schedule": schedule_fee,
-                "task": task_fee
-            }
-
-        towers_hosts = [
-            {
-                "towerAddress": tower["owner"],
-                "hostAddress": host["owner"],
-                "endBlock": host["endBlock"],
-                "fee": fee_dict(
-                    tower_fee=self.get_tower_fee(
-                        tower_address=tower["owner"],
-                        size=task_size,
-                        block_timeout_limit=host["blockTimeout"]
-                    ),
-                    host_fee=host["fee"]
-                )
-            }
-            for tower in towers
-            for host in hosts
-            if (
-                host["owner"] in self.get_tower_hosts(
-                    tower_address=tower["owner"]
-                )
+        if key not in self.event_readers:
+            self.event_readers[key] = pymeca.events.EventReader(
+                event_name=event_name,
+                argument_filters=argument_filters,
+                chunk_size=self.events_chunk_size
             )
-        ]
-        return towers_hosts
+        return self.event_readers[key]
 
-    def is_task_done(
+    @io_steps
+    def _stored_events(
         self,
-        task_id: str
-    ) -> bool:
+        event_name: str,
+        argument_filters: dict = None,
+        new_only: bool = False
+    ) -> list:
         r"""
-        Check if a task is done.
+        Get the scheduler events from the event store after
+        storing the new blocks.
 
         Args:
-            task_id : The task id
+            event_name : The name of the event
+            argument_filters : The filters on the event arguments
+            new_only : if True return only the events of the blocks
+                synchronized since the previous call
 
         Returns:
-            bool : True if the task is done, False otherwise
+            list : The events
         """
-        running_task = self.get_running_task(
-            task_id=task_id
+        contract = yield self.get_scheduler_contract()
+        block_number = yield self._sync_event_store(contract=contract)
+        key = (
+            contract.address,
+            event_name,
+            pymeca.events.argument_filters_key(argument_filters)
         )
-        return (
-            self.w3.eth.get_block("latest")["number"] >
-            (running_task["startBlock"] + running_task["blockTimeout"])
+        from_block = None
+        if new_only and key in self._event_store_blocks:
+            from_block = self._event_store_blocks[key] + 1
+        self._event_store_blocks[key] = block_number
+        return self.event_store.query(
+            contract_address=contract.address,
+            event_name=event_name,
+            argument_filters=argument_filters,
+            from_block=from_block,
+            to_block=block_number
         )
-    
+
+    @io_steps
     def get_finished_tasks(
         self,
+        new_only: bool = False
     ) -> list:
         r"""
-        Get all TaskFinished events.
-        Returns:
-            list : A list of TaskFinished events.
+        Get the TaskFinished events. Only the blocks added since
+        the previous call are requested from the blockchain, or
+        from the event store if the actor has one.
+
+        Args:
+            new_only : if True return only the events which are new
+                since the previous call
+
+        Returns:
+            list : A list of TaskFinished events.
         """
-        contract = self.get_scheduler_contract()
-        if self.task_finished_events_filter is None:
-            self.task_finished_events_filter = contract.events.TaskFinished.create_filter(
-                fromBlock=0,
-                toBlock='latest',
-            )
-        events = self.task_finished_events_filter.get_all_entries()
-        task_finished_events = [
-            pymeca.utils.dict_from_event(event) for event in events
-        ]
-        return task_finished_events
-    
+        if self.event_store is not None:
+            return (yield self._stored_events(
+                event_name="TaskFinished",
+                new_only=new_only
+            ))
+        contract = yield self.get_scheduler_contract()
+        reader = self._event_reader(event_name="TaskFinished")
+        new_events = yield self._read_events(
+            reader=reader,
+            contract=contract
+        )
+        if new_only:
+            return new_events
+        return list(reader.events)
+
+    @io_steps
     def get_sent_tasks(
         self,
-        task_filters
+        task_filters,
+        new_only: bool = False
     ) -> list:
         r"""
-        Get filtered TaskSent events.
+        Get filtered TaskSent events. Only the blocks added since
+        the previous call with the same filters are requested from
+        the blockchain, or from the event store if the actor has one.
+
+        Args:
+            task_filters : The argument filters of the events
+            new_only : if True return only the events which are new
+                since the previous call
 
         Returns:
             list: A list of TaskSent events.
         """
-        contract = self.get_scheduler_contract()
-        if self.task_sent_events_filter is None:
-            self.task_sent_events_filter = contract.events.TaskSent.create_filter(
-                fromBlock=0,
-                toBlock='latest',
-                argument_filters=task_filters
+        if self.event_store is not None:
+            return (yield self._stored_events(
+                event_name="TaskSent",
+                argument_filters=task_filters,
+                new_only=new_only
+            ))
+        contract = yield self.get_scheduler_contract()
+        reader = self._event_reader(
+            event_name="TaskSent",
+            argument_filters=task_filters
+        )
+        new_events = yield self._read_events(
+            reader=reader,
+            contract=contract
+        )
+        if new_only:
+            return new_events
+        return list(reader.events)
+
+
+class MecaActiveActor(MecaActor, MecaActiveActorBase):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str,
+        dao_contract_address: str,
+        contracts_refresh_blocks: int = None,
+        read_cache: pymeca.cache.ReadCache = None,
+        event_store: pymeca.events.EventStore = None
+    ) -> None:
+        r"""
+        Meca Active Actor which is interacting with the blockchain
+        as a getter for infromation. Specific functions for diiferent
+        type of actors are implemented in the derived classes.
+
+        Args:
+            w3 : web3 instance
+            private_key : private key
+            dao_contract_address : The DAO contract address
+            contracts_refresh_blocks : The number of blocks after which
+                the cached scheduler/host/tower/task contracts are
+                resolved again from the DAO. If None the contracts
+                are resolved again only when refreshed explicitly or
+                when a contract owner changes them.
+            read_cache : The block scoped cache of the contract reads.
+                If None the reads are not cached.
+            event_store : The persistent index of the scheduler events.
+                If None the events are read from the node.
+        """
+        super().__init__(w3=w3, private_key=private_key)
+        MecaActiveActorBase.__init__(
+            self,
+            dao_contract_address=dao_contract_address,
+            contracts_refresh_blocks=contracts_refresh_blocks,
+            event_store=event_store
+        )
+        self.read_cache = read_cache
+        """
+        The block scoped cache of the contract reads (opt-in)
+        """
+        self._batch_collector = None
+
+    def _call(
+        self,
+        function: web3.contract.contract.ContractFunction,
+        decode: callable = None,
+        block_identifier: int | str = None
+    ):
+        r"""
+        Make a contract read. When a batch is collecting the
+        read is deferred and a BatchResult is returned.
+
+        Args:
+            function : The contract function to call
+            decode : Function to transform the call result
+            block_identifier : The block of the read (default latest)
+
+        Returns:
+            The decoded value of the call or a BatchResult
+        """
+        if self._batch_collector is not None:
+            batch_result = BatchResult(
+                function=function,
+                decode=decode
+            )
+            self._batch_collector.append(batch_result)
+            return batch_result
+        if self.read_cache is not None and block_identifier is None:
+            value = self.read_cache.call(w3=self.w3, function=function)
+        else:
+            value = function.call(block_identifier=block_identifier)
+        return decode(value) if decode else value
+
+    def batch(
+        self,
+        block_identifier: int | str = None
+    ) -> MecaBatch:
+        r"""
+        Make a batch of contract reads sent as one JSON-RPC request.
+
+        Example:
+            with actor.batch() as batch:
+                fee = batch.add(
+                    actor.get_tower_fee,
+                    tower_address=tower_address,
+                    size=size,
+                    block_timeout_limit=block_timeout_limit
+                )
+            fee.result()
+
+        Args:
+            block_identifier : The block for all the reads (default latest)
+
+        Returns:
+            MecaBatch : The batch
+        """
+        return MecaBatch(
+            actor=self,
+            block_identifier=block_identifier
+        )
+
+    def batch_call(
+        self,
+        calls: list[tuple[callable, dict]],
+        block_identifier: int | str = None
+    ) -> list:
+        r"""
+        Execute a list of getters as one JSON-RPC batch request.
+
+        Args:
+            calls : list of (getter, kwargs) ex:
+                [(actor.get_host_task_fee, {"host_address": ...,
+                "ipfs_sha256": ...})]
+            block_identifier : The block for all the reads (default latest)
+
+        Returns:
+            list : The results in the order of the calls
+        """
+        batch = self.batch(block_identifier=block_identifier)
+        for getter, kwargs in calls:
+            batch.add(getter, **kwargs)
+        return batch.execute()
+
+    def _parameter(
+        self,
+        contract_type: str,
+        name: str
+    ) -> int:
+        r"""
+        Get a constant of a contract from the protocol parameters.
+        When a batch is collecting the constant is read in the batch.
+
+        Args:
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+            name : The name of the constant
+
+        Returns:
+            int : The value of the constant or a BatchResult
+        """
+        if self._batch_collector is not None:
+            return self._call(
+                self._get_contract(contract_type).functions[name]()
             )
-        
-        events = self.task_sent_events_filter.get_all_entries()
-        sent_tasks = [
-            pymeca.utils.dict_from_event(event) for event in events
-        ]
-        return sent_tasks
+        return self.protocol_parameters.get(
+            actor=self,
+            contract_type=contract_type
+        )[name]
+
+    def _on_receipt(
+        self,
+        tx_receipt: web3.datastructures.AttributeDict
+    ) -> None:
+        r"""
+        Move the read cache to the block of the transaction
+        so the actor reads its own writes.
+
+        Args:
+            tx_receipt : The transaction receipt
+        """
+        if self.read_cache is not None:
+            self.read_cache.observe_block(tx_receipt.blockNumber)
+
+    # contracts cache functions
+
+    def refresh_contracts(self) -> dict:
+        r"""
+        Resolve the scheduler, host, tower and task contracts from
+        the DAO contract and cache them on the actor.
+
+        Returns:
+            dict : The contracts by type
+            {
+                "scheduler"
+                "host"
+                "tower"
+                "task"
+            }
+        """
+        scheduler_contract = self.w3.eth.contract(
+            address=self.dao_contract.functions.getSchedulerContract(
+            ).call(),
+            abi=pymeca.utils.MECA_SCHEDULER_ABI
+        )
+        host_contract = self.w3.eth.contract(
+            address=scheduler_contract.functions.getHostContract().call(),
+            abi=pymeca.utils.MECA_HOST_ABI
+        )
+        tower_contract = self.w3.eth.contract(
+            address=scheduler_contract.functions.getTowerContract().call(),
+            abi=pymeca.utils.MECA_TOWER_ABI
+        )
+        task_contract = self.w3.eth.contract(
+            address=scheduler_contract.functions.getTaskContract().call(),
+            abi=pymeca.utils.MECA_TASK_ABI
+        )
+        self._contracts = {
+            "scheduler": scheduler_contract,
+            "host": host_contract,
+            "tower": tower_contract,
+            "task": task_contract
+        }
+        self._contracts_generation = contracts_generation(
+            self.w3,
+            [self.dao_contract.address, scheduler_contract.address]
+        )
+        if self.contracts_refresh_blocks is not None:
+            self._contracts_block = self._current_block_number()
+        logger.debug(f"Resolved the MECA contracts {self._contracts}")
+        return self._contracts
+
+    def _current_block_number(
+        self
+    ) -> int:
+        r"""
+        Get the current block number, the one held by the read
+        cache when there is a read cache.
+
+        Returns:
+            int : The block number
+        """
+        if self.read_cache is not None:
+            return self.read_cache.block_number(self.w3)
+        return self.w3.eth.block_number
+
+    # combine contract functions
+
+    def get_host_task_matrix(
+        self,
+        host_addresses: list[str] = None,
+        fees: bool = True,
+        batch_size: int = pymeca.matrix.DEFAULT_BATCH_SIZE
+    ) -> pymeca.matrix.HostTaskMatrix:
+        r"""
+        Get the block timeout and the fee of every (host, task) pair
+        read with batch requests at the current block.
+
+        Args:
+            host_addresses : The hosts (default all the registered hosts)
+            fees : if True the fees are read too
+            batch_size : The maximum number of calls of a batch request
+
+        Returns:
+            pymeca.matrix.HostTaskMatrix : The host x task matrix
+        """
+        return pymeca.matrix.get_host_task_matrix(
+            actor=self,
+            host_addresses=host_addresses,
+            fees=fees,
+            batch_size=batch_size
+        )
+
+    def get_registry_snapshot(self) -> pymeca.snapshot.RegistrySnapshot:
+        r"""
+        Get the columnar snapshot of the hosts, towers and tasks
+        read in one batch request at the current block.
+
+        Returns:
+            pymeca.snapshot.RegistrySnapshot : The registry snapshot
+        """
+        return pymeca.snapshot.get_registry_snapshot(actor=self)
+
+    def get_tower_host_graph(
+        self
+    ) -> pymeca.graph.TowerHostGraph:
+        r"""
+        Get the tower <-> host memberships at the current block.
+
+        Returns:
+            pymeca.graph.TowerHostGraph : The refreshed graph
+        """
+        return self.tower_host_graph.refresh(self)
+
+    def get_towers_hosts_for_task(
+        self,
+        ipfs_sha256: str
+    ) -> list:
+        r"""
+        Get the (tower, host) pairs with their fees and the block number
+        when the results will be available for a given task.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : The list of (tower, host, fee, endblock) pairs
+        """
+        return pymeca.candidates.CandidateEngine(self).search(
+            ipfs_sha256=ipfs_sha256
+        )
+
+    def get_towers_hosts_for_tasks(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> dict[str, list]:
+        r"""
+        Get the (tower, host) pairs with their fees and end blocks
+        for many tasks, reading the hosts and towers facts once.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        return pymeca.candidates.CandidateEngine(self).search_many(
+            ipfs_sha256s=ipfs_sha256s
+        )
+
+    def is_task_done(
+        self,
+        task_id: str
+    ) -> bool:
+        r"""
+        Check if a task is done.
+
+        Args:
+            task_id : The task id
+
+        Returns:
+            bool : True if the task is done, False otherwise
+        """
+        running_task = self.get_running_task(
+            task_id=task_id
+        )
+        return (
+            self.w3.eth.get_block("latest")["number"] >
+            (running_task["startBlock"] + running_task["blockTimeout"])
+        )
+
+    def iter_events(
+        self,
+        event_name: str,
+        argument_filters: dict = None,
+        from_block: int = None,
+        poll_interval: float = 1.0
+    ) -> typing.Iterator[dict]:
+        r"""
+        Yield the scheduler events as the new blocks arrive. Only
+        the blocks after the last read are requested and the events
+        are not accumulated, so the memory does not grow with the
+        history.
+
+        Args:
+            event_name : The name of the event
+            argument_filters : The filters on the event arguments
+            from_block : The first block to read (default the next
+                block)
+            poll_interval : The number of seconds between the reads
+                of the new blocks
 
+        Returns:
+            typing.Iterator[dict] : The events
+        """
+        if from_block is None:
+            from_block = self.w3.eth.block_number + 1
+        reader = pymeca.events.EventReader(
+            event_name=event_name,
+            argument_filters=argument_filters,
+            from_block=from_block,
+            chunk_size=self.events_chunk_size,
+            keep_events=False
+        )
+        while True:
+            yield from reader.read(
+                contract=self.get_scheduler_contract()
+            )
+            time.sleep(poll_interval)
+
+    def _sync_event_store(
+        self,
+        contract: web3.contract.Contract
+    ) -> int:
+        r"""
+        Store the new scheduler events in the event store.
+
+        Args:
+            contract : The scheduler contract
+
+        Returns:
+            int : The last stored block number
+        """
+        return self.event_store.sync(contract=contract)
+
+    def _read_events(
+        self,
+        reader: pymeca.events.EventReader,
+        contract: web3.contract.Contract
+    ) -> list:
+        r"""
+        Read the events of the new blocks with an event reader.
+
+        Args:
+            reader : The event reader
+            contract : The scheduler contract
+
+        Returns:
+            list : The new events
+        """
+        return reader.read(contract=contract)
+
+
+class AsyncMecaActiveActor(AsyncMecaActor, MecaActiveActorBase):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        dao_contract_address: str,
+        contracts_refresh_blocks: int = None,
+        event_store: pymeca.events.EventStore = None
+    ) -> None:
+        r"""
+        The asyncio version of the MecaActiveActor. Every getter
+        returns an awaitable so independent reads can be made
+        concurrently with asyncio.gather. The getters are the ones
+        of the MecaActiveActor (MecaActiveActorBase).
+
+        Args:
+            w3 : async web3 instance
+            private_key : private key
+            dao_contract_address : The DAO contract address
+            contracts_refresh_blocks : The number of blocks after which
+                the cached scheduler/host/tower/task contracts are
+                resolved again from the DAO. If None the contracts
+                are resolved again only when refreshed explicitly or
+                when a contract owner changes them.
+            event_store : The persistent index of the scheduler events.
+                If None the events are read from the node.
+        """
+        super().__init__(w3=w3, private_key=private_key)
+        MecaActiveActorBase.__init__(
+            self,
+            dao_contract_address=dao_contract_address,
+            contracts_refresh_blocks=contracts_refresh_blocks,
+            event_store=event_store
+        )
+        self._block_identifier = contextvars.ContextVar(
+            "block_identifier",
+            default=None
+        )
+
+    # helper functions
+
+    async def _call(
+        self,
+        function: web3.contract.async_contract.AsyncContractFunction,
+        decode: callable = None,
+        block_identifier: int | str = None
+    ):
+        r"""
+        Make a contract read.
+
+        Args:
+            function : The contract function to call
+            decode : Function to transform the call result
+            block_identifier : The block of the read (default the
+                block pinned with at_block or latest)
+
+        Returns:
+            The decoded value of the call
+        """
+        if block_identifier is None:
+            block_identifier = self._block_identifier.get()
+        value = await function.call(block_identifier=block_identifier)
+        return decode(value) if decode else value
+
+    async def _parameter(
+        self,
+        contract_type: str,
+        name: str
+    ) -> int:
+        r"""
+        Get a constant of a contract from the protocol parameters.
+
+        Args:
+            contract_type : The contract type
+                (scheduler, host, tower, task)
+            name : The name of the constant
+
+        Returns:
+            int : The value of the constant
+        """
+        return (await self.protocol_parameters.async_get(
+            actor=self,
+            contract_type=contract_type
+        ))[name]
+
+    @contextlib.contextmanager
+    def at_block(
+        self,
+        block_identifier: int | str
+    ):
+        r"""
+        Pin the reads made in the context (and in the tasks created
+        in the context) to the same block.
+
+        Example:
+            with actor.at_block(block_number):
+                hosts, towers = await asyncio.gather(
+                    actor.get_hosts(),
+                    actor.get_towers()
+                )
+
+        Args:
+            block_identifier : The block of the reads
+        """
+        token = self._block_identifier.set(block_identifier)
+        try:
+            yield
+        finally:
+            self._block_identifier.reset(token)
+
+    # contracts cache functions
+
+    async def refresh_contracts(self) -> dict:
+        r"""
+        Resolve the scheduler, host, tower and task contracts from
+        the DAO contract and cache them on the actor.
+
+        Returns:
+            dict : The contracts by type
+            {
+                "scheduler"
+                "host"
+                "tower"
+                "task"
+            }
+        """
+        scheduler_contract = self.w3.eth.contract(
+            address=await self.dao_contract.functions.getSchedulerContract(
+            ).call(),
+            abi=pymeca.utils.MECA_SCHEDULER_ABI
+        )
+        host_address, tower_address, task_address = await asyncio.gather(
+            scheduler_contract.functions.getHostContract().call(),
+            scheduler_contract.functions.getTowerContract().call(),
+            scheduler_contract.functions.getTaskContract().call()
+        )
+        self._contracts = {
+            "scheduler": scheduler_contract,
+            "host": self.w3.eth.contract(
+                address=host_address,
+                abi=pymeca.utils.MECA_HOST_ABI
+            ),
+            "tower": self.w3.eth.contract(
+                address=tower_address,
+                abi=pymeca.utils.MECA_TOWER_ABI
+            ),
+            "task": self.w3.eth.contract(
+                address=task_address,
+                abi=pymeca.utils.MECA_TASK_ABI
+            )
+        }
+        self._contracts_generation = contracts_generation(
+            self.w3,
+            [self.dao_contract.address, scheduler_contract.address]
+        )
+        if self.contracts_refresh_blocks is not None:
+            self._contracts_block = await self.w3.eth.block_number
+        logger.debug(f"Resolved the MECA contracts {self._contracts}")
+        return self._contracts
+
+    async def _current_block_number(
+        self
+    ) -> int:
+        r"""
+        Get the current block number.
+
+        Returns:
+            int : The block number
+        """
+        return await self.w3.eth.block_number
+
+    # combine contract functions
+
+    async def get_host_task_matrix(
+        self,
+        host_addresses: list[str] = None,
+        fees: bool = True,
+        batch_size: int = pymeca.matrix.DEFAULT_BATCH_SIZE
+    ) -> pymeca.matrix.HostTaskMatrix:
+        r"""
+        Get the block timeout and the fee of every (host, task) pair
+        read concurrently at the current block.
+
+        Args:
+            host_addresses : The hosts (default all the registered hosts)
+            fees : if True the fees are read too
+            batch_size : The maximum number of concurrent reads
+
+        Returns:
+            pymeca.matrix.HostTaskMatrix : The host x task matrix
+        """
+        return await pymeca.matrix.async_get_host_task_matrix(
+            actor=self,
+            host_addresses=host_addresses,
+            fees=fees,
+            batch_size=batch_size
+        )
+
+    async def get_registry_snapshot(
+        self
+    ) -> pymeca.snapshot.RegistrySnapshot:
+        r"""
+        Get the columnar snapshot of the hosts, towers and tasks
+        read concurrently at the current block.
+
+        Returns:
+            pymeca.snapshot.RegistrySnapshot : The registry snapshot
+        """
+        return await pymeca.snapshot.async_get_registry_snapshot(actor=self)
+
+    async def get_tower_host_graph(
+        self
+    ) -> pymeca.graph.TowerHostGraph:
+        r"""
+        Get the tower <-> host memberships at the current block.
+
+        Returns:
+            pymeca.graph.TowerHostGraph : The refreshed graph
+        """
+        return await self.tower_host_graph.async_refresh(self)
+
+    async def get_towers_hosts_for_task(
+        self,
+        ipfs_sha256: str
+    ) -> list:
+        r"""
+        Get the (tower, host) pairs with their fees and the block number
+        when the results will be available for a given task.
+
+        Args:
+            ipfs_sha256 : The ipfs sha256 hash of the task
+
+        Returns:
+            list : The list of (tower, host, fee, endblock) pairs
+        """
+        return await pymeca.candidates.AsyncCandidateEngine(self).search(
+            ipfs_sha256=ipfs_sha256
+        )
+
+    async def get_towers_hosts_for_tasks(
+        self,
+        ipfs_sha256s: list[str]
+    ) -> dict[str, list]:
+        r"""
+        Get the (tower, host) pairs with their fees and end blocks
+        for many tasks, reading the hosts and towers facts once.
+
+        Args:
+            ipfs_sha256s : The ipfs sha256 hashes of the tasks
+
+        Returns:
+            dict : The list of (tower, host, fee, endblock) pairs
+                of every ipfs sha256
+        """
+        return await pymeca.candidates.AsyncCandidateEngine(self).search_many(
+            ipfs_sha256s=ipfs_sha256s
+        )
+
+    async def is_task_done(
+        self,
+        task_id: str
+    ) -> bool:
+        r"""
+        Check if a task is done.
+
+        Args:
+            task_id : The task id
+
+        Returns:
+            bool : True if the task is done, False otherwise
+        """
+        running_task, block_number = await asyncio.gather(
+            self.get_running_task(
+                task_id=task_id
+            ),
+            self.w3.eth.block_number
+        )
+        return (
+            block_number >
+            (running_task["startBlock"] + running_task["blockTimeout"])
+        )
+
+    async def iter_events(
+        self,
+        event_name: str,
+        argument_filters: dict = None,
+        from_block: int = None,
+        poll_interval: float = 1.0
+    ) -> typing.AsyncIterator[dict]:
+        r"""
+        Yield the scheduler events as the new blocks arrive. Only
+        the blocks after the last read are requested and the events
+        are not accumulated, so the memory does not grow with the
+        history.
+
+        Args:
+            event_name : The name of the event
+            argument_filters : The filters on the event arguments
+            from_block : The first block to read (default the next
+                block)
+            poll_interval : The number of seconds between the reads
+                of the new blocks
+
+        Returns:
+            typing.AsyncIterator[dict] : The events
+        """
+        if from_block is None:
+            from_block = await self.w3.eth.block_number + 1
+        reader = pymeca.events.EventReader(
+            event_name=event_name,
+            argument_filters=argument_filters,
+            from_block=from_block,
+            chunk_size=self.events_chunk_size,
+            keep_events=False
+        )
+        while True:
+            for event in await reader.async_read(
+                contract=await self.get_scheduler_contract()
+            ):
+                yield event
+            await asyncio.sleep(poll_interval)
+
+    async def _sync_event_store(
+        self,
+        contract: web3.contract.AsyncContract
+    ) -> int:
+        r"""
+        Store the new scheduler events in the event store.
+
+        Args:
+            contract : The scheduler contract
+
+        Returns:
+            int : The last stored block number
+        """
+        return await self.event_store.async_sync(contract=contract)
+
+    async def _read_events(
+        self,
+        reader: pymeca.events.EventReader,
+        contract: web3.contract.AsyncContract
+    ) -> list:
+        r"""
+        Read the events of the new blocks with an event reader.
+
+        Args:
+            reader : The event reader
+            contract : The scheduler contract
+
+        Returns:
+            list : The new events
+        """
+        return await reader.async_read(contract=contract)
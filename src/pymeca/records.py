@@ -0,0 +1,194 @@
+def _hex(
+    value: bytes
+) -> str:
+    r"""
+    Get the hex string of a bytes32 value of the contracts.
+
+    Args:
+        value : The bytes
+
+    Returns:
+        str : The hex string starting with 0x
+    """
+    return "0x" + value.hex()
+
+
+class Record(dict):
+    r"""
+    Record of a decoded contract struct. A record is a dictionary
+    with the keys of the former dictionaries, so record["owner"],
+    json.dumps(record), record["fee"] = ... and the comparisons with
+    dictionaries work as before. The fields can also be read as
+    attributes (record.owner) and the subclasses only keep their
+    extra attributes in slots.
+    """
+    __slots__ = ()
+
+    def __getattr__(
+        self,
+        name: str
+    ):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    def as_dict(self) -> dict:
+        r"""
+        Get the record as a plain dictionary, with the nested records
+        as plain dictionaries too.
+
+        Returns:
+            dict : The record dictionary
+        """
+        return {
+            field: (
+                value.as_dict() if isinstance(value, Record) else value
+            )
+            for field, value in self.items()
+        }
+
+
+class Task(Record):
+    r"""
+    Task of the task contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        ipfs_sha256_bytes: bytes,
+        owner: str,
+        fee: int,
+        computing_type: int,
+        size: int
+    ) -> None:
+        super().__init__(
+            ipfsSha256=_hex(ipfs_sha256_bytes),
+            owner=owner,
+            fee=fee,
+            computingType=computing_type,
+            size=size
+        )
+
+
+class RunningTaskFee(Record):
+    r"""
+    Fee of a running task of the scheduler contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        tower: int,
+        host: int,
+        scheduler: int,
+        task: int,
+        insurance: int
+    ) -> None:
+        super().__init__(
+            tower=tower,
+            host=host,
+            scheduler=scheduler,
+            task=task,
+            insurance=insurance
+        )
+
+
+class RunningTask(Record):
+    r"""
+    Running task of the scheduler contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        ipfs_sha256_bytes: bytes,
+        input_hash_bytes: bytes,
+        output_hash_bytes: bytes,
+        size: int,
+        tower_address: str,
+        host_address: str,
+        owner: str,
+        start_block: int,
+        block_timeout: int,
+        fee: RunningTaskFee
+    ) -> None:
+        super().__init__(
+            ipfsSha256=_hex(ipfs_sha256_bytes),
+            inputHash=_hex(input_hash_bytes),
+            outputHash=_hex(output_hash_bytes),
+            size=size,
+            towerAddress=tower_address,
+            hostAddress=host_address,
+            owner=owner,
+            startBlock=start_block,
+            blockTimeout=block_timeout,
+            fee=fee
+        )
+
+
+class TeeTask(Record):
+    r"""
+    Tee task inputs of the scheduler contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        encrypted_input_hash_bytes: bytes,
+        initial_input_hash_bytes: bytes
+    ) -> None:
+        super().__init__(
+            encryptedInputHash=_hex(encrypted_input_hash_bytes),
+            initialInputHash=_hex(initial_input_hash_bytes)
+        )
+
+
+class Host(Record):
+    r"""
+    Host of the host contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        owner: str,
+        public_key_bytes: tuple[bytes, ...],
+        block_timeout_limit: int,
+        stake: int
+    ) -> None:
+        super().__init__(
+            owner=owner,
+            eccPublicKey="0x" + "".join([x.hex() for x in public_key_bytes]),
+            blockTimeoutLimit=block_timeout_limit,
+            stake=stake
+        )
+
+
+class Tower(Record):
+    r"""
+    Tower of the tower contract
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        owner: str,
+        size_limit: int,
+        public_connection: str,
+        fee_type: int,
+        fee: int,
+        stake: int
+    ) -> None:
+        super().__init__(
+            owner=owner,
+            sizeLimit=size_limit,
+            publicConnection=public_connection,
+            feeType=fee_type,
+            fee=fee,
+            stake=stake
+        )
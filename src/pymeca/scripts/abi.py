@@ -61,7 +61,8 @@ def compile_abi(
     contract_name: str,
     contract_type: str,
     abi_directory: str,
-    ABI_NAMES: dict = ABI_NAMES
+    ABI_NAMES: dict = ABI_NAMES,
+    contract_abi: list = None
 ) -> bool:
     r"""
     Compile the ABI of a contract and save it to a file in the ABI directory.
@@ -72,16 +73,18 @@ def compile_abi(
         contract_type : Type of the contract.
         abi_directory : Path to the directory where the ABI files are saved.
         ABI_NAMES : ABI names.
+        contract_abi : The ABI if the contract was already compiled.
 
     Returns:
         bool : True if the ABI was successfully compiled and saved,
         False otherwise.
     """
-    contract_abi, _ = pymeca.utils.get_contract_compile_info(
-        contract_file_path=contract_file_path,
-        contract_name=contract_name,
-        output_values=["abi"]
-    )
+    if contract_abi is None:
+        contract_abi, _ = pymeca.utils.get_contract_compile_info(
+            contract_file_path=contract_file_path,
+            contract_name=contract_name,
+            output_values=["abi"]
+        )
     abi_directory = pathlib.Path(abi_directory).absolute()
     abi_file_path = (
         abi_directory /
@@ -228,41 +231,29 @@ def execute_action(
             ABI_NAMES=ABI_NAMES
         )
     elif args.action == "all-contracts":
-        compile_abi(
-            contract_file_path=args.dao_file_path,
-            contract_name=args.dao_contract_name,
-            contract_type="dao",
-            abi_directory=args.abi_directory,
-            ABI_NAMES=ABI_NAMES
-        )
-        compile_abi(
-            contract_file_path=args.scheduler_file_path,
-            contract_name=args.scheduler_contract_name,
-            contract_type="scheduler",
-            abi_directory=args.abi_directory,
-            ABI_NAMES=ABI_NAMES
-        )
-        compile_abi(
-            contract_file_path=args.host_file_path,
-            contract_name=args.host_contract_name,
-            contract_type="host",
-            abi_directory=args.abi_directory,
-            ABI_NAMES=ABI_NAMES
-        )
-        compile_abi(
-            contract_file_path=args.tower_file_path,
-            contract_name=args.tower_contract_name,
-            contract_type="tower",
-            abi_directory=args.abi_directory,
-            ABI_NAMES=ABI_NAMES
-        )
-        compile_abi(
-            contract_file_path=args.task_file_path,
-            contract_name=args.task_contract_name,
-            contract_type="task",
-            abi_directory=args.abi_directory,
-            ABI_NAMES=ABI_NAMES
+        contracts = {
+            contract_type: (
+                getattr(args, f"{contract_type}_file_path"),
+                getattr(args, f"{contract_type}_contract_name")
+            )
+            for contract_type in ["dao", "scheduler", "host", "tower", "task"]
+        }
+        # one solc compilation for all the contracts
+        compile_infos = pymeca.utils.get_contracts_compile_info(
+            contracts=list(contracts.values()),
+            output_values=["abi"]
         )
+        for (contract_type, (contract_file_path, contract_name)), (
+            contract_abi, _
+        ) in zip(contracts.items(), compile_infos):
+            compile_abi(
+                contract_file_path=contract_file_path,
+                contract_name=contract_name,
+                contract_type=contract_type,
+                abi_directory=args.abi_directory,
+                ABI_NAMES=ABI_NAMES,
+                contract_abi=contract_abi
+            )
     else:
         raise ValueError(
             "Invalid action"
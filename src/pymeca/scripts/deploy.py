@@ -377,6 +377,7 @@ def get_parser(
                 --tower-contract-name TOWER_CONTRACT_NAME
                 --task-file-path TASK_FILE_PATH
                 --task-contract-name TASK_CONTRACT_NAME
+                --reuse
     """
     parser = argparse.ArgumentParser(
         prog="deploy.py",
@@ -467,9 +468,62 @@ def get_parser(
         parser=all_contracts_parser,
         DEFAULT_CONTRACT_NAMES=DEFAULT_CONTRACT_NAMES
     )
+    args_add_reuse(
+        parser=all_contracts_parser
+    )
     return parser
 
 
+def args_add_reuse(
+    parser: argparse.ArgumentParser
+) -> None:
+    r"""
+    Add the reuse argument of the existing deployment to the parser.
+
+    Args:
+        parser : The parser.
+
+    CLI:
+        --reuse
+    """
+    parser.add_argument(
+        "--reuse",
+        dest="reuse",
+        help=(
+            "Reuse the contracts of the DAO in the DAO address file, "
+            "deploy only the missing or stale contracts"
+        ),
+        action="store_true"
+    )
+
+
+def existing_dao_address(
+    args: argparse.Namespace
+) -> str | None:
+    r"""
+    Get the DAO address to reuse from the DAO address file.
+
+    Args:
+        args : Arguments of the CLI.
+
+    Returns:
+        str | None : The DAO address, None without --reuse or
+            without an address in the file
+    """
+    if not args.reuse:
+        return None
+    try:
+        with open(args.dao_address_file_path, "r") as file:
+            dao_address = file.read().strip()
+    except FileNotFoundError:
+        logger.info("No DAO address file, deploying all the contracts")
+        return None
+    if not web3.Web3.is_address(dao_address):
+        logger.info("No DAO address in the file, deploying all the contracts")
+        return None
+    return web3.Web3.to_checksum_address(dao_address)
+
+
 def deploy_action(
     contract_file_path: str,
     contract_name: str,
@@ -580,7 +634,8 @@ def execute_action(
             tower_failed_task_penalty=args.tower_failed_task_penalty,
             task_contract_file_path=args.task_file_path,
             task_contract_name=args.task_contract_name,
-            task_addition_fee=args.task_addition_fee
+            task_addition_fee=args.task_addition_fee,
+            dao_contract_address=existing_dao_address(args)
         )
         with open(
             args.dao_address_file_path,
@@ -38,6 +38,7 @@ import random
 import os
 import web3
 import argparse
+import urllib.parse
 import requests
 import pymeca
 import deploy
@@ -160,6 +161,7 @@ def get_parser(
             [--host HOST]
             [--port PORT]
             [--ganache-server-script-path GANACHE_SERVER_SCRIPT_PATH]
+            [--in-process]
             [--generate-accounts]
             --accounts_file_path ACCOUNTS_FILE_PATH
             [--dao-address-file-path DAO_ADDRESS_FILE_PATH]
@@ -185,6 +187,7 @@ def get_parser(
             --task-file-path TASK_FILE_PATH
             --task-contract-name TASK_CONTRACT_NAME
             --task-addition-fee TASK_ADDITION_FEE
+            --reuse
     """
     parser = argparse.ArgumentParser(
         description="Ganache server CLI starter",
@@ -216,6 +219,15 @@ def get_parser(
         required=False,
         action="store"
     )
+    parser.add_argument(
+        "--in-process",
+        dest="in_process",
+        help=(
+            "Serve an in-process chain (EthereumTester) instead of "
+            "starting the ganache server"
+        ),
+        action="store_true"
+    )
     parser.add_argument(
         "--generate-accounts",
         dest="generate_accounts",
@@ -244,6 +256,10 @@ def get_parser(
         parser=parser,
         DEFAULT_CONTRACT_NAMES=DEFAULT_CONTRACT_NAMES
     )
+    # reuse the existing deployment
+    deploy.args_add_reuse(
+        parser=parser
+    )
     # add the contracts constructor arguments
     deploy.args_contract_constructor(
         parser=parser,
@@ -311,7 +327,18 @@ def execute_action(
         with open(args.accounts_file_path, "r") as f:
             accounts = json.load(f)
 
-    if args.ganache_server_script_path:
+    server_process = None
+    if args.in_process:
+        logger.info("Starting the in-process chain server")
+        # the server binds the host of the endpoint uri
+        server_process = pymeca.testing.TesterServer(
+            w3=pymeca.testing.tester_web3(accounts),
+            host=urllib.parse.urlparse(args.host).hostname or args.host,
+            port=args.port
+        )
+        server_process.start()
+        logger.info("In-process chain server started")
+    elif args.ganache_server_script_path:
         logger.info("Starting the ganache server")
         web3_instance, server_process = ganache_web3(
             accounts=accounts,
@@ -342,7 +369,8 @@ def execute_action(
         tower_failed_task_penalty=args.tower_failed_task_penalty,
         task_contract_file_path=args.task_file_path,
         task_contract_name=args.task_contract_name,
-        task_addition_fee=args.task_addition_fee
+        task_addition_fee=args.task_addition_fee,
+        dao_contract_address=deploy.existing_dao_address(args)
     )
     with open(
         args.dao_address_file_path,
@@ -352,11 +380,11 @@ def execute_action(
     logger.info("DAO contract address:", address["dao_contract_address"])
     logger.info("Contracts deployed")
 
-    if args.ganache_server_script_path:
+    if server_process is not None:
         logger.info("Press enter to stop the server")
         input()
         server_process.terminate()
-        logger.info("Ganache server stopped")
+        logger.info("Server stopped")
 
 
 def main():
@@ -0,0 +1,324 @@
+import logging
+import asyncio
+import numpy
+import web3
+import pymeca.matrix
+
+logger = logging.getLogger(__name__)
+
+
+def address_bytes(
+    address: str
+) -> bytes:
+    r"""
+    Get the 20 bytes of an address, the value of the address
+    columns of the snapshot.
+
+    Args:
+        address : The address
+
+    Returns:
+        bytes : The address bytes
+    """
+    return bytes.fromhex(
+        web3.Web3.to_checksum_address(address)[2:]
+    )
+
+
+def column(
+    values: list[int]
+) -> numpy.ndarray:
+    r"""
+    Store the integer values of a column.
+
+    Args:
+        values : The values
+
+    Returns:
+        numpy.ndarray : The column
+    """
+    return pymeca.matrix.values_array(values, (len(values),))
+
+
+def _bytes_column(
+    values: list[bytes],
+    width: int
+) -> numpy.ndarray:
+    r"""
+    Store the bytes values of a column in a fixed-width array. The
+    values are raw bytes (numpy.void), unlike the numpy strings the
+    trailing NUL bytes of an address or hash are kept, so
+    bytes(column[i]) is the value.
+
+    Args:
+        values : The values
+        width : The number of bytes of a value
+
+    Returns:
+        numpy.ndarray : The column
+    """
+    return numpy.array(values, dtype=f"V{width}").reshape((len(values),))
+
+
+class RegistrySnapshot():
+    def __init__(
+        self,
+        block_number: int,
+        hosts: list,
+        towers: list,
+        tasks: list = None
+    ) -> None:
+        r"""
+        Columnar snapshot of the hosts, towers and tasks read at
+        the same block. Every field is a column array so the
+        filters run as vectorized masks over all the entities, and
+        the masks select back the host, tower or task records.
+
+        Example:
+            snapshot = actor.get_registry_snapshot()
+            mask = snapshot.towers_with_size(current_sizes, task_size)
+            towers = snapshot.select_towers(mask)
+
+        Args:
+            block_number : The block of the reads
+            hosts : The hosts
+            towers : The towers
+            tasks : The tasks (default none)
+        """
+        if tasks is None:
+            tasks = []
+        self.block_number = block_number
+        self.hosts = list(hosts)
+        self.towers = list(towers)
+        self.tasks = list(tasks)
+
+        self.host_owners = _bytes_column(
+            [address_bytes(host["owner"]) for host in self.hosts], 20
+        )
+        self.host_block_timeout_limits = column(
+            [host["blockTimeoutLimit"] for host in self.hosts]
+        )
+        self.host_stakes = column([host["stake"] for host in self.hosts])
+
+        self.tower_owners = _bytes_column(
+            [address_bytes(tower["owner"]) for tower in self.towers], 20
+        )
+        self.tower_size_limits = column(
+            [tower["sizeLimit"] for tower in self.towers]
+        )
+        self.tower_fee_types = column(
+            [tower["feeType"] for tower in self.towers]
+        )
+        self.tower_fees = column([tower["fee"] for tower in self.towers])
+        self.tower_stakes = column(
+            [tower["stake"] for tower in self.towers]
+        )
+
+        self.task_ipfs_sha256 = _bytes_column(
+            [bytes.fromhex(task["ipfsSha256"][2:]) for task in self.tasks],
+            32
+        )
+        self.task_owners = _bytes_column(
+            [address_bytes(task["owner"]) for task in self.tasks], 20
+        )
+        self.task_fees = column([task["fee"] for task in self.tasks])
+        self.task_computing_types = column(
+            [task["computingType"] for task in self.tasks]
+        )
+        self.task_sizes = column([task["size"] for task in self.tasks])
+
+    def hosts_in_time(
+        self,
+        end_blocks: numpy.ndarray,
+        block_number: int = None
+    ) -> numpy.ndarray:
+        r"""
+        Get the mask of the hosts whose end block is within their
+        block timeout limit.
+
+        Args:
+            end_blocks : The end block of every host
+            block_number : The current block (default the block
+                of the snapshot)
+
+        Returns:
+            numpy.ndarray : The boolean mask of the hosts
+        """
+        if block_number is None:
+            block_number = self.block_number
+        return (
+            numpy.asarray(end_blocks) <=
+            self.host_block_timeout_limits + block_number
+        )
+
+    def towers_with_size(
+        self,
+        current_sizes: numpy.ndarray,
+        task_size: int
+    ) -> numpy.ndarray:
+        r"""
+        Get the mask of the towers whose remaining size is at least
+        the task size.
+
+        Args:
+            current_sizes : The current size of every tower
+            task_size : The size of the task
+
+        Returns:
+            numpy.ndarray : The boolean mask of the towers
+        """
+        return (
+            numpy.asarray(current_sizes) + task_size <=
+            self.tower_size_limits
+        )
+
+    def tasks_with_size(
+        self,
+        size_limit: int
+    ) -> numpy.ndarray:
+        r"""
+        Get the mask of the tasks whose size is at most a limit.
+
+        Args:
+            size_limit : The size limit
+
+        Returns:
+            numpy.ndarray : The boolean mask of the tasks
+        """
+        return self.task_sizes <= size_limit
+
+    def tower_membership(
+        self,
+        host_towers: dict[str, set[str]]
+    ) -> numpy.ndarray:
+        r"""
+        Get the tower x host boolean matrix of the memberships.
+
+        Args:
+            host_towers : The towers of every host (like the
+                host_towers of pymeca.graph.TowerHostGraph)
+
+        Returns:
+            numpy.ndarray : The membership matrix (towers x hosts)
+        """
+        tower_positions = {
+            tower["owner"]: position
+            for position, tower in enumerate(self.towers)
+        }
+        membership = numpy.zeros(
+            (len(self.towers), len(self.hosts)),
+            dtype=bool
+        )
+        for host_position, host in enumerate(self.hosts):
+            for tower_address in host_towers.get(host["owner"], ()):
+                tower_position = tower_positions.get(tower_address)
+                if tower_position is not None:
+                    membership[tower_position, host_position] = True
+        return membership
+
+    def select_hosts(
+        self,
+        mask: numpy.ndarray
+    ) -> list:
+        r"""
+        Get the hosts of a mask.
+
+        Args:
+            mask : The boolean mask of the hosts
+
+        Returns:
+            list : The hosts
+        """
+        return [self.hosts[index] for index in numpy.flatnonzero(mask)]
+
+    def select_towers(
+        self,
+        mask: numpy.ndarray
+    ) -> list:
+        r"""
+        Get the towers of a mask.
+
+        Args:
+            mask : The boolean mask of the towers
+
+        Returns:
+            list : The towers
+        """
+        return [self.towers[index] for index in numpy.flatnonzero(mask)]
+
+    def select_tasks(
+        self,
+        mask: numpy.ndarray
+    ) -> list:
+        r"""
+        Get the tasks of a mask.
+
+        Args:
+            mask : The boolean mask of the tasks
+
+        Returns:
+            list : The tasks
+        """
+        return [self.tasks[index] for index in numpy.flatnonzero(mask)]
+
+
+def get_registry_snapshot(
+    actor
+) -> RegistrySnapshot:
+    r"""
+    Read the hosts, towers and tasks in one batch request pinned
+    to the current block.
+
+    Args:
+        actor : The MecaActiveActor used for the reads
+
+    Returns:
+        RegistrySnapshot : The snapshot
+    """
+    block_number = actor.w3.eth.block_number
+    hosts, towers, tasks = actor.batch_call(
+        [
+            (actor.get_hosts, {}),
+            (actor.get_towers, {}),
+            (actor.get_tasks, {})
+        ],
+        block_identifier=block_number
+    )
+    logger.debug(
+        f"Registry snapshot of {len(hosts)} hosts, {len(towers)} towers "
+        f"and {len(tasks)} tasks at block {block_number}"
+    )
+    return RegistrySnapshot(
+        block_number=block_number,
+        hosts=hosts,
+        towers=towers,
+        tasks=tasks
+    )
+
+
+async def async_get_registry_snapshot(
+    actor
+) -> RegistrySnapshot:
+    r"""
+    Read the hosts, towers and tasks concurrently pinned to the
+    current block.
+
+    Args:
+        actor : The AsyncMecaActiveActor used for the reads
+
+    Returns:
+        RegistrySnapshot : The snapshot
+    """
+    block_number = await actor.w3.eth.block_number
+    with actor.at_block(block_number):
+        hosts, towers, tasks = await asyncio.gather(
+            actor.get_hosts(),
+            actor.get_towers(),
+            actor.get_tasks()
+        )
+    return RegistrySnapshot(
+        block_number=block_number,
+        hosts=hosts,
+        towers=towers,
+        tasks=tasks
+    )
@@ -2,32 +2,19 @@ import logging
 import web3
 import pymeca.pymeca
 import pymeca.utils
+import pymeca.transaction
 
 logger = logging.getLogger(__name__)
 
 
-class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
-    def __init__(
-        self,
-        w3: web3.Web3,
-        private_key: str,
-        dao_contract_address: str
-    ) -> None:
-        r"""
-        Init a task developer.
-
-        Args:
-            w3 : Web3 instance.
-            private_key : Private key of the task developer
-            dao_contract_address : DAO contract address.
-        """
-        super().__init__(
-            w3=w3,
-            private_key=private_key,
-            dao_contract_address=dao_contract_address
-        )
+class MecaTaskDeveloperBase():
+    r"""
+    The task developer functions shared by the MecaTaskDeveloper
+    and the AsyncMecaTaskDeveloper.
+    """
 
     # getters functions
+    @pymeca.pymeca.io_steps
     def get_my_tasks(self) -> list:
         r"""
         Get all tasks of the task developer.
@@ -35,7 +22,7 @@ class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
         Returns:
             list : List of tasks.
         """
-        all_tasks = self.get_tasks()
+        all_tasks = yield self.get_tasks()
         my_tasks = []
         for task in all_tasks:
             if task["owner"] == self.account.address:
@@ -43,13 +30,15 @@ class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
         return my_tasks
 
     # functions to interact with the blockchain
+    @pymeca.pymeca.io_steps
     def register_task(
         self,
         ipfs_sha256: str,
         fee: int,
         computing_type: int,
-        size: int
-    ) -> bool:
+        size: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register a new task on the blockchain.
 
@@ -58,36 +47,35 @@ class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
             fee : Fee for the task.
             computing_type : Computing type.
             size : I/O Size of the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the task was registered successfully,
             False otherwise.
         """
-        transaction = self.get_task_contract(
-        ).functions.addTask(
+        function = (yield self.get_task_contract(
+        )).functions.addTask(
             ipfsSha256=self._bytes_from_hex(ipfs_sha256),
             fee=fee,
             computingType=computing_type,
             size=size
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            ),
-            "value": self.get_task_addition_fee()
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            value=(yield self.get_task_addition_fee()),
+            wait=wait
+        ))
 
     def register_task_cid(
         self,
         cid: str,
         fee: int,
         computing_type: int,
-        size: int
-    ) -> bool:
+        size: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register a new task given by the cid on the blockchain.
 
@@ -96,6 +84,8 @@ class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
             fee : Fee for the task.
             computing_type : Computing type.
             size : I/O Size of the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the task was registered successfully,
@@ -104,121 +94,169 @@ class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor):
             ipfs_sha256=pymeca.utils.get_sha256_from_cid(cid),
             fee=fee,
             computing_type=computing_type,
-            size=size
+            size=size,
+            wait=wait
         )
 
+    @pymeca.pymeca.io_steps
     def update_task_fee(
         self,
         ipfs_sha256: str,
-        fee: int
-    ) -> bool:
+        fee: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update the  fee of a task.
 
         Args:
             ipfs_sha256 : IPFS SHA256 hash of the task.
             fee : New fee for the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the fee was updated successfully,
         """
-        transaction = self.get_task_contract(
-        ).functions.updateTaskFee(
+        function = (yield self.get_task_contract(
+        )).functions.updateTaskFee(
             ipfsSha256=self._bytes_from_hex(ipfs_sha256),
             newFee=fee
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_task_size(
         self,
         ipfs_sha256: str,
-        size: int
-    ) -> bool:
+        size: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update the size of a task.
 
         Args:
             ipfs_sha256 : IPFS SHA256 hash of the task.
             size : New size for the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the size was updated successfully,
         """
-        transaction = self.get_task_contract(
-        ).functions.updateTaskSize(
+        function = (yield self.get_task_contract(
+        )).functions.updateTaskSize(
             ipfsSha256=ipfs_sha256,
             newSize=size
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_task_owner(
         self,
         ipfs_sha256: str,
-        new_owner: str
-    ) -> bool:
+        new_owner: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update the owner of a task.
 
         Args:
             ipfs_sha256 : IPFS SHA256 hash of the task.
             new_owner : New owner of the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the owner was updated successfully,
         """
-        transaction = self.get_task_contract(
-        ).functions.updateTaskOwner(
+        function = (yield self.get_task_contract(
+        )).functions.updateTaskOwner(
             ipfsSha256=self._bytes_from_hex(ipfs_sha256),
             newOwner=new_owner
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def delete_task(
         self,
-        ipfs_sha256: str
-    ) -> bool:
+        ipfs_sha256: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Delete a task from the blockchain.
 
         Args:
             ipfs_sha256 : IPFS SHA256 hash of the task.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the task was deleted successfully,
         """
-        transaction = self.get_task_contract().functions.deleteTask(
+        function = (yield self.get_task_contract()).functions.deleteTask(
             ipfsSha256=self._bytes_from_hex(ipfs_sha256)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
+        )
+
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
+
+
+class MecaTaskDeveloper(pymeca.pymeca.MecaActiveActor, MecaTaskDeveloperBase):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a task developer.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the task developer
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
 
-        tx_receipt = self._execute_transaction(transaction)
 
-        return tx_receipt.status == 1
+class AsyncMecaTaskDeveloper(
+    pymeca.pymeca.AsyncMecaActiveActor,
+    MecaTaskDeveloperBase
+):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a task developer using an async web3 instance.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the task developer
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
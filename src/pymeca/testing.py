@@ -0,0 +1,207 @@
+import json
+import logging
+import threading
+import http.server
+import web3
+from eth_account import Account
+import pymeca.compat
+
+logger = logging.getLogger(__name__)
+
+
+def tester_genesis_state(
+    accounts: dict[str, dict]
+) -> dict[bytes, dict]:
+    r"""
+    Get the genesis state of the in-process chain where the
+    simulate accounts have their initial balance, like the
+    ganache server.
+
+    Args:
+        accounts : The simulate accounts (like the ones of
+            pymeca.utils.generate_meca_simulate_accounts)
+
+    Returns:
+        dict[bytes, dict] : The state of every account by
+            canonical address
+    """
+    genesis_state = {}
+    for account in accounts.values():
+        address = Account.from_key(account["private_key"]).address
+        genesis_state[bytes.fromhex(address[2:])] = {
+            # the balance is a hex string of wei
+            "balance": int(account["balance"], 16),
+            "storage": {},
+            "code": b"",
+            "nonce": 0
+        }
+    return genesis_state
+
+
+def tester_web3(
+    accounts: dict[str, dict]
+) -> web3.Web3:
+    r"""
+    Start an in-process chain (EthereumTester over py-evm) where
+    the simulate accounts have their initial balance. Every
+    transaction is mined in its own block, like the ganache server,
+    and there is no server process or port.
+
+    Example:
+        w3 = tester_web3(pymeca.utils.generate_meca_simulate_accounts())
+        addresses = pymeca.dao.init_meca_envirnoment(
+            endpoint_uri=None,
+            w3=w3,
+            ...
+        )
+
+    Args:
+        accounts : The simulate accounts (like the ones of
+            pymeca.utils.generate_meca_simulate_accounts)
+
+    Returns:
+        web3.Web3 : web3 instance of the chain
+    """
+    # eth_tester is only needed for the in-process chain
+    from eth_tester import EthereumTester, PyEVMBackend
+
+    # the default accounts of the tester are kept funded, the calls
+    # without a sender are sent from the first one
+    genesis_state = PyEVMBackend.generate_genesis_state()
+    genesis_state.update(tester_genesis_state(accounts))
+    backend = PyEVMBackend(
+        genesis_state=genesis_state
+    )
+    return web3.Web3(
+        web3.EthereumTesterProvider(EthereumTester(backend))
+    )
+
+
+def tester_async_web3(
+    w3: web3.Web3
+) -> web3.AsyncWeb3:
+    r"""
+    Get an async web3 instance of the same in-process chain.
+
+    Args:
+        w3 : web3 instance of the chain (from tester_web3)
+
+    Returns:
+        web3.AsyncWeb3 : async web3 instance of the chain
+    """
+    provider = web3.AsyncEthereumTesterProvider()
+    provider.ethereum_tester = w3.provider.ethereum_tester
+    return web3.AsyncWeb3(provider)
+
+
+class TesterServer():
+    def __init__(
+        self,
+        w3: web3.Web3,
+        host: str = "127.0.0.1",
+        port: int = 8545
+    ) -> None:
+        r"""
+        JSON-RPC HTTP server of an in-process chain, so the clients
+        of other processes can use it like a ganache server. The
+        requests (and the requests of a batch) are executed one by
+        one in a server thread.
+
+        Example:
+            server = TesterServer(tester_web3(accounts), port=8545)
+            server.start()
+            ...
+            server.terminate()
+
+        Args:
+            w3 : web3 instance of the chain (from tester_web3)
+            host : The host of the server
+            port : The port of the server
+        """
+        self.w3 = w3
+        # the requests pass through the middlewares of the tester
+        # provider, which translate them from and to JSON-RPC
+        self.request_func = w3.provider.request_func(
+            w3,
+            w3.middleware_onion
+        )
+        self.lock = threading.Lock()
+        server = self
+
+        class _Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                if isinstance(body, list):
+                    response = [server.handle(request) for request in body]
+                else:
+                    response = server.handle(body)
+                data = pymeca.compat.dumps_json(response).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.http_server = http.server.ThreadingHTTPServer(
+            (host, port),
+            _Handler
+        )
+        self.thread = None
+
+    def handle(
+        self,
+        request: dict
+    ) -> dict:
+        r"""
+        Execute a JSON-RPC request on the chain.
+
+        Args:
+            request : The JSON-RPC request
+
+        Returns:
+            dict : The JSON-RPC response
+        """
+        with self.lock:
+            try:
+                response = dict(self.request_func(
+                    request["method"],
+                    request.get("params", [])
+                ))
+            except Exception as e:
+                response = {"error": {"code": -32000, "message": str(e)}}
+        if "error" in response and not isinstance(response["error"], dict):
+            response["error"] = {
+                "code": -32000,
+                "message": str(response["error"])
+            }
+        response["id"] = request.get("id")
+        response["jsonrpc"] = "2.0"
+        return response
+
+    def start(self) -> None:
+        r"""
+        Serve the requests in a daemon thread.
+        """
+        self.thread = threading.Thread(
+            target=self.http_server.serve_forever,
+            daemon=True
+        )
+        self.thread.start()
+        logger.info(
+            f"In-process chain served at port "
+            f"{self.http_server.server_address[1]}"
+        )
+
+    def terminate(self) -> None:
+        r"""
+        Stop the server, like the terminate of the ganache process.
+        """
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        if self.thread is not None:
+            self.thread.join()
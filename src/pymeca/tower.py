@@ -2,30 +2,16 @@ import logging
 import web3
 import pymeca.pymeca
 import pymeca.utils
+import pymeca.transaction
 
 logger = logging.getLogger(__name__)
 
 
-class MecaTower(pymeca.pymeca.MecaActiveActor):
-    def __init__(
-        self,
-        w3: web3.Web3,
-        private_key: str,
-        dao_contract_address: str
-    ) -> None:
-        r"""
-        Init a tower.
-
-        Args:
-            w3 : Web3 instance.
-            private_key : Private key of the tower
-            dao_contract_address : DAO contract address.
-        """
-        super().__init__(
-            w3=w3,
-            private_key=private_key,
-            dao_contract_address=dao_contract_address
-        )
+class MecaTowerBase():
+    r"""
+    The tower functions shared by the MecaTower and the
+    AsyncMecaTower.
+    """
 
     def is_registered(
         self
@@ -69,14 +55,16 @@ class MecaTower(pymeca.pymeca.MecaActiveActor):
 
     # setter functions
     # tower functions
+    @pymeca.pymeca.io_steps
     def register_tower(
         self,
         size_limit: int,
         public_connection: str,
         fee: int,
         fee_type: int,
-        initial_deposit: int
-    ) -> bool:
+        initial_deposit: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register a new tower on the blockchain.
 
@@ -86,215 +74,259 @@ class MecaTower(pymeca.pymeca.MecaActiveActor):
             fee : Fee.
             fee_type : Fee type.
             initial_deposit : Initial deposit.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the tower was registered on the blockchain.
         """
-        if initial_deposit < self.get_tower_initial_stake():
+        if initial_deposit < (yield self.get_tower_initial_stake()):
             raise ValueError(
                 "The initial deposit is less than the minimum deposit"
             )
 
-        transaction = self.get_tower_contract(
-        ).functions.registerAsTower(
+        function = (yield self.get_tower_contract(
+        )).functions.registerAsTower(
             sizeLimit=size_limit,
             publicConnection=public_connection,
             fee=fee,
             feeType=fee_type
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            ),
-            "value": initial_deposit
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            value=initial_deposit,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_tower_size_limit(
         self,
-        new_size_limit: int
-    ) -> bool:
+        new_size_limit: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update tower size limit on the blockchain.
 
         Args:
             new_size_limit : New size limit.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the size limit was updated successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.updateSizeLimit(
+        function = (yield self.get_tower_contract(
+        )).functions.updateSizeLimit(
             newSizeLimit=new_size_limit
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_tower_public_connection(
         self,
-        new_public_connection: str
-    ) -> bool:
+        new_public_connection: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update tower public connection on the blockchain.
 
         Args:
             new_public_connection : New public connection.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the public connection was updated successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.updatePublicConnection(
+        function = (yield self.get_tower_contract(
+        )).functions.updatePublicConnection(
             newPublicConnection=new_public_connection
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def update_fee(
         self,
         new_fee_type: int,
-        new_fee: int
-    ) -> bool:
+        new_fee: int,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Update tower fee on the blockchain.
 
         Args:
             new_fee_type : New fee type.
             new_fee : New fee.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the fee was updated successfully.
         """
-        transaction = self.get_tower_contract().functions.updateFee(
+        function = (yield self.get_tower_contract()).functions.updateFee(
             newFee=new_fee,
             newFeeType=new_fee_type
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def delete_tower(
-        self
-    ) -> bool:
+        self,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Delete tower from the blockchain.
 
+        Args:
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
+
         Returns:
             bool : True if the tower was deleted successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.deleteTower().build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        function = (yield self.get_tower_contract(
+        )).functions.deleteTower()
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
     # host functions
+    @pymeca.pymeca.io_steps
     def accept_host(
         self,
-        host_address: str
-    ) -> bool:
+        host_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Accept host on the blockchain from the pending list.
 
         Args:
             host_address : Host address.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the host was accepted successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.acceptHost(
+        function = (yield self.get_tower_contract(
+        )).functions.acceptHost(
             hostAddress=host_address
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def reject_host(
         self,
-        host_address: str
-    ) -> bool:
+        host_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Reject host on the blockchain from the pending list.
 
         Args:
             host_address : Host address.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the host was rejected successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.rejectHost(
+        function = (yield self.get_tower_contract(
+        )).functions.rejectHost(
             hostAddress=host_address
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def delete_host(
         self,
-        host_address: str
-    ) -> bool:
+        host_address: str,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Delete host from the blockchain from the tower hosts list.
 
         Args:
             host_address : Host address.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the host was deleted successfully.
         """
-        transaction = self.get_tower_contract(
-        ).functions.deleteHost(
+        function = (yield self.get_tower_contract(
+        )).functions.deleteHost(
             hostAddress=host_address
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
+        )
 
-        tx_receipt = self._execute_transaction(transaction)
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
-        return tx_receipt.status == 1
+
+class MecaTower(pymeca.pymeca.MecaActiveActor, MecaTowerBase):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a tower.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the tower
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
+
+
+class AsyncMecaTower(pymeca.pymeca.AsyncMecaActiveActor, MecaTowerBase):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a tower using an async web3 instance.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the tower
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
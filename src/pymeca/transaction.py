@@ -0,0 +1,498 @@
+import logging
+import threading
+import time
+import weakref
+import concurrent.futures
+import web3
+import pymeca.utils
+import pymeca.compat
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager():
+    def __init__(
+        self,
+        address: str
+    ) -> None:
+        r"""
+        Allocate locally the nonces of the transactions of an account
+        so many transactions can be in flight at the same time. The
+        next nonce is read from the blockchain (including the pending
+        transactions) when no transaction of the manager is in flight
+        and after a resync, so a restarted chain or the transactions
+        of another process are seen by the next transaction.
+
+        Every allocated nonce is released once, when its transaction
+        is mined, dropped or can not be sent.
+
+        Args:
+            address : The address of the account
+        """
+        self.address = address
+        self._next_nonce = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> bool:
+        r"""
+        Count a new transaction in flight, with the lock.
+
+        Returns:
+            bool : True if the next nonce has to be read
+        """
+        if self._in_flight == 0:
+            self._next_nonce = None
+        self._in_flight += 1
+        return self._next_nonce is None
+
+    def _next(self) -> int:
+        r"""
+        Take the next nonce, with the lock.
+
+        Returns:
+            int : The nonce
+        """
+        nonce = self._next_nonce
+        self._next_nonce += 1
+        return nonce
+
+    def allocate(
+        self,
+        w3: web3.Web3
+    ) -> int:
+        r"""
+        Get the nonce for a new transaction.
+
+        Args:
+            w3 : web3 instance
+
+        Returns:
+            int : The nonce
+        """
+        with self._lock:
+            if self._reserve():
+                try:
+                    self._next_nonce = w3.eth.get_transaction_count(
+                        self.address,
+                        "pending"
+                    )
+                except Exception:
+                    self._in_flight -= 1
+                    raise
+            return self._next()
+
+    async def async_allocate(
+        self,
+        w3: web3.AsyncWeb3
+    ) -> int:
+        r"""
+        Get the nonce for a new transaction with an async web3.
+
+        Args:
+            w3 : async web3 instance
+
+        Returns:
+            int : The nonce
+        """
+        with self._lock:
+            read = self._reserve()
+        if read:
+            try:
+                transaction_count = await w3.eth.get_transaction_count(
+                    self.address,
+                    "pending"
+                )
+            except Exception:
+                self.release()
+                raise
+            with self._lock:
+                if self._next_nonce is None:
+                    self._next_nonce = transaction_count
+        with self._lock:
+            return self._next()
+
+    def release(
+        self,
+        resync: bool = False
+    ) -> None:
+        r"""
+        Release the nonce of a transaction which is not in flight
+        anymore.
+
+        Args:
+            resync : If True the next nonce is read again from the
+                blockchain, used when the transaction failed
+        """
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+        if resync:
+            self.resync()
+
+    def resync(self) -> None:
+        r"""
+        Forget the local nonce, the next transaction reads it again
+        from the blockchain. Used after a failed or dropped transaction.
+        """
+        with self._lock:
+            logger.debug(f"Resync the nonce of {self.address}")
+            self._next_nonce = None
+
+
+_nonce_managers: dict[tuple, NonceManager] = {}
+_nonce_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(
+    w3: web3.Web3 | web3.AsyncWeb3,
+    address: str
+) -> NonceManager:
+    r"""
+    Get the nonce manager of an account on the blockchain of the
+    web3 instance. All the actors of the same account and blockchain
+    share it, also with different web3 instances or providers of the
+    same endpoint uri.
+
+    Args:
+        w3 : web3 instance
+        address : The address of the account
+
+    Returns:
+        NonceManager : The nonce manager
+    """
+    key = (pymeca.utils.provider_key(w3), address)
+    with _nonce_managers_lock:
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager(address=address)
+        return _nonce_managers[key]
+
+
+class TransactionFuture(concurrent.futures.Future):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        tx_hash: bytes,
+        nonce_manager: NonceManager = None,
+        transform: callable = None,
+        timeout: float = 120,
+        on_receipt: callable = None
+    ) -> None:
+        r"""
+        The future result of a sent transaction. It is resolved by
+        the ReceiptPoller of the web3 instance when the transaction
+        is mined, so the callers can use result(), done() and
+        add_done_callback() without polling on their own.
+
+        Args:
+            w3 : web3 instance
+            tx_hash : The hash of the transaction
+            nonce_manager : The nonce manager which allocated the
+                nonce of the transaction, the nonce is released when
+                the future is resolved and resynced if the transaction
+                fails or is dropped
+            transform : Function to transform the receipt in the result
+                (default the success status of the transaction)
+            timeout : The number of seconds after which the transaction
+                is considered dropped
+            on_receipt : Function called with the receipt before
+                the future is resolved
+        """
+        super().__init__()
+        self.w3 = w3
+        self.tx_hash = tx_hash
+        self.nonce_manager = nonce_manager
+        self.transform = transform
+        self.on_receipt = on_receipt
+        self.deadline = time.monotonic() + timeout
+        self.tx_receipt = None
+        r"""
+        The receipt of the transaction when it is mined
+        """
+        self._resolve_lock = threading.Lock()
+
+    def set_receipt(
+        self,
+        tx_receipt: web3.datastructures.AttributeDict
+    ) -> None:
+        r"""
+        Resolve the future with the receipt of the mined transaction.
+        A reverted transaction is resolved like a successful one, so
+        its result is False (or the transform of its receipt) and the
+        receipt is kept in tx_receipt.
+
+        Args:
+            tx_receipt : The transaction receipt
+        """
+        with self._resolve_lock:
+            if self.done():
+                return
+            self._set_receipt(tx_receipt)
+
+    def _set_receipt(
+        self,
+        tx_receipt: web3.datastructures.AttributeDict
+    ) -> None:
+        r"""
+        Resolve the future with the receipt, with the resolve lock.
+
+        Args:
+            tx_receipt : The transaction receipt
+        """
+        self.tx_receipt = tx_receipt
+        if self.on_receipt is not None:
+            try:
+                self.on_receipt(tx_receipt)
+            except Exception as e:
+                logger.warning(f"Receipt callback failed: {e}")
+        if self.nonce_manager is not None:
+            self.nonce_manager.release(resync=tx_receipt.status != 1)
+        try:
+            if self.transform is None:
+                result = tx_receipt.status == 1
+            else:
+                result = self.transform(tx_receipt)
+        except Exception as e:
+            self.set_exception(e)
+            return
+        self.set_result(result)
+
+    def expire(self) -> None:
+        r"""
+        Fail the future because the transaction was not mined
+        before the deadline, the transaction can be dropped.
+        """
+        with self._resolve_lock:
+            if self.done():
+                return
+            if self.nonce_manager is not None:
+                self.nonce_manager.release(resync=True)
+            self.set_exception(web3.exceptions.TimeExhausted(
+                f"Transaction {web3.Web3.to_hex(self.tx_hash)} is not "
+                "in the chain after the timeout"
+            ))
+
+    def _wait_deadline(self) -> None:
+        r"""
+        Wait until the future is resolved or the deadline is passed.
+        The future is expired here if the poller did not resolve it
+        in time, so the waiting does not depend on the poller.
+        """
+        concurrent.futures.wait(
+            [self],
+            timeout=max(0.0, self.deadline - time.monotonic())
+        )
+        if not self.done():
+            self.expire()
+
+    def result(
+        self,
+        timeout: float = None
+    ):
+        r"""
+        Wait for the result of the transaction.
+
+        Args:
+            timeout : The number of seconds to wait (default until
+                the deadline of the transaction)
+
+        Returns:
+            The result of the transaction
+        """
+        if timeout is None:
+            self._wait_deadline()
+        return super().result(timeout=timeout)
+
+    def receipt(
+        self,
+        timeout: float = None
+    ) -> web3.datastructures.AttributeDict:
+        r"""
+        Wait for the receipt of the transaction, also if it is
+        reverted.
+
+        Args:
+            timeout : The number of seconds to wait (default until
+                the deadline of the transaction)
+
+        Returns:
+            web3.datastructures.AttributeDict : The transaction receipt
+        """
+        if timeout is None:
+            self._wait_deadline()
+        exception = self.exception(timeout=timeout)
+        if self.tx_receipt is None:
+            raise exception
+        return self.tx_receipt
+
+
+class ReceiptPoller():
+    def __init__(
+        self,
+        w3: web3.Web3,
+        poll_interval: float = 0.1
+    ) -> None:
+        r"""
+        Poll the receipts of all the outstanding transactions of
+        a web3 instance from one background thread. The receipts
+        are requested once per new block with one batch request,
+        so the polling cost does not grow with the number of
+        transactions in flight.
+
+        Args:
+            w3 : web3 instance
+            poll_interval : The number of seconds between the checks
+                of the block number
+        """
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        self.rpc_requests: int = 0
+        r"""
+        The number of JSON-RPC round trips of the poller
+        """
+        self._futures: dict[str, list[TransactionFuture]] = {}
+        self._unchecked = False
+        self._last_block = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def watch(
+        self,
+        future: TransactionFuture
+    ) -> None:
+        r"""
+        Resolve the future when its transaction is mined.
+
+        Args:
+            future : The transaction future
+        """
+        tx_hash = web3.Web3.to_hex(future.tx_hash)
+        with self._lock:
+            self._futures.setdefault(tx_hash, []).append(future)
+            # the transaction can be in the last checked block
+            self._unchecked = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pymeca-receipt-poller",
+                    daemon=True
+                )
+                self._thread.start()
+
+    def outstanding(self) -> int:
+        r"""
+        Get the number of transactions which are not mined yet.
+
+        Returns:
+            int : The number of outstanding transactions
+        """
+        with self._lock:
+            return len(self._futures)
+
+    def _run(self) -> None:
+        r"""
+        Poll until there are no outstanding transactions.
+        """
+        while True:
+            with self._lock:
+                if len(self._futures) == 0:
+                    self._thread = None
+                    return
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Receipt polling failed: {e}")
+            time.sleep(self.poll_interval)
+
+    def poll(self) -> None:
+        r"""
+        Check the outstanding transactions if there is a new block
+        or new transactions since the last check.
+        """
+        try:
+            block_number = self.w3.eth.block_number
+            self.rpc_requests += 1
+            with self._lock:
+                if block_number == self._last_block and not self._unchecked:
+                    tx_hashes = []
+                else:
+                    tx_hashes = list(self._futures)
+                self._last_block = block_number
+                self._unchecked = False
+
+            responses, rpc_requests = pymeca.utils.make_batch_request(
+                w3=self.w3,
+                requests=[
+                    ("eth_getTransactionReceipt", [tx_hash])
+                    for tx_hash in tx_hashes
+                ]
+            )
+            self.rpc_requests += rpc_requests
+            for tx_hash, response in zip(tx_hashes, responses):
+                # not mined yet
+                if response.get("result") is None:
+                    continue
+                tx_receipt = _receipt_from_result(response["result"])
+                with self._lock:
+                    futures = self._futures.pop(tx_hash, [])
+                for future in futures:
+                    future.set_receipt(tx_receipt)
+        finally:
+            self._expire()
+
+    def _expire(self) -> None:
+        r"""
+        Fail the transactions which are not mined in time, also
+        if the check of the receipts failed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for tx_hash in list(self._futures):
+                futures = self._futures[tx_hash]
+                expired = [f for f in futures if f.deadline < now]
+                for future in expired:
+                    futures.remove(future)
+                    future.expire()
+                if len(futures) == 0:
+                    del self._futures[tx_hash]
+
+
+def _receipt_from_result(
+    result: dict
+) -> web3.datastructures.AttributeDict:
+    r"""
+    Get the receipt in the web3 format from the result of
+    an eth_getTransactionReceipt request.
+
+    Args:
+        result : The JSON-RPC result
+
+    Returns:
+        web3.datastructures.AttributeDict : The transaction receipt
+    """
+    if isinstance(result, web3.datastructures.AttributeDict):
+        return result
+    return web3.datastructures.AttributeDict.recursive(
+        pymeca.compat.format_receipt(result)
+    )
+
+
+_receipt_pollers = weakref.WeakKeyDictionary()
+_receipt_pollers_lock = threading.Lock()
+
+
+def get_receipt_poller(
+    w3: web3.Web3
+) -> ReceiptPoller:
+    r"""
+    Get the receipt poller of a web3 instance.
+
+    Args:
+        w3 : web3 instance
+
+    Returns:
+        ReceiptPoller : The receipt poller
+    """
+    with _receipt_pollers_lock:
+        if w3 not in _receipt_pollers:
+            _receipt_pollers[w3] = ReceiptPoller(w3=w3)
+        return _receipt_pollers[w3]
@@ -1,210 +1,499 @@
 import logging
+import time
+import typing
+import asyncio
 import web3
 import pymeca.pymeca
 import pymeca.utils
+import pymeca.transaction
+import pymeca.fees
+import pymeca.events
 
 logger = logging.getLogger(__name__)
 
 
-class MecaUser(pymeca.pymeca.MecaActiveActor):
+def sent_task_from_receipt(
+    scheduler_contract: web3.contract.Contract,
+    tx_receipt: web3.datastructures.AttributeDict
+) -> tuple[bool, str]:
+    r"""
+    Get the task id from the TaskSent event of the receipt
+    of a sendTask transaction.
+
+    Args:
+        scheduler_contract : The scheduler contract
+        tx_receipt : The transaction receipt
+
+    Returns:
+        tuple[bool, str] : (status, task_id)
+    """
+    # get logs of tx_receipt to find out the task_id
+    logs = scheduler_contract.events.TaskSent().process_receipt(
+        tx_receipt
+    )
+
+    if len(logs) == 0:
+        raise pymeca.utils.MecaError(
+            "TaskSent event not found in transaction receipt"
+        )
+    if len(logs) > 1:
+        raise pymeca.utils.MecaError(
+            "More than one TaskSent event found in transaction receipt"
+        )
+
+    logs = logs[0]
+    log = logs["args"]
+    task_id = "0x" + log["taskId"].hex()
+
+    return (tx_receipt.status == 1, task_id)
+
+
+def _quote_task(
+    quote: pymeca.fees.Quote,
+    ipfs_sha256: str,
+    host_address: str,
+    tower_address: str
+) -> tuple[str, str, str]:
+    r"""
+    Get the task, host and tower of a quote, checking the ones
+    given with it.
+
+    Args:
+        quote : The quote
+        ipfs_sha256 : IPFS SHA256 hash of the task or None
+        host_address : Host address or None
+        tower_address : Tower address or None
+
+    Returns:
+        tuple[str, str, str] : (ipfs_sha256, host_address, tower_address)
+    """
+    for name, value, quote_value in [
+        ("ipfs_sha256", ipfs_sha256, quote.ipfs_sha256),
+        ("host_address", host_address, quote.hostAddress),
+        ("tower_address", tower_address, quote.towerAddress)
+    ]:
+        if value is not None and value.lower() != quote_value.lower():
+            raise pymeca.utils.MecaError(
+                f"The {name} {value} is not the one of the quote "
+                f"{quote_value}"
+            )
+    return (quote.ipfs_sha256, quote.hostAddress, quote.towerAddress)
+
+
+class FinishedTasksSelector():
     def __init__(
         self,
-        w3: web3.Web3,
-        private_key: str,
-        dao_contract_address: str
+        sender: str,
+        chunk_size: int = pymeca.events.DEFAULT_CHUNK_SIZE
     ) -> None:
         r"""
-        Init a user.
+        Select the TaskFinished events of the tasks of a user. The
+        TaskFinished events do not have the owner of the task, so
+        the ids of the tasks sent by the user and not finished yet
+        are kept to select them.
 
         Args:
-            w3 : Web3 instance.
-            private_key : Private key of the user
-            dao_contract_address : DAO contract address.
+            sender : The address of the user
+            chunk_size : The maximum number of blocks of one
+                eth_getLogs request
         """
-        super().__init__(
-            w3=w3,
-            private_key=private_key,
-            dao_contract_address=dao_contract_address
+        self.sent_reader = pymeca.events.EventReader(
+            event_name="TaskSent",
+            argument_filters={'sender': sender.lower()},
+            chunk_size=chunk_size,
+            keep_events=False
+        )
+        self.finished_reader = pymeca.events.EventReader(
+            event_name="TaskFinished",
+            chunk_size=chunk_size,
+            keep_events=False
         )
+        self.pending_task_ids = set()
+        # the first read finds the tasks of the user not finished yet
+        self.history = True
 
-    def send_task_on_blockchain(
+    def select(
+        self,
+        sent_events: list,
+        finished_events: list
+    ) -> list:
+        r"""
+        Select the TaskFinished events of the user from the events
+        of the same blocks. The events of the first read are the
+        history and are not selected.
+
+        Args:
+            sent_events : The new TaskSent events of the user
+            finished_events : The new TaskFinished events
+
+        Returns:
+            list : The TaskFinished events of the user
+        """
+        for event in sent_events:
+            self.pending_task_ids.add(event["args"]["taskId"])
+        selected = []
+        for event in finished_events:
+            task_id = event["args"]["taskId"]
+            if task_id not in self.pending_task_ids:
+                continue
+            self.pending_task_ids.remove(task_id)
+            selected.append(event)
+        if self.history:
+            self.history = False
+            return []
+        return selected
+
+
+class MecaUserBase():
+    r"""
+    The user functions shared by the MecaUser and the AsyncMecaUser.
+    The fees of a task are read concurrently by the AsyncMecaUser.
+    """
+
+    @pymeca.pymeca.io_steps
+    def get_send_task_value(
         self,
         ipfs_sha256: str,
         host_address: str,
-        tower_address: str,
-        input_hash: str
-    ) -> tuple[bool, str]:
+        tower_address: str
+    ) -> int:
         r"""
-        Send a task on the blockchain.
+        Read the fees and get the value of the sendTask transaction.
 
         Args:
             ipfs_sha256 : IPFS SHA256 hash of the task.
             host_address : Host address.
             tower_address : Tower address.
-            input_hash : Input hash.
 
         Returns:
-            tuple[bool, str] : (status, task_id)
+            int : The value of the transaction (Wei)
         """
-        # get the fees
-        task_fee = self.get_task_task_fee(
-            ipfs_sha256=ipfs_sha256
-        )
-        task_size = self.get_task_task_size(
-            ipfs_sha256=ipfs_sha256
-        )
-        task_block_timeout = self.get_host_task_block_timeout(
-            host_address=host_address,
-            ipfs_sha256=ipfs_sha256
+        (
+            task_fee,
+            task_size,
+            task_block_timeout,
+            host_fee,
+            scheduler_fee
+        ) = yield self._gather(
+            self.get_task_task_fee(
+                ipfs_sha256=ipfs_sha256
+            ),
+            self.get_task_task_size(
+                ipfs_sha256=ipfs_sha256
+            ),
+            self.get_host_task_block_timeout(
+                host_address=host_address,
+                ipfs_sha256=ipfs_sha256
+            ),
+            self.get_host_task_fee(
+                host_address=host_address,
+                ipfs_sha256=ipfs_sha256
+            ),
+            self.get_scheduler_fee()
         )
-        tower_fee = self.get_tower_fee(
+        tower_fee = yield self.get_tower_fee(
             tower_address=tower_address,
             size=task_size,
             block_timeout_limit=task_block_timeout
         )
-        host_fee = self.get_host_task_fee(
-            host_address=host_address,
-            ipfs_sha256=ipfs_sha256
-        )
-        insurance_fee = (task_fee + tower_fee + host_fee) / 10
-        total_fee = int(
-            task_fee +
-            tower_fee +
-            host_fee +
-            insurance_fee +
-            self.get_scheduler_fee()
+        return pymeca.fees.send_task_value(
+            task_fee=task_fee,
+            tower_fee=tower_fee,
+            host_fee=host_fee,
+            scheduler_fee=scheduler_fee
         )
 
+    @pymeca.pymeca.io_steps
+    def send_task_on_blockchain(
+        self,
+        ipfs_sha256: str = None,
+        host_address: str = None,
+        tower_address: str = None,
+        input_hash: str = None,
+        wait: bool = True,
+        quote: pymeca.fees.Quote = None,
+        max_quote_age: int = None
+    ) -> tuple[bool, str] | pymeca.transaction.TransactionFuture:
+        r"""
+        Send a task on the blockchain. With a quote of the candidate
+        search the fees of the quote are used and are not read again.
+
+        Args:
+            ipfs_sha256 : IPFS SHA256 hash of the task (default the
+                one of the quote).
+            host_address : Host address (default the one of the quote).
+            tower_address : Tower address (default the one of the quote).
+            input_hash : Input hash.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture with the
+                (status, task_id) result
+            quote : The quote from get_towers_hosts_for_task
+            max_quote_age : if the quote is older than this number of
+                blocks the fees are read again (default never)
+
+        Returns:
+            tuple[bool, str] : (status, task_id)
+        """
+        if input_hash is None:
+            raise pymeca.utils.MecaError("The input hash is required")
+        if quote is not None:
+            ipfs_sha256, host_address, tower_address = _quote_task(
+                quote, ipfs_sha256, host_address, tower_address
+            )
+        elif None in (ipfs_sha256, host_address, tower_address):
+            raise pymeca.utils.MecaError(
+                "The task, host and tower are required without a quote"
+            )
+        if quote is None or (
+            max_quote_age is not None and
+            quote.age((yield self._current_block_number())) >
+            max_quote_age
+        ):
+            total_fee = yield self.get_send_task_value(
+                ipfs_sha256=ipfs_sha256,
+                host_address=host_address,
+                tower_address=tower_address
+            )
+        else:
+            total_fee = quote.value
+
         # send the task
-        transaction = self.get_scheduler_contract(
-        ).functions.sendTask(
+        scheduler_contract = yield self.get_scheduler_contract()
+        function = scheduler_contract.functions.sendTask(
             ipfsSha256=self._bytes_from_hex(ipfs_sha256),
             hostAddress=host_address,
             towerAddress=tower_address,
             inputHash=self._bytes_from_hex(input_hash)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            ),
-            "value": total_fee
-        })
-
-        tx_receipt = self._execute_transaction(transaction=transaction)
-
-        # get logs of tx_receipt to find out the task_id
-        logs = self.get_scheduler_contract().events.TaskSent().process_receipt(
-            tx_receipt
         )
 
-        if len(logs) == 0:
-            raise pymeca.utils.MecaError(
-                "TaskSent event not found in transaction receipt"
-            )
-        if len(logs) > 1:
-            raise pymeca.utils.MecaError(
-                "More than one TaskSent event found in transaction receipt"
+        return (yield self._transact(
+            function=function,
+            value=total_fee,
+            wait=wait,
+            transform=lambda tx_receipt: sent_task_from_receipt(
+                scheduler_contract=scheduler_contract,
+                tx_receipt=tx_receipt
             )
+        ))
 
-        logs = logs[0]
-        log = logs["args"]
-        task_id = "0x" + log["taskId"].hex()
-
-        return (tx_receipt.status == 1, task_id)
-
+    @pymeca.pymeca.io_steps
     def register_tee_task_initial_input(
         self,
         task_id: str,
-        hash_initial_input: bytes
-    ) -> bool:
+        hash_initial_input: bytes,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register TEE task initial input.
 
         Args:
             task_id : Task ID.
             hash_initial_input : hash of the initial input.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the initial input was registered successfully.
         """
-        transaction = self.get_scheduler_contract(
-        ).functions.registerTeeTaskInitialInput(
+        function = (yield self.get_scheduler_contract(
+        )).functions.registerTeeTaskInitialInput(
             taskId=self._bytes_from_hex(task_id),
             initialInputHash=hash_initial_input
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction=transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def register_tee_task_encrypted_input(
         self,
         task_id: str,
-        hash_encrypted_input: bytes
-    ) -> bool:
+        hash_encrypted_input: bytes,
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Register TEE task encrypted input.
 
         Args:
             task_id : Task ID.
             hash_encrypted_input : Encrypted input.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the encrypted input was registered successfully.
         """
-        transaction = self.get_scheduler_contract(
-        ).functions.registerTeeTaskEncryptedInput(
+        function = (yield self.get_scheduler_contract(
+        )).functions.registerTeeTaskEncryptedInput(
             taskId=self._bytes_from_hex(task_id),
             encryptedInputHash=hash_encrypted_input
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
-
-        tx_receipt = self._execute_transaction(transaction=transaction)
+        )
 
-        return tx_receipt.status == 1
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
+    @pymeca.pymeca.io_steps
     def finish_task(
         self,
         task_id: str,
-    ) -> bool:
+        wait: bool = True
+    ) -> bool | pymeca.transaction.TransactionFuture:
         r"""
         Finish a task.
 
         Args:
             task_id : Task ID.
+            wait : if False do not wait for the transaction,
+                return the TransactionFuture
 
         Returns:
             bool : True if the task was finished successfully.
         """
-        transaction = self.get_scheduler_contract(
-        ).functions.finishTask(
+        function = (yield self.get_scheduler_contract(
+        )).functions.finishTask(
             taskId=self._bytes_from_hex(task_id)
-        ).build_transaction({
-            "from": self.account.address,
-            "nonce": self.w3.eth.get_transaction_count(
-                self.account.address
-            )
-        })
+        )
 
-        tx_receipt = self._execute_transaction(transaction=transaction)
+        return (yield self._transact(
+            function=function,
+            wait=wait
+        ))
 
-        return tx_receipt.status == 1
-    
+    @pymeca.pymeca.io_steps
     def get_user_sent_tasks(
         self,
+        new_only: bool = False
     ) -> list:
         r"""
         Get all TaskSent events for the user.
+
+        Args:
+            new_only : if True return only the events which are new
+                since the previous call
+
         Returns:
             list : A list of TaskSent events.
         """
-        return super().get_sent_tasks({'sender': self.account.address.lower()})
+        return (yield self.get_sent_tasks(
+            {'sender': self.account.address.lower()},
+            new_only=new_only
+        ))
+
+
+class MecaUser(pymeca.pymeca.MecaActiveActor, MecaUserBase):
+    def __init__(
+        self,
+        w3: web3.Web3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a user.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the user
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
+
+    def iter_finished_tasks(
+        self,
+        poll_interval: float = 1.0
+    ) -> typing.Iterator[dict]:
+        r"""
+        Yield the TaskFinished events of the tasks of the user as
+        the new blocks arrive (see FinishedTasksSelector).
+
+        Args:
+            poll_interval : The number of seconds between the reads
+                of the new blocks
+
+        Returns:
+            typing.Iterator[dict] : The TaskFinished events
+        """
+        selector = FinishedTasksSelector(
+            sender=self.account.address,
+            chunk_size=self.events_chunk_size
+        )
+        while True:
+            contract = self.get_scheduler_contract()
+            block_number = self.w3.eth.block_number
+            finished_events = selector.select(
+                sent_events=selector.sent_reader.read(
+                    contract=contract,
+                    to_block=block_number
+                ),
+                finished_events=selector.finished_reader.read(
+                    contract=contract,
+                    to_block=block_number
+                )
+            )
+            yield from finished_events
+            time.sleep(poll_interval)
+
+
+class AsyncMecaUser(pymeca.pymeca.AsyncMecaActiveActor, MecaUserBase):
+    def __init__(
+        self,
+        w3: web3.AsyncWeb3,
+        private_key: str,
+        dao_contract_address: str
+    ) -> None:
+        r"""
+        Init a user using an async web3 instance.
+
+        Args:
+            w3 : Web3 instance.
+            private_key : Private key of the user
+            dao_contract_address : DAO contract address.
+        """
+        super().__init__(
+            w3=w3,
+            private_key=private_key,
+            dao_contract_address=dao_contract_address
+        )
+
+    async def iter_finished_tasks(
+        self,
+        poll_interval: float = 1.0
+    ) -> typing.AsyncIterator[dict]:
+        r"""
+        Yield the TaskFinished events of the tasks of the user as
+        the new blocks arrive (see FinishedTasksSelector).
+
+        Args:
+            poll_interval : The number of seconds between the reads
+                of the new blocks
+
+        Returns:
+            typing.AsyncIterator[dict] : The TaskFinished events
+        """
+        selector = FinishedTasksSelector(
+            sender=self.account.address,
+            chunk_size=self.events_chunk_size
+        )
+        while True:
+            contract = await self.get_scheduler_contract()
+            block_number = await self.w3.eth.block_number
+            finished_events = selector.select(
+                sent_events=await selector.sent_reader.async_read(
+                    contract=contract,
+                    to_block=block_number
+                ),
+                finished_events=await selector.finished_reader.async_read(
+                    contract=contract,
+                    to_block=block_number
+                )
+            )
+            for event in finished_events:
+                yield event
+            await asyncio.sleep(poll_interval)
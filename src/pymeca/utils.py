@@ -3,12 +3,16 @@ import logging
 import secrets
 import random
 import json
+import typing
 import web3
-from solcx import compile_source
 from eth_account import Account
 import eth_keys
-import multiformats_cid
 from hexbytes import HexBytes
+import pymeca.compiler
+import pymeca.compat
+
+if typing.TYPE_CHECKING:
+    import multiformats_cid
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +42,9 @@ def get_contract_compile_info(
     contract_file_path: str,
     contract_name: str,
     output_values: list[str] = ["abi", "bin"],
-    evm_version: str = "shanghai"
+    evm_version: str = "shanghai",
+    use_cache: bool = True,
+    cache_directory: str = None
 ) -> tuple[str, str]:
     r"""
     Get the contract compile info
@@ -49,6 +55,10 @@ def get_contract_compile_info(
         output_values : if "abi" and "bin" are present, then the abi and bin
             will be returned
         evm_version : evm version
+        use_cache : if True the output is read from the compile cache
+            when the sources and the options did not change
+        cache_directory : The compile cache directory (default
+            pymeca.compiler.DEFAULT_CACHE_DIRECTORY)
 
     Returns:
         contract abi and bytecode
@@ -56,22 +66,16 @@ def get_contract_compile_info(
     logger.info(
         f"Compiling the contract {contract_name} at {contract_file_path}"
     )
-    # contracts path
-    contract_file_path: pathlib.Path = pathlib.Path(
-        contract_file_path).resolve().absolute()
-
-    contracts_path = contract_file_path.parent
-
-    # read the contract code
-    contract_code = contract_file_path.read_text()
-
     # compile the contract
-    compiled_sol = compile_source(
-        contract_code,
-        base_path=contracts_path,
+    compiled_sol = pymeca.compiler.compile_source_file(
+        contract_file_path=contract_file_path,
         output_values=output_values,
         evm_version=evm_version,
-        optimize=True
+        cache=(
+            pymeca.compiler.CompileCache(cache_directory)
+            if use_cache
+            else None
+        )
     )
 
     compiled_contract_name = f'<stdin>:{contract_name}'
@@ -93,24 +97,89 @@ def get_contract_compile_info(
     return (contract_abi, contract_bytecode)
 
 
-# load the abi files for the contracts
-try:
-    with open(str(ABI_DIRECTORY / ABI_NAMES["dao"]) + ".json", "r") as f:
-        MECA_DAO_ABI = json.load(f)
-    with open(str(ABI_DIRECTORY / ABI_NAMES["scheduler"]) + ".json", "r") as f:
-        MECA_SCHEDULER_ABI = json.load(f)
-    with open(str(ABI_DIRECTORY / ABI_NAMES["host"]) + ".json", "r") as f:
-        MECA_HOST_ABI = json.load(f)
-    with open(str(ABI_DIRECTORY / ABI_NAMES["task"]) + ".json", "r") as f:
-        MECA_TASK_ABI = json.load(f)
-    with open(str(ABI_DIRECTORY / ABI_NAMES["tower"]) + ".json", "r") as f:
-        MECA_TOWER_ABI = json.load(f)
-except Exception as e:
-    raise MecaError(
-        f"Error loading the abi files: {e}"
+def get_contracts_compile_info(
+    contracts: list[tuple[str, str]],
+    output_values: list[str] = ["abi", "bin"],
+    evm_version: str = "shanghai",
+    use_cache: bool = True,
+    cache_directory: str = None
+) -> list[tuple[list, str]]:
+    r"""
+    Get the compile info of many contracts with one solc compilation
+
+    Args:
+        contracts : The (contract file path, contract name) pairs
+        output_values : if "abi" and "bin" are present, then the abi and bin
+            will be returned, with "bin-runtime" also the runtime bytecode
+        evm_version : evm version
+        use_cache : if True the output is read from the compile cache
+            when the sources and the options did not change
+        cache_directory : The compile cache directory (default
+            pymeca.compiler.DEFAULT_CACHE_DIRECTORY)
+
+    Returns:
+        list[tuple[list, str]] : The contract abi and bytecode of every
+            contract
+    """
+    return pymeca.compiler.compile_contracts(
+        contracts=contracts,
+        output_values=output_values,
+        evm_version=evm_version,
+        cache=(
+            pymeca.compiler.CompileCache(cache_directory)
+            if use_cache
+            else None
+        )
     )
 
 
+ABI_ATTRIBUTES = {
+    "MECA_DAO_ABI": "dao",
+    "MECA_SCHEDULER_ABI": "scheduler",
+    "MECA_HOST_ABI": "host",
+    "MECA_TASK_ABI": "task",
+    "MECA_TOWER_ABI": "tower"
+}
+r"""
+The contract type of the MECA_*_ABI module attributes
+"""
+
+
+def load_abi(
+    contract_type: str
+) -> list:
+    r"""
+    Load the abi of a contract from the abi files of the package.
+
+    Args:
+        contract_type : The contract type (a key of ABI_NAMES)
+
+    Returns:
+        list : The contract abi
+    """
+    try:
+        with open(
+            str(ABI_DIRECTORY / ABI_NAMES[contract_type]) + ".json", "r"
+        ) as f:
+            return json.load(f)
+    except Exception as e:
+        raise MecaError(
+            f"Error loading the abi files: {e}"
+        )
+
+
+def __getattr__(name: str):
+    r"""
+    Load the MECA_*_ABI abi files when they are first used and keep
+    them as module attributes.
+    """
+    if name in ABI_ATTRIBUTES:
+        abi = load_abi(ABI_ATTRIBUTES[name])
+        globals()[name] = abi
+        return abi
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_gas_to_send(
     w3: web3.Web3,
     account: Account,
@@ -177,11 +246,162 @@ def sign_send_wait_transaction(
     return tx_receipt
 
 
+def provider_key(
+    w3: web3.Web3 | web3.AsyncWeb3
+) -> str | int:
+    r"""
+    Get the key of the blockchain of a web3 instance. The sync and
+    async providers of the same node share the endpoint uri, the
+    providers without uri (ex: the in-process chains) are kept apart.
+
+    Args:
+        w3 : web3 instance (sync or async)
+
+    Returns:
+        str | int : The endpoint uri or the id of the provider
+    """
+    provider = w3.provider
+    return getattr(provider, "endpoint_uri", None) or id(provider)
+
+
+def block_identifier_param(
+    block_identifier: int | str | None
+) -> str:
+    r"""
+    Get the JSON-RPC parameter for a block identifier
+
+    Args:
+        block_identifier : block number, block tag or None for latest
+
+    Returns:
+        str : block identifier JSON-RPC parameter
+    """
+    if block_identifier is None:
+        return "latest"
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    return block_identifier
+
+
+def encode_function_call(
+    function: web3.contract.contract.ContractFunction
+) -> dict:
+    r"""
+    Encode a contract function call as eth_call transaction
+
+    Args:
+        function : contract function with the arguments set
+
+    Returns:
+        dict : eth_call transaction {"to", "data"}
+    """
+    return {
+        "to": function.address,
+        "data": pymeca.compat.encode_transaction_data(function)
+    }
+
+
+def decode_function_result(
+    w3: web3.Web3,
+    function: web3.contract.contract.ContractFunction,
+    return_data: bytes | str
+):
+    r"""
+    Decode the result of an eth_call in the same way
+    as ContractFunction.call does.
+
+    Args:
+        w3 : web3 instance
+        function : contract function which was called
+        return_data : the raw eth_call result
+
+    Returns:
+        the decoded output, a single value if the function
+        has only one output
+    """
+    if isinstance(return_data, str):
+        return_data = HexBytes(return_data)
+    normalized_data = pymeca.compat.decode_function_output(
+        w3=w3,
+        function=function,
+        return_data=return_data
+    )
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return normalized_data
+
+
+def make_batch_request(
+    w3: web3.Web3,
+    requests: list[tuple[str, list]]
+) -> tuple[list[dict], int]:
+    r"""
+    Send multiple JSON-RPC requests as one batch request.
+    For providers which are not HTTP providers the requests
+    are sent one by one through the web3 request manager.
+    The batch request of a HTTP provider does not pass through
+    the middlewares of the web3 instance.
+
+    Args:
+        w3 : web3 instance
+        requests : list of (method, params)
+
+    Returns:
+        list[dict] : JSON-RPC responses in the order of the requests
+        int : The number of JSON-RPC requests which were sent
+    """
+    if len(requests) == 0:
+        return [], 0
+    provider = w3.provider
+    if not isinstance(provider, web3.HTTPProvider):
+        responses = []
+        for method, params in requests:
+            try:
+                responses.append({
+                    "result": w3.manager.request_blocking(method, params)
+                })
+            except Exception as e:
+                responses.append({
+                    "error": {"message": str(e)}
+                })
+        return responses, len(requests)
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": request_id
+        }
+        for request_id, (method, params) in enumerate(requests)
+    ]
+    raw_response = pymeca.compat.post_batch_request(
+        provider,
+        json.dumps(payload).encode("utf-8")
+    )
+    responses = json.loads(raw_response)
+    if not isinstance(responses, list):
+        raise MecaError(
+            f"Invalid batch response: {responses}"
+        )
+    responses_by_id = {
+        response.get("id"): response for response in responses
+    }
+    if len(responses_by_id) != len(requests):
+        raise MecaError(
+            f"Expected {len(requests)} responses in the batch, "
+            f"got {len(responses_by_id)}"
+        )
+    return [
+        responses_by_id[request_id] for request_id in range(len(requests))
+    ], 1
+
+
 def deploy_contract(
     w3: web3.Web3,
     private_key: str,
     contract_file_path: str,
     contract_name: str,
+    compile_info: tuple[list, str] = None,
     **kwargs
 ) -> str:
     r"""
@@ -192,6 +412,8 @@ def deploy_contract(
         private_key : private key of the account
         contract_file_path : path to the contract file
         contract_name : name of the contract
+        compile_info : The (abi, bytecode) of the contract if it
+            was already compiled (default compile the contract)
         kwargs : constructor arguments
 
     Returns:
@@ -203,11 +425,13 @@ def deploy_contract(
     # get the accouynt
     account = Account.from_key(private_key)
     # compile the contract
-    contract_abi, contract_bytecode = get_contract_compile_info(
-        contract_file_path=contract_file_path,
-        contract_name=contract_name,
-        output_values=["abi", "bin"]
-    )
+    if compile_info is None:
+        compile_info = get_contract_compile_info(
+            contract_file_path=contract_file_path,
+            contract_name=contract_name,
+            output_values=["abi", "bin"]
+        )
+    contract_abi, contract_bytecode = compile_info
 
     # deploy the contract
     # create the contract instance
@@ -259,6 +483,8 @@ def get_sha256_from_cid(
     Returns:
         sha256
     """
+    import multiformats_cid
+
     # convert the cid to class
     cid = multiformats_cid.make_cid(cid)
     if type(cid) is multiformats_cid.CIDv0:
@@ -307,7 +533,7 @@ def get_sha256_from_cid(
 
 def cidv1_object_from_sha256(
     sha256: str
-) -> multiformats_cid.CIDv1:
+) -> "multiformats_cid.CIDv1":
     r"""
     Get the cid version 1 object from the sha256
 
@@ -348,6 +574,8 @@ def cidv1_object_from_sha256(
     )
     # convert to bytes
     hex_cid_bytes = bytes.fromhex(hex_cid_hex_string)
+    import multiformats_cid
+
     # convert to cid
     return multiformats_cid.make_cid(hex_cid_bytes)
 
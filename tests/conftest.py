@@ -12,6 +12,26 @@ import pymeca.tower
 import pymeca.task
 import pymeca.user
 import pymeca.utils
+import pymeca.testing
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--chain-backend",
+        dest="chain_backend",
+        choices=["tester", "ganache"],
+        default="tester",
+        help=(
+            "The chain of the setups: tester (in-process, default) "
+            "or ganache (node server)"
+        )
+    )
+
+
+# the chain backend of the setups
+@pytest.fixture(scope="session")
+def CHAIN_BACKEND(request):
+    return request.config.getoption("chain_backend")
 
 
 # accounts with initial balance
@@ -157,12 +177,14 @@ def ganache_web3(
 @pytest.fixture(scope="session", autouse=True)
 def clean_web3(
     accounts,
-    GANAHE_SERVER_SCRIPT_PATH
+    GANAHE_SERVER_SCRIPT_PATH,
+    CHAIN_BACKEND
 ):
     r"""
     Return a function to start a clean web3 instance for the
     accounts definied. The clean web has only the accounts
-    with the initial balance.
+    with the initial balance. With the tester backend the chain
+    is in-process and there is no server process (None).
     """
     def _clean_web3(port: int) -> tuple[web3.Web3, subprocess.Popen]:
         r"""
@@ -177,6 +199,8 @@ def clean_web3(
             tuple[web3.Web3, subprocess.Popen] :
                 (web3_instance, server_process)
         """
+        if CHAIN_BACKEND == "tester":
+            return (pymeca.testing.tester_web3(accounts), None)
         web3_instance, server_process = ganache_web3(
             accounts,
             GANAHE_SERVER_SCRIPT_PATH,
@@ -199,7 +223,8 @@ def clean_setup(
     """
     w3, server_process = clean_web3(CLEAN_PORT)
     yield w3
-    server_process.terminate()
+    if server_process is not None:
+        server_process.terminate()
 
 
 # contracts directory and default contract file names
@@ -334,7 +359,8 @@ def simple_web3(
                 DEFAULT_CONTRACT_FILE_NAMES["task"]
             ),
             task_contract_name=DEFAULT_CONTRACT_NAMES["task"],
-            task_addition_fee=TASK_ADDITION_FEE
+            task_addition_fee=TASK_ADDITION_FEE,
+            w3=w3
         )
         # init the actors
         meca_user = pymeca.user.MecaUser(
@@ -381,7 +407,8 @@ def simple_setup(
     """
     w3, server_process, addresses, actors = simple_web3(SIMPLE_PORT)
     yield (w3, addresses, actors)
-    server_process.terminate()
+    if server_process is not None:
+        server_process.terminate()
 
 
 # initial values for the actors when they are registered
@@ -524,7 +551,8 @@ def register_setup(
     """
     w3, server_process, addresses, actors = register_web3(REGISTER_PORT)
     yield (w3, addresses, actors)
-    server_process.terminate()
+    if server_process is not None:
+        server_process.terminate()
 
 
 # the initial task for the host
@@ -618,4 +646,5 @@ def fill_setup(
     """
     w3, server_process, addresses, actors = fill_web3(FILL_PORT)
     yield (w3, addresses, actors)
-    server_process.terminate()
+    if server_process is not None:
+        server_process.terminate()
@@ -1,5 +1,12 @@
+import json
 import pytest
+import web3
 import pymeca.pymeca
+import pymeca.utils
+import pymeca.cache
+import pymeca.records
+import pymeca.snapshot
+import pymeca.testing
 
 
 # a simple active actor
@@ -142,3 +149,490 @@ class TestActiveActorGetters:
         assert fee == TASK_ADDITION_FEE
 
     # test the function on the fill environment
+
+
+class TestActiveActorContractsCache:
+    def test_contracts_resolved_once(
+        self,
+        active_actor,
+        simple_setup
+    ):
+        _, addresses, _ = simple_setup
+        host_contract = active_actor.get_host_contract()
+        assert host_contract.address == addresses["host_contract_address"]
+        # the contract is kept between the calls
+        assert active_actor.get_host_contract() is host_contract
+        assert (
+            active_actor.get_scheduler_contract_address() ==
+            addresses["scheduler_contract_address"]
+        )
+
+    def test_refresh_contracts(
+        self,
+        active_actor,
+        simple_setup
+    ):
+        _, addresses, _ = simple_setup
+        tower_contract = active_actor.get_tower_contract()
+        contracts = active_actor.refresh_contracts()
+        assert contracts["tower"] is not tower_contract
+        assert (
+            contracts["tower"].address == addresses["tower_contract_address"]
+        )
+        assert active_actor.get_tower_contract() is contracts["tower"]
+
+    def test_invalidate_contracts_cache(
+        self,
+        active_actor,
+        simple_setup
+    ):
+        w3, addresses, _ = simple_setup
+        task_contract = active_actor.get_task_contract()
+        # another DAO does not change the contracts of the actor
+        pymeca.pymeca.invalidate_contracts_cache(
+            w3=w3,
+            contract_address=addresses["task_contract_address"]
+        )
+        assert active_actor.get_task_contract() is task_contract
+        pymeca.pymeca.invalidate_contracts_cache(
+            w3=w3,
+            contract_address=addresses["dao_contract_address"]
+        )
+        assert active_actor.get_task_contract() is not task_contract
+        assert (
+            active_actor.get_task_contract_address() ==
+            addresses["task_contract_address"]
+        )
+
+    def test_contracts_refresh_blocks(
+        self,
+        accounts,
+        simple_setup
+    ):
+        w3, addresses, _ = simple_setup
+        actor = pymeca.pymeca.MecaActiveActor(
+            w3=w3,
+            private_key=accounts["meca_user"]["private_key"],
+            dao_contract_address=addresses["dao_contract_address"],
+            contracts_refresh_blocks=1
+        )
+        scheduler_contract = actor.get_scheduler_contract()
+        assert actor.get_scheduler_contract() is scheduler_contract
+        # mine a new block
+        w3.provider.make_request("evm_mine", [])
+        assert actor.get_scheduler_contract() is not scheduler_contract
+
+        # the block number of the read cache is used, it is not read
+        # again before the block check interval
+        actor.read_cache = pymeca.cache.ReadCache(block_check_interval=3600)
+        scheduler_contract = actor.get_scheduler_contract()
+        w3.provider.make_request("evm_mine", [])
+        assert actor.get_scheduler_contract() is scheduler_contract
+
+
+class TestContractsGeneration:
+    def test_contracts_generation_scope(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        other_w3 = pymeca.testing.tester_web3(accounts)
+        dao_address = "0x" + "1" * 40
+        scheduler_address = "0x" + "2" * 40
+        generation = pymeca.pymeca.contracts_generation(
+            w3,
+            [dao_address, scheduler_address]
+        )
+        other_generation = pymeca.pymeca.contracts_generation(
+            other_w3,
+            [dao_address, scheduler_address]
+        )
+
+        pymeca.pymeca.invalidate_contracts_cache(
+            w3=w3,
+            contract_address=scheduler_address
+        )
+        assert pymeca.pymeca.contracts_generation(
+            w3,
+            [dao_address, scheduler_address]
+        ) == (generation[0], generation[1] + 1)
+        # the same contracts on another blockchain are not invalidated
+        assert pymeca.pymeca.contracts_generation(
+            other_w3,
+            [dao_address, scheduler_address]
+        ) == other_generation
+
+
+class TestActiveActorBatch:
+    def test_batch(
+        self,
+        fill_setup,
+        initial_host_task,
+        initial_tower
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+        host_address = actors["host"].account.address
+        tower_address = actors["tower"].account.address
+
+        with user.batch() as batch:
+            host_task_fee = batch.add(
+                user.get_host_task_fee,
+                host_address=host_address,
+                ipfs_sha256=initial_host_task["ipfsSha256"]
+            )
+            host_task_block_timeout = batch.add(
+                user.get_host_task_block_timeout,
+                host_address=host_address,
+                ipfs_sha256=initial_host_task["ipfsSha256"]
+            )
+            tower_fee = batch.add(
+                user.get_tower_fee,
+                tower_address=tower_address,
+                size=10,
+                block_timeout_limit=10
+            )
+            tower_hosts = batch.add(
+                user.get_tower_hosts,
+                tower_address=tower_address
+            )
+            towers = batch.add(user.get_towers)
+
+        assert host_task_fee.result() == initial_host_task["fee"]
+        assert (
+            host_task_block_timeout.result() ==
+            initial_host_task["blockTimeout"]
+        )
+        assert tower_fee.result() == initial_tower["fee"]
+        assert tower_hosts.result() == [host_address]
+        assert towers.result() == user.get_towers()
+
+    def test_batch_call(
+        self,
+        fill_setup,
+        SCHEDULER_FEE,
+        HOST_INITIAL_STAKE
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+        results = user.batch_call([
+            (user.get_scheduler_fee, {}),
+            (user.get_host_initial_stake, {}),
+            (
+                user.get_host_first_available_block,
+                {"host_address": actors["host"].account.address}
+            )
+        ])
+        assert results[0] == SCHEDULER_FEE
+        assert results[1] == HOST_INITIAL_STAKE
+        assert results[2] == user.get_host_first_available_block(
+            host_address=actors["host"].account.address
+        )
+
+    def test_batch_not_batchable_getter(
+        self,
+        fill_setup
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+        batch = user.batch()
+        with pytest.raises(pymeca.utils.MecaError):
+            batch.add(
+                user.is_host_registered,
+                address=actors["host"].account.address
+            )
+
+
+class TestActiveActorReadCache:
+    def test_read_cache(
+        self,
+        accounts,
+        simple_setup
+    ):
+        w3, addresses, _ = simple_setup
+        actor = pymeca.pymeca.MecaActiveActor(
+            w3=w3,
+            private_key=accounts["meca_user"]["private_key"],
+            dao_contract_address=addresses["dao_contract_address"],
+            read_cache=pymeca.cache.ReadCache(
+                max_size=2,
+                block_check_interval=60
+            )
+        )
+        assert actor.get_towers() == []
+        assert actor.get_towers() == []
+        stats = actor.read_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        # the least recently used read is evicted
+        actor.get_hosts()
+        actor.get_tasks()
+        stats = actor.read_cache.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+        # a new block evicts all the reads
+        w3.provider.make_request("evm_mine", [])
+        actor.read_cache.observe_block(w3.eth.block_number)
+        assert actor.read_cache.stats()["size"] == 0
+        assert actor.get_towers() == []
+        assert actor.read_cache.stats()["misses"] == 4
+
+
+class TestActiveActorProtocolParameters:
+    def test_protocol_parameters(
+        self,
+        accounts,
+        simple_setup,
+        SCHEDULER_FEE,
+        HOST_INITIAL_STAKE,
+        HOST_REGISTER_FEE
+    ):
+        w3, addresses, _ = simple_setup
+        actor = pymeca.pymeca.MecaActiveActor(
+            w3=w3,
+            private_key=accounts["meca_user"]["private_key"],
+            dao_contract_address=addresses["dao_contract_address"]
+        )
+        actor.protocol_parameters.invalidate()
+        fetches = actor.protocol_parameters.fetches
+        assert actor.get_scheduler_fee() == SCHEDULER_FEE
+        assert actor.get_scheduler_fee() == SCHEDULER_FEE
+        assert actor.protocol_parameters.fetches == fetches + 1
+
+        # the constants of a contract are loaded together
+        assert actor.get_host_initial_stake() == HOST_INITIAL_STAKE
+        assert actor.get_host_register_fee() == HOST_REGISTER_FEE
+        assert actor.protocol_parameters.fetches == fetches + 2
+
+        # the actors of the same DAO share the constants
+        other_actor = pymeca.pymeca.MecaActiveActor(
+            w3=w3,
+            private_key=accounts["meca_host"]["private_key"],
+            dao_contract_address=addresses["dao_contract_address"]
+        )
+        assert other_actor.protocol_parameters is actor.protocol_parameters
+        assert other_actor.get_scheduler_fee() == SCHEDULER_FEE
+        assert actor.protocol_parameters.fetches == fetches + 2
+
+
+class TestActiveActorRegistryIndex:
+    def test_registry_index(
+        self,
+        fill_setup,
+        initial_host,
+        initial_tower
+    ):
+        w3, _, actors = fill_setup
+        user = actors["user"]
+        host_address = actors["host"].account.address
+        tower_address = actors["tower"].account.address
+
+        hosts_index = user.get_hosts_index()
+        assert list(hosts_index) == [host_address]
+        assert hosts_index[host_address]["stake"] == initial_host["stake"]
+        towers_index = user.get_towers_index()
+        assert list(towers_index) == [tower_address]
+        assert towers_index[tower_address]["fee"] == initial_tower["fee"]
+        # the index is reused in the same block
+        assert user.get_hosts_index() is hosts_index
+
+        assert user.is_host_registered(address=host_address.lower())
+        assert not user.is_host_registered(address=user.account.address)
+        assert user.is_tower_registered(address=tower_address)
+        assert not user.is_tower_registered(address=host_address)
+
+        w3.provider.make_request("evm_mine", [])
+        assert user.get_hosts_index() is not hosts_index
+        assert user.get_hosts_index() == hosts_index
+
+
+class TestActiveActorTowerHostGraph:
+    def test_tower_host_graph(
+        self,
+        fill_setup
+    ):
+        w3, _, actors = fill_setup
+        user = actors["user"]
+        host_address = actors["host"].account.address
+        tower_address = actors["tower"].account.address
+
+        graph = user.get_tower_host_graph()
+        assert graph.get_tower_hosts(tower_address) == [host_address]
+        assert graph.get_host_towers(host_address) == user.get_towers()
+        assert graph.get_host_towers(user.account.address) == []
+        # the towers and the hosts of the new towers
+        assert graph.rpc_requests == 2
+
+        assert user.get_host_towers(host_address) == user.get_towers()
+        assert graph.rpc_requests == 2
+        assert actors["host"].get_my_towers() == user.get_towers()
+        assert actors["tower"].get_my_hosts() == [host_address]
+
+        # one batch for the towers and the hosts of the known tower
+        # after a new block, the calls are sent one by one without
+        # a HTTP provider
+        w3.provider.make_request("evm_mine", [])
+        user.get_tower_host_graph()
+        if isinstance(w3.provider, web3.HTTPProvider):
+            assert graph.rpc_requests == 3
+        else:
+            assert graph.rpc_requests == 4
+
+
+class TestActiveActorHostTaskMatrix:
+    def test_host_task_matrix(
+        self,
+        fill_setup,
+        initial_host_task
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+        host_address = actors["host"].account.address
+        ipfs_sha256 = initial_host_task["ipfsSha256"]
+
+        # one batch request per read
+        matrix = user.get_host_task_matrix(batch_size=1)
+        assert matrix.hosts == [host_address]
+        assert matrix.tasks == user.get_tasks()
+        assert matrix.block_timeouts.shape == (1, len(matrix.tasks))
+        assert matrix.get_task_hosts(ipfs_sha256) == [host_address]
+        assert (
+            matrix.get_block_timeout(host_address, ipfs_sha256) ==
+            initial_host_task["blockTimeout"]
+        )
+        assert (
+            matrix.get_fee(host_address, ipfs_sha256) ==
+            initial_host_task["fee"]
+        )
+        assert (
+            matrix.get_host_tasks(host_address) ==
+            user.get_host_tasks(host_address)
+        )
+        assert matrix.get_host_tasks(user.account.address) == []
+
+        matrix = user.get_host_task_matrix(
+            host_addresses=[host_address],
+            fees=False
+        )
+        assert matrix.fees is None
+        with pytest.raises(pymeca.utils.MecaError):
+            matrix.get_fee(host_address, ipfs_sha256)
+
+
+class TestActiveActorRecords:
+    def test_records(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+
+        task = user.get_tasks()[0]
+        assert isinstance(task, pymeca.records.Task)
+        assert task == initial_task
+        assert task["ipfsSha256"] == initial_task["ipfsSha256"]
+        assert isinstance(task.as_dict(), dict)
+        assert dict(task) == task.as_dict()
+        with pytest.raises(KeyError):
+            task["ipfs_sha256_bytes"]
+
+        tower = user.get_towers()[0]
+        assert isinstance(tower, pymeca.records.Tower)
+        assert tower["owner"] == actors["tower"].account.address
+
+    def test_record_dict(self):
+        fee = pymeca.records.RunningTaskFee(
+            tower=1,
+            host=2,
+            scheduler=3,
+            task=4,
+            insurance=5
+        )
+        running_task = pymeca.records.RunningTask(
+            ipfs_sha256_bytes=b"\x01" * 32,
+            input_hash_bytes=b"\x02" * 32,
+            output_hash_bytes=b"\x03" * 32,
+            size=6,
+            tower_address="0x" + "4" * 40,
+            host_address="0x" + "5" * 40,
+            owner="0x" + "6" * 40,
+            start_block=7,
+            block_timeout=8,
+            fee=fee
+        )
+        assert isinstance(running_task, dict)
+        assert running_task.ipfsSha256 == "0x" + "01" * 32
+        # the records are plain dictionaries for json and updates
+        assert json.loads(json.dumps(running_task)) == (
+            running_task.as_dict()
+        )
+        running_task["fee"] = 9
+        assert running_task.fee == 9
+        assert type(running_task.as_dict()) is dict
+
+
+class TestActiveActorRegistrySnapshot:
+    def test_registry_snapshot(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+        tower = user.get_towers()[0]
+
+        snapshot = user.get_registry_snapshot()
+        assert snapshot.hosts == user.get_hosts()
+        assert snapshot.towers == user.get_towers()
+        assert snapshot.tasks == user.get_tasks()
+        assert snapshot.tower_size_limits[0] == tower["sizeLimit"]
+        assert bytes(snapshot.tower_owners[0]) == (
+            pymeca.snapshot.address_bytes(tower["owner"])
+        )
+
+        mask = snapshot.towers_with_size(
+            [0] * len(snapshot.towers),
+            tower["sizeLimit"]
+        )
+        assert snapshot.select_towers(mask) == [tower]
+        mask = snapshot.towers_with_size(
+            [1] * len(snapshot.towers),
+            tower["sizeLimit"]
+        )
+        assert snapshot.select_towers(mask) == []
+        assert snapshot.select_tasks(
+            snapshot.tasks_with_size(initial_task["size"])
+        ) == [initial_task]
+
+    def test_bytes_columns(self):
+        # an address and a hash with trailing NUL bytes
+        owner = web3.Web3.to_checksum_address("0x" + "12" * 19 + "00")
+        ipfs_sha256_bytes = b"\x34" * 31 + b"\x00"
+        snapshot = pymeca.snapshot.RegistrySnapshot(
+            block_number=1,
+            hosts=[pymeca.records.Host(
+                owner=owner,
+                public_key_bytes=(b"\x01" * 32, b"\x02" * 32),
+                block_timeout_limit=2,
+                stake=3
+            )],
+            towers=[],
+            tasks=[pymeca.records.Task(
+                ipfs_sha256_bytes=ipfs_sha256_bytes,
+                owner=owner,
+                fee=4,
+                computing_type=0,
+                size=5
+            )]
+        )
+        assert bytes(snapshot.host_owners[0]) == (
+            pymeca.snapshot.address_bytes(owner)
+        )
+        assert bytes(snapshot.task_owners[0]) == (
+            pymeca.snapshot.address_bytes(owner)
+        )
+        assert bytes(snapshot.task_ipfs_sha256[0]) == ipfs_sha256_bytes
+        assert snapshot.tower_owners.shape == (0,)
@@ -0,0 +1,258 @@
+import asyncio
+import web3
+import pymeca.dao
+import pymeca.pymeca
+import pymeca.host
+import pymeca.tower
+import pymeca.user
+import pymeca.testing
+import pymeca.utils
+
+
+def async_web3(w3: web3.Web3) -> web3.AsyncWeb3:
+    if isinstance(w3.provider, web3.EthereumTesterProvider):
+        return pymeca.testing.tester_async_web3(w3)
+    return web3.AsyncWeb3(
+        web3.AsyncHTTPProvider(w3.provider.endpoint_uri)
+    )
+
+
+class TestAsyncMecaActors:
+    def test_async_getters(
+        self,
+        fill_setup,
+        accounts,
+        initial_task,
+        initial_tower
+    ):
+        w3, addresses, actors = fill_setup
+
+        async def run():
+            user = pymeca.user.AsyncMecaUser(
+                w3=async_web3(w3),
+                private_key=accounts["meca_user"]["private_key"],
+                dao_contract_address=addresses["dao_contract_address"]
+            )
+            hosts, towers, tasks, task_fee = await asyncio.gather(
+                user.get_hosts(),
+                user.get_towers(),
+                user.get_tasks(),
+                user.get_task_task_fee(
+                    ipfs_sha256=initial_task["ipfsSha256"]
+                )
+            )
+            towers_hosts = await user.get_towers_hosts_for_task(
+                ipfs_sha256=initial_task["ipfsSha256"]
+            )
+            return hosts, towers, tasks, task_fee, towers_hosts
+
+        hosts, towers, tasks, task_fee, towers_hosts = asyncio.run(run())
+
+        assert hosts == actors["user"].get_hosts()
+        assert towers == actors["user"].get_towers()
+        assert tasks == actors["user"].get_tasks()
+        assert task_fee == initial_task["fee"]
+        assert towers_hosts == actors["user"].get_towers_hosts_for_task(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        )
+        assert towers_hosts[0]["fee"]["tower"] == initial_tower["fee"]
+
+    def test_async_send_task_on_blockchain(
+        self,
+        fill_setup,
+        accounts,
+        initial_task
+    ):
+        w3, addresses, actors = fill_setup
+
+        async def run():
+            user = pymeca.user.AsyncMecaUser(
+                w3=async_web3(w3),
+                private_key=accounts["meca_user"]["private_key"],
+                dao_contract_address=addresses["dao_contract_address"]
+            )
+            host = pymeca.host.AsyncMecaHost(
+                w3=async_web3(w3),
+                private_key=accounts["meca_host"]["private_key"],
+                dao_contract_address=addresses["dao_contract_address"]
+            )
+            success, task_id = await user.send_task_on_blockchain(
+                ipfs_sha256=initial_task["ipfsSha256"],
+                host_address=host.account.address,
+                tower_address=actors["tower"].account.address,
+                input_hash="0x" + "8" * 64
+            )
+            assert success
+            assert await host.register_task_output(
+                task_id=task_id,
+                output_hash="0x" + "9" * 64
+            )
+            running_task = await user.get_running_task(task_id=task_id)
+            assert await user.finish_task(task_id=task_id)
+            return task_id, running_task
+
+        task_id, running_task = asyncio.run(run())
+
+        assert running_task["ipfsSha256"] == initial_task["ipfsSha256"]
+        assert running_task["outputHash"] == "0x" + "9" * 64
+        assert running_task["owner"] == actors["user"].account.address
+        assert (
+            actors["user"].get_running_task(task_id=task_id)["ipfsSha256"] ==
+            "0x" + "0" * 64
+        )
+
+    def test_async_tower(
+        self,
+        fill_setup,
+        accounts
+    ):
+        w3, addresses, actors = fill_setup
+
+        async def run():
+            tower = pymeca.tower.AsyncMecaTower(
+                w3=async_web3(w3),
+                private_key=accounts["meca_tower"]["private_key"],
+                dao_contract_address=addresses["dao_contract_address"]
+            )
+            return await asyncio.gather(
+                tower.is_registered(),
+                tower.get_my_hosts()
+            )
+
+        registered, hosts = asyncio.run(run())
+
+        assert registered
+        assert hosts == [actors["host"].account.address]
+
+    def test_async_transaction_no_wait(
+        self,
+        fill_setup,
+        accounts
+    ):
+        w3, addresses, actors = fill_setup
+
+        async def run():
+            tower = pymeca.tower.AsyncMecaTower(
+                w3=async_web3(w3),
+                private_key=accounts["meca_tower"]["private_key"],
+                dao_contract_address=addresses["dao_contract_address"]
+            )
+            task = await tower.update_tower_public_connection(
+                new_public_connection="new_connection",
+                wait=False
+            )
+            assert isinstance(task, asyncio.Task)
+            return await task
+
+        assert asyncio.run(run())
+        assert actors["user"].get_tower_public_uri(
+            tower_address=actors["tower"].account.address
+        ) == "new_connection"
+
+    def test_async_dao_owner(
+        self,
+        fill_setup,
+        accounts
+    ):
+        w3, addresses, _ = fill_setup
+
+        async def run():
+            dao_owner = await pymeca.dao.AsyncMecaDAOOwner.create(
+                w3=async_web3(w3),
+                private_key=accounts["meca_dao"]["private_key"],
+                contract_address=addresses["dao_contract_address"]
+            )
+            return await dao_owner.get_scheduler_address()
+
+        assert (
+            asyncio.run(run()) == addresses["scheduler_contract_address"]
+        )
+
+    def test_async_insufficient_balance_resync(
+        self,
+        clean_setup
+    ):
+        # an account without balance
+        private_key = "0x" + "5" * 64
+
+        async def run():
+            actor = pymeca.pymeca.AsyncMecaActor(
+                w3=async_web3(clean_setup),
+                private_key=private_key
+            )
+            nonce = await actor.nonce_manager.async_allocate(actor.w3)
+            try:
+                await actor._execute_transaction({
+                    "to": actor.account.address,
+                    "gas": 21000,
+                    "nonce": nonce
+                })
+            except ValueError:
+                pass
+            else:
+                assert False, "the transaction was sent"
+            # the allocated nonce is not leaked
+            return await actor.nonce_manager.async_allocate(actor.w3)
+
+        assert asyncio.run(run()) == 0
+
+
+class IoStepsActor:
+    def __init__(
+        self,
+        values: dict
+    ) -> None:
+        self.values = values
+
+    def _value(
+        self,
+        name: str
+    ) -> int:
+        if name not in self.values:
+            raise pymeca.utils.MecaError(f"No value {name}")
+        return self.values[name]
+
+    @pymeca.pymeca.io_steps
+    def total(
+        self,
+        names: list[str]
+    ) -> int:
+        total = 0
+        for name in names:
+            try:
+                total += yield self.read(name)
+            except pymeca.utils.MecaError:
+                continue
+        return total
+
+
+class SyncIoStepsActor(IoStepsActor):
+    _run = pymeca.pymeca.MecaActor._run
+
+    def read(
+        self,
+        name: str
+    ) -> int:
+        return self._value(name)
+
+
+class AsyncIoStepsActor(IoStepsActor):
+    _run = pymeca.pymeca.AsyncMecaActor._run
+
+    async def read(
+        self,
+        name: str
+    ) -> int:
+        await asyncio.sleep(0)
+        return self._value(name)
+
+
+class TestIoSteps:
+    def test_io_steps(self):
+        values = {"a": 1, "b": 2}
+        names = ["a", "missing", "b"]
+
+        assert SyncIoStepsActor(values).total(names) == 3
+        steps = AsyncIoStepsActor(values).total(names)
+        assert asyncio.iscoroutine(steps)
+        assert asyncio.run(steps) == 3
@@ -1,5 +1,8 @@
 import pytest
+from eth_account import Account
 import pymeca.dao
+import pymeca.deployment
+import pymeca.utils
 
 
 # test MecaDAOOwner
@@ -229,3 +232,176 @@ class TestDaoSetters:
         assert address == new_scheduler_address
 
     # task tests
+
+
+class TestDeploymentPlanner:
+    def test_contract_address(self):
+        deployer_address = "0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0"
+        assert pymeca.deployment.contract_address(
+            deployer_address, 0
+        ).lower() == "0xcd234a471b72ba2f1ccf0a70fcaba648a5eecd8d"
+        assert pymeca.deployment.contract_address(
+            deployer_address, 1
+        ).lower() == "0x343c43a37d37dff08ae8c4a11544c718abb4fcf8"
+
+    def test_planned_addresses(
+        self,
+        accounts,
+        simple_setup
+    ):
+        w3, addresses, _ = simple_setup
+        deployer_address = Account.from_key(
+            accounts["meca_dao"]["private_key"]
+        ).address
+        # the contracts are the first transactions of the deployer
+        assert list(addresses.values()) == [
+            pymeca.deployment.contract_address(deployer_address, nonce)
+            for nonce in range(5)
+        ]
+        for contract_address in addresses.values():
+            assert len(w3.eth.get_code(contract_address)) > 0
+
+
+@pytest.fixture(scope="class")
+def reuse_environment(
+    accounts,
+    simple_setup,
+    CONTRACTS_DIRECTORY,
+    DEFAULT_CONTRACT_FILE_NAMES,
+    DEFAULT_CONTRACT_NAMES,
+    SCHEDULER_FEE,
+    HOST_REGISTER_FEE,
+    HOST_INITIAL_STAKE,
+    HOST_FAILED_TASK_PENALTY,
+    HOST_TASK_REGISTER_FEE,
+    TOWER_INITIAL_STAKE,
+    TOWER_HOST_REQUEST_FEE,
+    TOWER_FAILED_TASK_PENALTY,
+    TASK_ADDITION_FEE
+):
+    w3, _, _ = simple_setup
+
+    def _reuse_environment(
+        dao_contract_address,
+        task_addition_fee=TASK_ADDITION_FEE
+    ):
+        contract_paths = {
+            name: str(CONTRACTS_DIRECTORY / DEFAULT_CONTRACT_FILE_NAMES[name])
+            for name in DEFAULT_CONTRACT_FILE_NAMES
+        }
+        return pymeca.dao.init_meca_envirnoment(
+            endpoint_uri=None,
+            private_key=accounts["meca_dao"]["private_key"],
+            dao_contract_file_path=contract_paths["dao"],
+            dao_contract_name=DEFAULT_CONTRACT_NAMES["dao"],
+            scheduler_contract_file_path=contract_paths["scheduler"],
+            scheduler_contract_name=DEFAULT_CONTRACT_NAMES["scheduler"],
+            scheduler_fee=SCHEDULER_FEE,
+            host_contract_file_path=contract_paths["host"],
+            host_contract_name=DEFAULT_CONTRACT_NAMES["host"],
+            host_register_fee=HOST_REGISTER_FEE,
+            host_initial_stake=HOST_INITIAL_STAKE,
+            host_failed_task_penalty=HOST_FAILED_TASK_PENALTY,
+            host_task_register_fee=HOST_TASK_REGISTER_FEE,
+            tower_contract_file_path=contract_paths["tower"],
+            tower_contract_name=DEFAULT_CONTRACT_NAMES["tower"],
+            tower_initial_stake=TOWER_INITIAL_STAKE,
+            tower_host_request_fee=TOWER_HOST_REQUEST_FEE,
+            tower_failed_task_penalty=TOWER_FAILED_TASK_PENALTY,
+            task_contract_file_path=contract_paths["task"],
+            task_contract_name=DEFAULT_CONTRACT_NAMES["task"],
+            task_addition_fee=task_addition_fee,
+            dao_contract_address=dao_contract_address,
+            w3=w3
+        )
+    return _reuse_environment
+
+
+class TestReuseDeployment:
+    def test_find_meca_contracts(
+        self,
+        simple_setup
+    ):
+        w3, addresses, _ = simple_setup
+        found = pymeca.deployment.find_meca_contracts(
+            w3=w3,
+            dao_contract_address=addresses["dao_contract_address"]
+        )
+        assert found == {
+            "dao": addresses["dao_contract_address"],
+            "scheduler": addresses["scheduler_contract_address"],
+            "host": addresses["host_contract_address"],
+            "tower": addresses["tower_contract_address"],
+            "task": addresses["task_contract_address"]
+        }
+
+    def test_reuse_current_deployment(
+        self,
+        simple_setup,
+        reuse_environment
+    ):
+        w3, addresses, _ = simple_setup
+        block_number = w3.eth.block_number
+        assert reuse_environment(
+            addresses["dao_contract_address"]
+        ) == addresses
+        # nothing is deployed or rewired
+        assert w3.eth.block_number == block_number
+
+    def test_reuse_rewires(
+        self,
+        simple_setup,
+        host_contract_owner,
+        reuse_environment
+    ):
+        w3, addresses, _ = simple_setup
+        host_contract_owner.set_scheduler(
+            contract_address="0x" + "6" * 40
+        )
+        assert reuse_environment(
+            addresses["dao_contract_address"]
+        ) == addresses
+        assert host_contract_owner.get_scheduler_address() == (
+            addresses["scheduler_contract_address"]
+        )
+
+    def test_reuse_missing_deployment(
+        self,
+        simple_setup,
+        reuse_environment
+    ):
+        w3, addresses, _ = simple_setup
+        # no contract at the address, all the contracts are deployed
+        new_addresses = reuse_environment("0x" + "7" * 40)
+        for name, contract_address in new_addresses.items():
+            assert contract_address != addresses[name]
+            assert len(w3.eth.get_code(contract_address)) > 0
+
+    def test_reuse_changed_parameters(
+        self,
+        simple_setup,
+        reuse_environment,
+        TASK_ADDITION_FEE
+    ):
+        w3, addresses, _ = simple_setup
+        # only the task contract has another constant
+        new_addresses = reuse_environment(
+            addresses["dao_contract_address"],
+            task_addition_fee=TASK_ADDITION_FEE + 1
+        )
+        for name, contract_address in new_addresses.items():
+            if name == "task_contract_address":
+                assert contract_address != addresses[name]
+            else:
+                assert contract_address == addresses[name]
+        task_contract = w3.eth.contract(
+            address=new_addresses["task_contract_address"],
+            abi=pymeca.utils.MECA_TASK_ABI
+        )
+        assert task_contract.functions.TASK_ADDITION_FEE().call() == (
+            TASK_ADDITION_FEE + 1
+        )
+        assert pymeca.deployment.find_meca_contracts(
+            w3=w3,
+            dao_contract_address=addresses["dao_contract_address"]
+        )["task"] == new_addresses["task_contract_address"]
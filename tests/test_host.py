@@ -123,3 +123,59 @@ class TestMecaHostRegister:
         assert actors["host"].delete_task(
             ipfs_sha256=initial_host_task["ipfsSha256"]
         )
+
+    def test_pipelined_transactions(
+        self,
+        register_setup,
+        initial_host_task
+    ):
+        _, _, actors = register_setup
+
+        pending_transaction = actors["host"].add_task(
+            ipfs_sha256=initial_host_task["ipfsSha256"],
+            block_timeout=initial_host_task["blockTimeout"],
+            fee=initial_host_task["fee"],
+            wait=False
+        )
+
+        assert pending_transaction.result()
+
+        # independent transactions in flight at the same time
+        pending_transactions = [
+            actors["host"].update_task_block_timeout(
+                ipfs_sha256=initial_host_task["ipfsSha256"],
+                block_timeout=initial_host_task["blockTimeout"] + 1,
+                wait=False
+            ),
+            actors["host"].update_task_fee(
+                ipfs_sha256=initial_host_task["ipfsSha256"],
+                fee=initial_host_task["fee"] + 1,
+                wait=False
+            )
+        ]
+
+        assert all(
+            pending_transaction.result()
+            for pending_transaction in pending_transactions
+        )
+        assert (
+            pending_transactions[1].nonce_manager.address ==
+            actors["host"].account.address
+        )
+        assert (
+            actors["host"].get_task_block_timeout(
+                ipfs_sha256=initial_host_task["ipfsSha256"]
+            ) == (initial_host_task["blockTimeout"] + 1)
+        )
+        assert (
+            actors["host"].get_task_fee(
+                ipfs_sha256=initial_host_task["ipfsSha256"]
+            ) == (initial_host_task["fee"] + 1)
+        )
+
+        # the nonce is read again after a resync
+        actors["host"].nonce_manager.resync()
+
+        assert actors["host"].delete_task(
+            ipfs_sha256=initial_host_task["ipfsSha256"]
+        )
@@ -1,3 +1,7 @@
+import pymeca.transaction
+import pymeca.fees
+
+
 class TestMecaTowerClean:
     def test_clean_tower_functions(
         self,
@@ -108,3 +112,89 @@ class TestMecaTowerRegister:
 
         assert len(tower_hosts) == 1
         assert tower_hosts[0] == actors["host"].account.address
+
+    def test_transaction_futures(
+        self,
+        register_setup,
+        initial_tower
+    ):
+        w3, _, actors = register_setup
+
+        poller = pymeca.transaction.get_receipt_poller(w3)
+        callback_results = []
+
+        futures = [
+            actors["tower"].update_tower_public_connection(
+                new_public_connection=f"http://localhost:{8080 + index}",
+                wait=False
+            )
+            for index in range(5)
+        ]
+        futures[-1].add_done_callback(
+            lambda future: callback_results.append(future.result())
+        )
+
+        assert all(future.result(timeout=60) for future in futures)
+        assert all(future.done() for future in futures)
+        assert callback_results == [True]
+        assert futures[-1].receipt().status == 1
+        assert actors["tower"].get_tower_public_uri(
+            actors["tower"].account.address
+        ) == "http://localhost:8084"
+        assert poller.outstanding() == 0
+
+        actors["tower"].update_tower_public_connection(
+            new_public_connection=initial_tower["publicConnection"]
+        )
+
+
+class TestMecaTowerFeeModel:
+    def test_tower_fee_model(
+        self,
+        register_setup,
+        initial_tower
+    ):
+        _, _, actors = register_setup
+        tower = actors["tower"]
+        sizes = [0, 1, 10, 1024]
+        block_timeouts = [0, 1, 7, 100]
+
+        for fee_type in [
+            pymeca.fees.FIXED_FEE_TYPE,
+            pymeca.fees.SIZE_BLOCK_FEE_TYPE
+        ]:
+            tower.update_fee(
+                new_fee=initial_tower["fee"] + 3,
+                new_fee_type=fee_type
+            )
+            contract_fees = [
+                tower.get_tower_fee(
+                    tower_address=tower.account.address,
+                    size=size,
+                    block_timeout_limit=block_timeout
+                )
+                for size in sizes
+                for block_timeout in block_timeouts
+            ]
+            local_fees = [
+                pymeca.fees.tower_fee(
+                    fee_type=fee_type,
+                    fee=initial_tower["fee"] + 3,
+                    size=size,
+                    block_timeout_limit=block_timeout
+                )
+                for size in sizes
+                for block_timeout in block_timeouts
+            ]
+            assert local_fees == contract_fees
+            assert pymeca.fees.tower_fees(
+                fee_types=[fee_type] * len(contract_fees),
+                fees=[initial_tower["fee"] + 3] * len(contract_fees),
+                sizes=[size for size in sizes for _ in block_timeouts],
+                block_timeout_limits=block_timeouts * len(sizes)
+            ).tolist() == contract_fees
+
+        tower.update_fee(
+            new_fee=initial_tower["fee"],
+            new_fee_type=initial_tower["feeType"]
+        )
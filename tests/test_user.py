@@ -1,3 +1,14 @@
+import threading
+import pytest
+import web3
+import pymeca.candidates
+import pymeca.events
+import pymeca.fees
+import pymeca.testing
+import pymeca.user
+import pymeca.utils
+
+
 class TestMecaUser:
     def test_send_task_on_blockchain(
         self,
@@ -52,6 +63,195 @@ class TestMecaUser:
 
         print(task_id)
 
+    def test_send_task_with_quote(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        _, _, actors = fill_setup
+        user = actors["user"]
+
+        quote = user.get_towers_hosts_for_task(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        )[0]
+        assert isinstance(quote, pymeca.fees.Quote)
+        assert quote.ipfs_sha256 == initial_task["ipfsSha256"]
+        assert quote.value == user.get_send_task_value(
+            ipfs_sha256=initial_task["ipfsSha256"],
+            host_address=quote["hostAddress"],
+            tower_address=quote["towerAddress"]
+        )
+
+        with pytest.raises(pymeca.utils.MecaError):
+            user.send_task_on_blockchain(
+                host_address=user.account.address,
+                input_hash="0x" + "8" * 64,
+                quote=quote
+            )
+
+        for max_quote_age in [None, 0]:
+            success, task_id = user.send_task_on_blockchain(
+                input_hash="0x" + "8" * 64,
+                quote=quote,
+                max_quote_age=max_quote_age
+            )
+            assert success
+            running_task = user.get_running_task(task_id=task_id)
+            assert running_task["hostAddress"] == quote["hostAddress"]
+            assert running_task["towerAddress"] == quote["towerAddress"]
+            assert running_task["fee"]["tower"] == quote["fee"]["tower"]
+
+            actors["host"].register_task_output(
+                task_id=task_id,
+                output_hash="0x" + "9" * 64
+            )
+            assert user.finish_task(task_id=task_id)
+
+    def test_sent_tasks_events(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        _, _, actors = fill_setup
+        actors["user"].events_chunk_size = 2
+
+        # the earlier tests of the class sent and finished tasks
+        sent_count = len(actors["user"].get_user_sent_tasks())
+        received_count = len(actors["host"].get_received_tasks())
+        finished_count = len(actors["user"].get_finished_tasks())
+
+        for input_hash in ["0x" + "7" * 64, "0x" + "8" * 64]:
+            success, task_id = actors["user"].send_task_on_blockchain(
+                ipfs_sha256=initial_task["ipfsSha256"],
+                host_address=actors["host"].account.address,
+                tower_address=actors["tower"].account.address,
+                input_hash=input_hash
+            )
+            assert success
+
+        new_events = actors["user"].get_user_sent_tasks(new_only=True)
+        assert len(new_events) == 2
+        # only the blocks after the previous read are requested
+        assert actors["user"].get_user_sent_tasks(new_only=True) == []
+        assert actors["user"].get_user_sent_tasks()[sent_count:] == (
+            new_events
+        )
+        # the filters of the host are read separately
+        assert len(actors["host"].get_received_tasks()) == (
+            received_count + 2
+        )
+        assert len(actors["user"].get_finished_tasks()) == finished_count
+
+    def test_iter_tasks(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        w3, _, actors = fill_setup
+        received_tasks = actors["host"].iter_received_tasks(
+            from_block=w3.eth.block_number + 1,
+            poll_interval=0.1
+        )
+        finished_tasks = actors["user"].iter_finished_tasks(
+            poll_interval=0.1
+        )
+
+        success, task_id = actors["user"].send_task_on_blockchain(
+            ipfs_sha256=initial_task["ipfsSha256"],
+            host_address=actors["host"].account.address,
+            tower_address=actors["tower"].account.address,
+            input_hash="0x" + "8" * 64
+        )
+        assert success
+        event = next(received_tasks)
+        assert event["args"]["taskId"] in task_id
+
+        def finish_task():
+            actors["host"].register_task_output(
+                task_id=task_id,
+                output_hash="0x" + "9" * 64
+            )
+            actors["user"].finish_task(task_id=task_id)
+
+        # the generator reads the unfinished tasks before finishing
+        timer = threading.Timer(1, finish_task)
+        timer.start()
+        event = next(finished_tasks)
+        timer.join()
+        assert event["args"]["taskId"] in task_id
+        assert event["args"]["outputHash"] in "0x" + "9" * 64
+
+    def test_event_store(
+        self,
+        fill_setup,
+        initial_task,
+        tmp_path
+    ):
+        _, _, actors = fill_setup
+        path = str(tmp_path / "events.db")
+        # the events read from the blockchain without the store
+        actors["user"].event_store = None
+        read_sent_tasks = actors["user"].get_user_sent_tasks()
+        read_finished_tasks = actors["user"].get_finished_tasks()
+        actors["user"].event_store = pymeca.events.EventStore(path=path)
+
+        success, task_id = actors["user"].send_task_on_blockchain(
+            ipfs_sha256=initial_task["ipfsSha256"],
+            host_address=actors["host"].account.address,
+            tower_address=actors["tower"].account.address,
+            input_hash="0x" + "8" * 64
+        )
+        assert success
+        actors["host"].register_task_output(
+            task_id=task_id,
+            output_hash="0x" + "9" * 64
+        )
+        assert actors["user"].finish_task(task_id=task_id)
+
+        # the earlier tests of the class sent and finished tasks
+        stored_sent_tasks = actors["user"].get_user_sent_tasks()
+        sent_tasks = [
+            event for event in stored_sent_tasks
+            if event["args"]["taskId"] in task_id
+        ]
+        assert len(sent_tasks) == 1
+        assert (
+            sent_tasks[0]["args"]["ipfsSha256"] in initial_task["ipfsSha256"]
+        )
+        assert actors["user"].get_user_sent_tasks(new_only=True) == []
+        stored_finished_tasks = actors["user"].get_finished_tasks()
+        finished_tasks = [
+            event for event in stored_finished_tasks
+            if event["args"]["taskId"] in task_id
+        ]
+        assert len(finished_tasks) == 1
+        # the stored events have the shape of the read events
+        assert stored_sent_tasks[:-1] == read_sent_tasks
+        assert stored_finished_tasks[:-1] == read_finished_tasks
+        scheduler_address = actors["user"].get_scheduler_contract().address
+        # the finished tasks are indexed with the owner of the task
+        assert actors["user"].event_store.query(
+            contract_address=scheduler_address,
+            event_name="TaskFinished",
+            argument_filters={"owner": actors["user"].account.address}
+        ) == stored_finished_tasks
+        actors["user"].event_store.close()
+        actors["user"].event_store = None
+
+        # a new process resumes from the stored cursor
+        event_store = pymeca.events.EventStore(path=path)
+        assert event_store.cursor(
+            contract_address=scheduler_address,
+            event_name="TaskSent"
+        ) is not None
+        actors["host"].event_store = event_store
+        assert [
+            event for event in actors["host"].get_received_tasks()
+            if event["args"]["taskId"] in task_id
+        ] == sent_tasks
+        actors["host"].event_store = None
+        event_store.close()
+
     def test_get_towers_hosts_for_task(
         self,
         fill_setup,
@@ -73,6 +273,87 @@ class TestMecaUser:
             actors["tower"].account.address
         )
 
+    def test_candidate_engine(
+        self,
+        fill_setup,
+        initial_task,
+        initial_tower,
+        initial_host_task,
+        SCHEDULER_FEE
+    ):
+        w3, _, actors = fill_setup
+
+        engine = pymeca.candidates.CandidateEngine(actors["user"])
+        towers_hosts = engine.search(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        )
+
+        assert towers_hosts == actors["user"].get_towers_hosts_for_task(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        )
+        assert len(towers_hosts) == 1
+        assert towers_hosts[0]["fee"]["task"] == initial_task["fee"]
+        assert towers_hosts[0]["fee"]["host"] == initial_host_task["fee"]
+        assert towers_hosts[0]["fee"]["tower"] == initial_tower["fee"]
+        assert towers_hosts[0]["fee"]["schedule"] == SCHEDULER_FEE
+        assert engine.host_towers[actors["host"].account.address] == {
+            actors["tower"].account.address
+        }
+        # 1 host, 1 tower and 1 tower fee
+        stats = engine.stats()
+        assert stats["rpcCalls"] == 1 + 5 + 3 * 1 + 2 * 1 + 1
+        if isinstance(w3.provider, web3.HTTPProvider):
+            # block number, ecosystem, hosts and towers, tower fees
+            assert stats["rpcRequests"] == 4
+        else:
+            # the calls are sent one by one
+            assert stats["rpcRequests"] == stats["rpcCalls"]
+
+        # the hosts of the towers are taken from the tower host graph
+        # of the actor in the same block
+        engine = pymeca.candidates.CandidateEngine(actors["user"])
+        assert engine.search(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        ) == towers_hosts
+        assert engine.stats()["rpcCalls"] == 1 + 5 + 3 * 1 + 1 * 1 + 1
+
+        # the tower fees are computed without any read
+        engine = pymeca.candidates.CandidateEngine(
+            actors["user"],
+            local_tower_fees=True
+        )
+        assert engine.search(
+            ipfs_sha256=initial_task["ipfsSha256"]
+        ) == towers_hosts
+        assert engine.stats()["rpcCalls"] == 1 + 5 + 3 * 1 + 1 * 1
+
+    def test_get_towers_hosts_for_tasks(
+        self,
+        fill_setup,
+        initial_task
+    ):
+        w3, _, actors = fill_setup
+        user = actors["user"]
+        ipfs_sha256s = [task["ipfsSha256"] for task in user.get_tasks()]
+
+        towers_hosts = user.get_towers_hosts_for_tasks(
+            ipfs_sha256s=ipfs_sha256s + [initial_task["ipfsSha256"]]
+        )
+        assert list(towers_hosts) == ipfs_sha256s
+        for ipfs_sha256 in ipfs_sha256s:
+            assert towers_hosts[ipfs_sha256] == (
+                user.get_towers_hosts_for_task(ipfs_sha256=ipfs_sha256)
+            )
+
+        # the shared facts are read once for all the tasks
+        engine = pymeca.candidates.CandidateEngine(user)
+        engine.search_many(ipfs_sha256s=ipfs_sha256s)
+        stats = engine.stats()
+        if isinstance(w3.provider, web3.HTTPProvider):
+            assert stats["rpcRequests"] <= 4
+        else:
+            assert stats["rpcRequests"] == stats["rpcCalls"]
+
 
 class TestMecaUserBadWorkflow:
     def test_expired_task_on_blockchain(
@@ -287,3 +568,92 @@ class TestMecaUserTeeTask:
             towers_hosts[0]["towerAddress"] ==
             actors["tower"].account.address
         )
+
+
+class TestEventStoreShape:
+    def test_stored_event_shape(self):
+        event = {
+            "args": {
+                "taskId": "1" * 64,
+                "fee": (1, 2, 3, 4),
+                "hostAddress": "0x" + "2" * 40
+            },
+            "event": "TaskSent",
+            "logIndex": 0,
+            "transactionIndex": 0,
+            "transactionHash": "0x" + "3" * 64,
+            "address": "0x" + "4" * 40,
+            "blockHash": "0x" + "5" * 64,
+            "blockNumber": 1
+        }
+        event_store = pymeca.events.EventStore()
+        event_store._store(
+            contract_address=event["address"],
+            event_name="TaskSent",
+            to_block=1,
+            events=[event]
+        )
+        # the fee struct is a tuple again after the JSON round trip
+        assert event_store.query(
+            contract_address=event["address"],
+            event_name="TaskSent"
+        ) == [event]
+        event_store.close()
+
+    def test_list_filters(
+        self,
+        accounts
+    ):
+        host_addresses = ["0x" + "2" * 40, "0x" + "6" * 40]
+        events = [
+            {
+                "args": {
+                    "taskId": str(i) * 64,
+                    "hostAddress": host_address
+                },
+                "event": "TaskSent",
+                "logIndex": i,
+                "transactionIndex": 0,
+                "transactionHash": "0x" + "3" * 64,
+                "address": "0x" + "4" * 40,
+                "blockHash": "0x" + "5" * 64,
+                "blockNumber": 1
+            }
+            for i, host_address in enumerate(
+                host_addresses + ["0x" + "7" * 40]
+            )
+        ]
+        event_store = pymeca.events.EventStore()
+        event_store._store(
+            contract_address=events[0]["address"],
+            event_name="TaskSent",
+            to_block=1,
+            events=events
+        )
+        # a list of values matches any of them
+        assert event_store.query(
+            contract_address=events[0]["address"],
+            event_name="TaskSent",
+            argument_filters={"hostAddress": host_addresses}
+        ) == events[:2]
+        event_store.close()
+
+        user = pymeca.user.MecaUser(
+            w3=pymeca.testing.tester_web3(accounts),
+            private_key=accounts["meca_user"]["private_key"],
+            dao_contract_address="0x" + "8" * 40
+        )
+        reader = user._event_reader(
+            event_name="TaskSent",
+            argument_filters={"hostAddress": host_addresses}
+        )
+        assert user._event_reader(
+            event_name="TaskSent",
+            argument_filters={"hostAddress": list(host_addresses)}
+        ) is reader
+        assert reader._get_logs_kwargs(1, 2)["argument_filters"] == {
+            "hostAddress": [
+                web3.Web3.to_checksum_address(host_address)
+                for host_address in host_addresses
+            ]
+        }
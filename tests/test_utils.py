@@ -1,5 +1,46 @@
+import json
+import subprocess
+import sys
+import pytest
 import web3
 from eth_account import Account
+import pymeca.compiler
+import pymeca.deployment
+import pymeca.testing
+import pymeca.transaction
+import pymeca.utils
+
+
+def _import_stats(
+    module: str
+) -> dict:
+    r"""
+    Import a module in a new interpreter.
+
+    Args:
+        module : The module name
+
+    Returns:
+        dict : The loaded lazy modules and if the ABIs are loaded
+    """
+    code = (
+        "import json, sys\n"
+        f"import {module}\n"
+        "import pymeca\n"
+        "print(json.dumps({\n"
+        "    'modules': [name for name in ('solcx', 'multiformats_cid', "
+        "'web3') if name in sys.modules],\n"
+        "    'abis': 'MECA_DAO_ABI' in vars(sys.modules.get("
+        "'pymeca.utils', pymeca))\n"
+        "}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(output)
 
 
 class TestGanache:
@@ -41,3 +82,296 @@ class TestGanache:
         assert balance_task == wei_initial_deposit
         assert balance_tower == wei_initial_deposit
         assert clean_setup.eth.get_block("latest")["number"] == 0
+
+
+class TestImportTime:
+    def test_import_pymeca(self):
+        stats = _import_stats("pymeca")
+        assert stats["modules"] == []
+
+    def test_lazy_imports(self):
+        stats = _import_stats("pymeca.user")
+        assert stats["modules"] == ["web3"]
+        assert not stats["abis"]
+
+
+class TestCompileCache:
+    def test_compile_key(
+        self,
+        tmp_path
+    ):
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "A.sol").write_text(
+            'import "./lib/B.sol";\ncontract A {}\n'
+        )
+        (tmp_path / "lib" / "B.sol").write_text(
+            'import {C} from "lib/C.sol";\ncontract B {}\n'
+        )
+        (tmp_path / "lib" / "C.sol").write_text("contract C {}\n")
+
+        assert [
+            file_path.name
+            for file_path in pymeca.compiler.source_tree(tmp_path / "A.sol")
+        ] == ["A.sol", "B.sol", "C.sol"]
+
+        def key(**kwargs):
+            options = dict(
+                contract_file_path=tmp_path / "A.sol",
+                solc_version="0.8.20",
+                evm_version="shanghai",
+                output_values=["abi", "bin"]
+            )
+            options.update(kwargs)
+            return pymeca.compiler.compile_key(**options)
+
+        first_key = key()
+        assert key(output_values=["bin", "abi"]) == first_key
+        assert key(solc_version="0.8.21") != first_key
+        assert key(evm_version="paris") != first_key
+        (tmp_path / "lib" / "C.sol").write_text("contract C { }\n")
+        assert key() != first_key
+
+    def test_compile_cache(
+        self,
+        tmp_path
+    ):
+        cache = pymeca.compiler.CompileCache(tmp_path / "cache")
+        output = {"<stdin>:A": {"abi": [], "bin": "00"}}
+
+        assert cache.get("key") is None
+        cache.put("key", output)
+        assert cache.get("key") == output
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_compile_contracts(
+        self,
+        tmp_path,
+        CONTRACTS_DIRECTORY,
+        DEFAULT_CONTRACT_FILE_NAMES,
+        DEFAULT_CONTRACT_NAMES
+    ):
+        contracts = [
+            (
+                str(CONTRACTS_DIRECTORY / DEFAULT_CONTRACT_FILE_NAMES[name]),
+                DEFAULT_CONTRACT_NAMES[name]
+            )
+            for name in ["dao", "scheduler", "host", "tower", "task"]
+        ]
+        compile_infos = pymeca.utils.get_contracts_compile_info(
+            contracts=contracts,
+            cache_directory=tmp_path
+        )
+        assert len(compile_infos) == len(contracts)
+        for (contract_file_path, contract_name), (abi, bytecode) in zip(
+            contracts, compile_infos
+        ):
+            assert abi == pymeca.utils.get_contract_compile_info(
+                contract_file_path=contract_file_path,
+                contract_name=contract_name,
+                output_values=["abi"],
+                use_cache=False
+            )[0]
+            assert len(bytecode) > 0
+
+        # the second compilation is read from the cache
+        assert pymeca.utils.get_contracts_compile_info(
+            contracts=contracts,
+            cache_directory=tmp_path
+        ) == compile_infos
+
+
+class TestTesterChain:
+    def test_tester_accounts(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        for account in accounts.values():
+            assert w3.eth.get_balance(
+                Account.from_key(account["private_key"]).address
+            ) == int(account["balance"], 16)
+        assert w3.eth.get_block("latest")["number"] == 0
+
+    def test_tester_server(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        server = pymeca.testing.TesterServer(w3=w3, port=0)
+        server.start()
+        try:
+            http_w3 = web3.Web3(web3.HTTPProvider(
+                "http://127.0.0.1:" +
+                str(server.http_server.server_address[1])
+            ))
+            address = Account.from_key(
+                accounts["meca_dao"]["private_key"]
+            ).address
+            assert http_w3.eth.get_balance(address) == (
+                w3.eth.get_balance(address)
+            )
+            assert http_w3.eth.chain_id == w3.eth.chain_id
+        finally:
+            server.terminate()
+
+    def test_restarted_chain_nonces(
+        self,
+        accounts
+    ):
+        private_key = accounts["meca_dao"]["private_key"]
+        deployer_address = Account.from_key(private_key).address
+        # init code of a contract whose code is one STOP
+        compile_info = ([], "0x6001600c60003960016000f300")
+        port = 0
+        for _ in range(2):
+            # a new chain behind the same uri
+            server = pymeca.testing.TesterServer(
+                w3=pymeca.testing.tester_web3(accounts),
+                port=port
+            )
+            port = server.http_server.server_address[1]
+            server.start()
+            try:
+                w3 = web3.Web3(web3.HTTPProvider(
+                    "http://127.0.0.1:" + str(port)
+                ))
+                planner = pymeca.deployment.DeploymentPlanner(
+                    w3=w3,
+                    private_key=private_key
+                )
+                assert planner.add("contract", compile_info) == (
+                    pymeca.deployment.contract_address(deployer_address, 0)
+                )
+                planner.deploy()
+            finally:
+                server.terminate()
+
+    def test_shared_nonces(
+        self,
+        accounts
+    ):
+        private_key = accounts["meca_dao"]["private_key"]
+        deployer_address = Account.from_key(private_key).address
+        # init code of a contract whose code is one STOP
+        compile_info = ([], "0x6001600c60003960016000f300")
+        server = pymeca.testing.TesterServer(
+            w3=pymeca.testing.tester_web3(accounts),
+            port=0
+        )
+        server.start()
+        try:
+            uri = (
+                "http://127.0.0.1:" +
+                str(server.http_server.server_address[1])
+            )
+            # two web3 instances of the same blockchain
+            planners = [
+                pymeca.deployment.DeploymentPlanner(
+                    w3=web3.Web3(web3.HTTPProvider(uri)),
+                    private_key=private_key
+                )
+                for _ in range(2)
+            ]
+            assert planners[0].nonce_manager is planners[1].nonce_manager
+            addresses = [
+                planner.add("contract", compile_info)
+                for planner in planners
+            ]
+            assert addresses == [
+                pymeca.deployment.contract_address(deployer_address, nonce)
+                for nonce in range(2)
+            ]
+            for planner in planners:
+                planner.deploy()
+        finally:
+            server.terminate()
+
+    def test_batch_request_count(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        requests = [("eth_blockNumber", []), ("eth_chainId", [])]
+        # the requests are sent one by one without a HTTP provider
+        responses, rpc_requests = pymeca.utils.make_batch_request(
+            w3=w3,
+            requests=requests
+        )
+        assert [response["result"] for response in responses] == [
+            w3.eth.block_number,
+            w3.eth.chain_id
+        ]
+        assert rpc_requests == 2
+
+        server = pymeca.testing.TesterServer(w3=w3, port=0)
+        server.start()
+        try:
+            http_w3 = web3.Web3(web3.HTTPProvider(
+                "http://127.0.0.1:" +
+                str(server.http_server.server_address[1])
+            ))
+            responses, rpc_requests = pymeca.utils.make_batch_request(
+                w3=http_w3,
+                requests=requests
+            )
+            assert all("result" in response for response in responses)
+            assert rpc_requests == 1
+        finally:
+            server.terminate()
+        assert pymeca.utils.make_batch_request(w3=w3, requests=[]) == ([], 0)
+
+    def test_reverted_transaction(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        private_key = accounts["meca_dao"]["private_key"]
+        address = Account.from_key(private_key).address
+        # init code of a contract whose code is one REVERT
+        compile_info = ([], "0x6005600c60003960056000f360006000fd")
+        planner = pymeca.deployment.DeploymentPlanner(
+            w3=w3,
+            private_key=private_key
+        )
+        contract_address = planner.add("contract", compile_info)
+        planner.deploy()
+
+        signed_transaction = w3.eth.account.sign_transaction({
+            "from": address,
+            "to": contract_address,
+            "gas": 100000,
+            "gasPrice": w3.eth.gas_price,
+            "nonce": w3.eth.get_transaction_count(address),
+            "chainId": w3.eth.chain_id
+        }, private_key)
+        future = pymeca.transaction.TransactionFuture(
+            w3=w3,
+            tx_hash=w3.eth.send_raw_transaction(
+                signed_transaction.rawTransaction
+            )
+        )
+        pymeca.transaction.get_receipt_poller(w3).watch(future)
+        # a reverted transaction is resolved with False
+        assert future.result() is False
+        assert future.receipt().status == 0
+        assert future.tx_receipt.status == 0
+
+    def test_expired_transaction(
+        self,
+        accounts
+    ):
+        w3 = pymeca.testing.tester_web3(accounts)
+        for watch in [True, False]:
+            # a transaction which is never mined
+            future = pymeca.transaction.TransactionFuture(
+                w3=w3,
+                tx_hash=b"\x01" * 32,
+                timeout=0.2
+            )
+            if watch:
+                pymeca.transaction.get_receipt_poller(w3).watch(future)
+            # the waiting stops at the deadline also without the poller
+            with pytest.raises(web3.exceptions.TimeExhausted):
+                future.result()
+            with pytest.raises(web3.exceptions.TimeExhausted):
+                future.receipt()